@@ -4,27 +4,357 @@ import pandas as pd
 import os
 import numpy as np
 from datetime import datetime
+import atexit
 import json
+import pickle
+import re
+import tempfile
 import warnings
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba เป็นตัวเลือกเสริม ใช้ numpy แทนได้
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # ไม่มี pyarrow ใช้ .str ของ pandas แทน
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # ไม่มี orjson ใช้ json มาตรฐานแทน
+    orjson = None
+
+try:
+    import lz4.frame as _lz4_frame
+except ImportError:  # ไม่มี lz4 ใช้ zlib ระดับเร็วสุดแทน
+    _lz4_frame = None
+
+# อักขระพิเศษสำหรับ RE2 ของ Arrow: \s ของ RE2 ไม่รวม \x0b และ \x1c-\x1f
+# จึงระบุเพิ่มเองให้ตรงกับ [^\w\s] ของ Python (ใช้กับข้อความ ASCII เท่านั้น)
+_SPECIAL_CHARS_RE2 = r'[^\p{L}\p{N}_\s\p{Z}\x{0b}\x{1c}-\x{1f}\x{85}]'
+# รูปแบบเดียวกันสำหรับ re ของ Python (คอมไพล์ครั้งเดียว)
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+
+
+def requires_data(message="กรุณาโหลดไฟล์ข้อมูลก่อน"):
+    """ตรวจว่ามีข้อมูลก่อนเรียกเมธอด ถ้าไม่มีจะแสดงคำเตือนแล้วคืนค่า None"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.data is None:
+                messagebox.showwarning("คำเตือน", message)
+                return None
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _is_number_dtype(dtype):
+    """ตรวจว่าเป็นชนิดตัวเลข (ทุกขนาด) ที่ไม่ใช่ bool"""
+    return (pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype))
+
+
+def _fingerprint(values):
+    """hash รวมของค่าทั้งคอลัมน์ ใช้ตรวจว่าข้อมูลเปลี่ยนไปหรือไม่"""
+    return int(pd.util.hash_array(np.asarray(values, dtype=object)).sum())
+
+
+def _detection_block(frame):
+    """คืนบล็อกตัวเลข float32 เรียงตามคอลัมน์สำหรับตรวจจับค่าผิดปกติ
+
+    ถ้ามีค่าที่เกินช่วงของ float32 จะใช้ float64 แทนทั้งบล็อก
+    """
+    with np.errstate(over='ignore'):
+        block = np.asfortranarray(frame.to_numpy(dtype=np.float32))
+    inf_cols = np.flatnonzero(np.isinf(block).any(axis=0))
+    if len(inf_cols):
+        original = frame.iloc[:, inf_cols].to_numpy(dtype=np.float64)
+        if not np.array_equal(np.isinf(original), np.isinf(block[:, inf_cols])):
+            return np.asfortranarray(frame.to_numpy(dtype=np.float64))
+    return block
+
+
+def _pack_frame(df):
+    """แปลง DataFrame เป็น bytes แบบบีบอัดสำหรับเก็บใน undo/redo"""
+    blob = pickle.dumps(df, protocol=5)
+    if _lz4_frame is not None:
+        return _lz4_frame.compress(blob)
+    return zlib.compress(blob, 1)
+
+
+def _unpack_frame(blob):
+    """แปลง bytes จาก _pack_frame กลับเป็น DataFrame"""
+    if _lz4_frame is not None:
+        return pickle.loads(_lz4_frame.decompress(blob))
+    return pickle.loads(zlib.decompress(blob))
+
+
+# ไฟล์ Parquet ชั่วคราวของ undo/redo ที่ยังไม่ถูกลบ
+_SPILLED_FILES = set()
+
+
+def _remove_spilled_files():
+    """ลบไฟล์ snapshot ชั่วคราวที่ค้างอยู่ตอนปิดโปรแกรม"""
+    for path in list(_SPILLED_FILES):
+        _discard_snapshot(path)
+
+
+atexit.register(_remove_spilled_files)
+
+
+def _can_spill(df):
+    """ตรวจว่า DataFrame เขียนเป็น Parquet แล้วอ่านกลับได้ชนิดข้อมูลเดิม"""
+    if pa is None or not all(isinstance(col, str) for col in df.columns):
+        return False
+    # คอลัมน์ object ต้องเป็นข้อความล้วน ไม่เช่นนั้นชนิดข้อมูลจะเปลี่ยนเมื่ออ่านกลับ
+    return all(pd.api.types.infer_dtype(df[col], skipna=True) in ('string', 'empty')
+               for col in df.columns[df.dtypes == object])
+
+
+def _spill_frame(df):
+    """ย้าย snapshot ออกจากหน่วยความจำ
+
+    เขียนเป็นไฟล์ Parquet ชั่วคราว (zstd) แล้วคืน path ถ้าเขียนไม่ได้
+    จะคืนเป็น bytes ที่บีบอัดจาก _pack_frame แทน
+    """
+    if _can_spill(df):
+        fd, path = tempfile.mkstemp(prefix='undo_', suffix='.parquet')
+        os.close(fd)
+        try:
+            df.to_parquet(path, engine='pyarrow', compression='zstd')
+        except Exception:
+            os.remove(path)
+        else:
+            _SPILLED_FILES.add(path)
+            return path
+    return _pack_frame(df)
+
+
+def _restore_frame(snapshot):
+    """แปลง snapshot (DataFrame, path ของ Parquet หรือ bytes) กลับเป็น DataFrame"""
+    if isinstance(snapshot, pd.DataFrame):
+        return snapshot
+    if isinstance(snapshot, str):
+        df = pd.read_parquet(snapshot, engine='pyarrow')
+        _discard_snapshot(snapshot)
+        # Parquet คืนค่าว่างของคอลัมน์ข้อความเป็น None ใส่ NaN กลับให้เหมือนเดิม
+        # (astype(str) ภายหลังจะได้ 'nan' ไม่ใช่ 'None')
+        for col in df.columns[df.dtypes == object]:
+            values = df[col].to_numpy()
+            nulls = pd.isna(values)
+            if nulls.any():
+                values[nulls] = np.nan
+                df[col] = values
+        return df
+    return _unpack_frame(snapshot)
+
+
+def _discard_snapshot(snapshot):
+    """ลบไฟล์ของ snapshot ที่ถูก spill (ถ้ามี)"""
+    if isinstance(snapshot, str):
+        _SPILLED_FILES.discard(snapshot)
+        try:
+            os.remove(snapshot)
+        except OSError:
+            pass
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _outlier_mask(arr, threshold):
+        """คืน mask ของแถวที่ไม่มีค่า z-score เกินเกณฑ์ในคอลัมน์ใดเลย"""
+        n_rows, n_cols = arr.shape
+        flags = np.zeros((n_rows, n_cols), np.bool_)
+        for j in prange(n_cols):
+            # Welford: หาค่าเฉลี่ยและความแปรปรวนในรอบเดียว (ข้าม NaN)
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for i in range(n_rows):
+                x = arr[i, j]
+                if not np.isnan(x):
+                    count += 1
+                    delta = x - mean
+                    mean += delta / count
+                    m2 += delta * (x - mean)
+            if count < 2:
+                continue
+            std = np.sqrt(m2 / (count - 1))
+            if std == 0.0:
+                continue
+            for i in range(n_rows):
+                if abs(arr[i, j] - mean) / std > threshold:
+                    flags[i, j] = True
+
+        keep = np.ones(n_rows, np.bool_)
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                if flags[i, j]:
+                    keep[i] = False
+                    break
+        return keep
+
+    @njit(cache=True)
+    def _zscore(x):
+        """คืน |z-score| ของแต่ละค่า โดยหาค่าเฉลี่ย/ส่วนเบี่ยงเบนแบบ Welford รอบเดียว
+
+        ข้าม NaN แบบเดียวกับ pandas และคืน NaN ทั้งหมดเมื่อคำนวณ std ไม่ได้หรือเป็นศูนย์
+        """
+        n = x.size
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            v = x[i]
+            if not np.isnan(v):
+                count += 1
+                delta = v - mean
+                mean += delta / count
+                m2 += delta * (v - mean)
+        out = np.empty(n)
+        if count < 2 or m2 == 0.0:
+            out[:] = np.nan
+            return out
+        std = np.sqrt(m2 / (count - 1))
+        for i in range(n):
+            out[i] = abs((x[i] - mean) / std)
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _cap_inplace(arr, lower, upper):
+        """ตัดค่าแต่ละคอลัมน์ให้อยู่ในช่วง [lower, upper] โดยแก้อาร์เรย์เดิม"""
+        n_rows, n_cols = arr.shape
+        for j in prange(n_cols):
+            for i in range(n_rows):
+                x = arr[i, j]
+                if x < lower[j]:
+                    arr[i, j] = lower[j]
+                elif x > upper[j]:
+                    arr[i, j] = upper[j]
+else:
+    _outlier_mask = None
+    _cap_inplace = None
+
+    def _zscore(x):
+        """คืน |z-score| ของแต่ละค่า (ข้าม NaN) หรือ NaN ทั้งหมดเมื่อ std เป็นศูนย์"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.nanstd(x, ddof=1)
+            if not std > 0:
+                return np.full(x.size, np.nan)
+            return np.abs((x - np.nanmean(x)) / std)
+
+
+# ข้อความในเมนูช่วยเหลือ (สร้างครั้งเดียวตอนโหลดโมดูล)
+_HELP_TEXT = """📖 คู่มือการใช้งานระบบทำความสะอาดข้อมูล
+
+🚀 การเริ่มต้น:
+1. คลิก "📂 เปิดไฟล์" เพื่อเลือกไฟล์ข้อมูล (CSV หรือ Excel)
+2. หรือใช้เมนู "ไฟล์ > นำเข้าตัวอย่าง" เพื่อทดลองกับข้อมูลตัวอย่าง
+
+🧹 การทำความสะอาดข้อมูล:
+• "🧹 ทำความสะอาดทั้งหมด" - ทำความสะอาดแบบครบวงจร
+• "🗑️ ลบข้อมูลซ้ำ" - ลบแถวที่ซ้ำกัน
+• "🔧 เติมค่าว่าง" - เติมค่าที่หายไป
+• "🧼 ลบแถวว่าง" - ลบแถวที่ว่างเปล่า
+
+⚙️ การตั้งค่า:
+• ใช้เมนู "ตั้งค่า" เพื่อปรับแต่งวิธีการทำความสะอาด
+• เลือกโหมดการทำงานที่เหมาะกับระดับของคุณ
+
+📊 การตรวจสอบ:
+• "📊 สถิติข้อมูล" - ดูข้อมูลสถิติโดยละเอียด
+• "🎯 ตรวจสอบคุณภาพ" - ประเมินคุณภาพข้อมูล
+• "📋 เปรียบเทียบ" - เปรียบเทียบก่อนและหลังการทำความสะอาด
+
+💾 การบันทึก:
+• "💾 บันทึก" - บันทึกข้อมูลที่ทำความสะอาดแล้ว
+• "📄 ส่งออกรายงาน" - สร้างรายงานผลการทำความสะอาด
+
+🎮 โหมดการทำงาน:
+• ผู้เริ่มต้น: เหมาะสำหรับผู้ใช้ใหม่
+• มาตรฐาน: โหมดปกติสำหรับผู้ใช้ทั่วไป  
+• ผู้เชี่ยวชาญ: ตัวเลือกครบถ้วนสำหรับผู้เชี่ยวชาญ
+
+❓ ต้องการความช่วยเหลือเพิ่มเติม?
+• กดปุ่ม "💡 เคล็ดลับ" เพื่อดูเคล็ดลับการใช้งาน
+• กดปุ่ม "🔍 ตัวอย่างการใช้งาน" เพื่อดูตัวอย่าง
+"""
+
+_TIPS_TEXT = "💡 เคล็ดลับการใช้งาน:\n\n" + "\n\n".join([
+    "💡 สำรองข้อมูลต้นฉบับก่อนทำความสะอาดเสมอ",
+    "🔍 ตรวจสอบข้อมูลก่อนและหลังการทำความสะอาด",
+    "⚙️ ปรับการตั้งค่าให้เหมาะสมกับข้อมูลของคุณ",
+    "📊 ใช้ฟังก์ชันสถิติเพื่อทำความเข้าใจข้อมูล",
+    "🎯 ตรวจสอบค่าผิดปกติก่อนลบออก",
+    "📄 สร้างรายงานเพื่อเก็บบันทึกการทำงาน"
+])
+
+_EXAMPLES_TEXT = """🔍 ตัวอย่างการใช้งาน:
+
+📝 สถานการณ์ที่ 1: ข้อมูลพนักงาน
+• มีข้อมูลซ้ำ → ใช้ "ลบข้อมูลซ้ำ"
+• มีช่องเงินเดือนว่าง → ใช้ "เติมค่าว่าง" (ค่าเฉลี่ย)
+• มีอายุผิดปกติ (999) → ตรวจจับด้วย "ค่าผิดปกติ"
+
+📊 สถานการณ์ที่ 2: ข้อมูลยอดขาย
+• ตรวจสอบข้อมูลก่อน → "สถิติข้อมูล"
+• ทำความสะอาดทั้งหมด → "ทำความสะอาดทั้งหมด"
+• ตรวจสอบผลลัพธ์ → "เปรียบเทียบ"
+
+🎯 สถานการณ์ที่ 3: ข้อมูลลูกค้า
+• ลบแถวว่าง → "ลบแถวว่าง"
+• มาตรฐานรูปแบบ → "มาตรฐานข้อมูล"
+• ส่งออกรายงาน → "ส่งออกรายงาน"
+"""
+
+_ABOUT_TEXT = """🧹 ระบบทำความสะอาดข้อมูลแบบครบครัน 🇹🇭
+
+เวอร์ชัน: 2.0
+พัฒนาโดย: ไตรทศ ทองเกิด 097-191-2502
+
+คุณสมบัติ:
+✅ รองรับไฟล์ CSV และ Excel
+✅ การทำความสะอาดข้อมูลแบบอัตโนมัติ
+✅ ตรวจจับและจัดการค่าผิดปกติ
+✅ รายงานผลการทำความสะอาดแบบละเอียด
+✅ ระบบตั้งค่าที่ยืดหยุ่น
+✅ รองรับภาษาไทยเต็มรูปแบบ
+
+© 2025 All Rights Reserved
+"""
+
 
 class DataCleaningApp:
     def __init__(self, root):
         self.root = root
         self.root.title("🧹 ระบบทำความสะอาดข้อมูลแบบครบครัน 🇹🇭")
         self.root.geometry("1400x900")
+        # แคชรายชื่อคอลัมน์ตามประเภทข้อมูล หมดอายุเมื่อ _dtype_version เปลี่ยน
+        self._dtype_version = 0
+        self._columns_cache = {}
         self.data = None
         self.original_data = None
         self.cleaned_data = None
         self.cleaning_history = []
-        self.undo_stack = []
-        self.redo_stack = []
+        self.undo_stack = deque(maxlen=10)
+        self.redo_stack = deque(maxlen=10)
 
         # ตัวแปร UI
         self.info_var = tk.StringVar()
         self.status_var = tk.StringVar()
         self.tree = None
+        self._help_window = None
+        # ลายนิ้วมือของคอลัมน์ที่ปรับมาตรฐานแล้ว: {คอลัมน์: (hash, ตัวเลือก)}
+        self._std_cache = {}
 
         # การตั้งค่าเริ่มต้น
         self.settings = {
@@ -47,7 +377,9 @@ class DataCleaningApp:
             'clean_phone': True,
             'validate_dates': True,
             'custom_fill_values': {},
-            'column_specific_settings': {}
+            'column_specific_settings': {},
+            'shrink_dtypes': True,  # ลดขนาดชนิดตัวเลขหลังโหลดไฟล์
+            'precision_sensitive_columns': []  # คอลัมน์ที่ห้ามลดขนาด
         }
 
         # โหลดการตั้งค่าที่บันทึกไว้
@@ -211,6 +543,7 @@ class DataCleaningApp:
                     self.data = pd.read_excel(file_path)
 
                 if self.data is not None:
+                    self.data = self._shrink_dtypes(self.data)
                     self.original_data = self.data.copy()
                     self.cleaning_history = []
                     self.update_display()
@@ -225,6 +558,31 @@ class DataCleaningApp:
                 messagebox.showerror(
                     "ข้อผิดพลาด", f"ไม่สามารถเปิดไฟล์ได้:\n{str(e)}")
 
+    def _shrink_dtypes(self, df):
+        """ลดขนาดชนิดข้อมูลตัวเลขให้เล็กที่สุดที่ยังเก็บค่าได้ครบ
+
+        จำนวนเต็มลดเป็น int8/16/32 ตามช่วงค่า ทศนิยมลดเป็น float32 เฉพาะเมื่อ
+        ไม่เสียความแม่นยำ คอลัมน์ใน precision_sensitive_columns จะไม่ถูกแตะ
+        """
+        if not self.settings.get('shrink_dtypes', True):
+            return df
+
+        skip = set(self.settings.get('precision_sensitive_columns', []))
+        for col in df.columns:
+            if col in skip:
+                continue
+            dtype = df[col].dtype
+            if pd.api.types.is_bool_dtype(dtype):
+                continue
+            if pd.api.types.is_integer_dtype(dtype):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            elif pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+                values = df[col].to_numpy()
+                shrunk = values.astype(np.float32)
+                if np.array_equal(shrunk.astype(dtype), values, equal_nan=True):
+                    df[col] = shrunk
+        return df
+
     def update_info_panel(self):
         if self.data is not None:
             rows, cols = self.data.shape
@@ -306,7 +664,7 @@ class DataCleaningApp:
             missing_before = self.data.isnull().sum().sum()
 
             for col in self.data.columns:
-                if self.data[col].dtype in ['int64', 'float64']:
+                if _is_number_dtype(self.data[col].dtype):
                     # ใช้ค่าเฉลี่ยสำหรับตัวเลข
                     mean_val = self.data[col].mean()
                     if pd.notna(mean_val):
@@ -385,6 +743,8 @@ class DataCleaningApp:
                     except (ValueError, TypeError):
                         pass
 
+        self._mark_data_changed()
+
     def remove_duplicates(self):
         """ลบข้อมูลซ้ำ"""
         if self.data is None:
@@ -442,7 +802,7 @@ class DataCleaningApp:
 
             for col in self.data.columns:
                 if self.data[col].isnull().any():
-                    if self.data[col].dtype in ['int64', 'float64']:
+                    if _is_number_dtype(self.data[col].dtype):
                         if method == 'mean':
                             self.data[col].fillna(
                                 self.data[col].mean(), inplace=True)
@@ -606,7 +966,7 @@ class DataCleaningApp:
                     'เปอร์เซ็นต์ว่าง': round(self.data[col].isnull().sum() / len(self.data) * 100, 2)
                 }
 
-                if self.data[col].dtype in ['int64', 'float64']:
+                if _is_number_dtype(self.data[col].dtype):
                     stats.update({
                         'ค่าเฉลี่ย': round(self.data[col].mean(), 2) if pd.notna(self.data[col].mean()) else None,
                         'ค่าสูงสุด': self.data[col].max(),
@@ -831,7 +1191,7 @@ class DataCleaningApp:
                 stats_info += f"   ├─ ค่าว่าง: {self.data[col].isnull().sum():,}\n"
                 stats_info += f"   └─ เปอร์เซ็นต์ว่าง: {(self.data[col].isnull().sum() / len(self.data) * 100):.1f}%\n"
 
-                if self.data[col].dtype in ['int64', 'float64']:
+                if _is_number_dtype(self.data[col].dtype):
                     stats_info += "   📈 สถิติตัวเลข:\n"
                     stats_info += f"      ├─ ค่าเฉลี่ย: {self.data[col].mean():.2f}\n"
                     stats_info += f"      ├─ ค่ากลาง: {self.data[col].median():.2f}\n"
@@ -862,15 +1222,47 @@ class DataCleaningApp:
             messagebox.showerror(
                 "ข้อผิดพลาด", f"ไม่สามารถแสดงสถิติได้:\n{str(e)}")
 
+    @property
+    def data(self):
+        """DataFrame ที่กำลังทำงานอยู่"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._mark_data_changed()
+
+    def _mark_data_changed(self):
+        """ทำให้แคชรายชื่อคอลัมน์ตามประเภทข้อมูลหมดอายุ"""
+        self._dtype_version += 1
+
+    def _cached_columns(self, kind, include):
+        """คืนคอลัมน์ตาม select_dtypes โดยคำนวณใหม่เฉพาะเมื่อข้อมูลเปลี่ยน"""
+        cached = self._columns_cache.get(kind)
+        if cached is None or cached[0] != self._dtype_version:
+            cached = (self._dtype_version,
+                      self.data.select_dtypes(include=include).columns)
+            self._columns_cache[kind] = cached
+        return cached[1]
+
+    @property
+    def _numeric_cols(self):
+        """คอลัมน์ตัวเลขของข้อมูลปัจจุบัน"""
+        return self._cached_columns('number', [np.number])
+
+    @property
+    def _object_cols(self):
+        """คอลัมน์ข้อความ (object) ของข้อมูลปัจจุบัน"""
+        return self._cached_columns('object', ['object'])
+
     def update_display(self):
         """อัปเดตการแสดงข้อมูลในตาราง"""
         if self.data is None or self.tree is None:
             return
 
         try:
-            # ลบข้อมูลเดิม
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            # ลบข้อมูลเดิม (เรียกครั้งเดียว)
+            self.tree.delete(*self.tree.get_children())
 
             # ตั้งค่าคอลัมน์
             columns = list(self.data.columns)
@@ -889,11 +1281,13 @@ class DataCleaningApp:
             # จำกัดการแสดงผลตามการตั้งค่า
             max_rows = self.settings.get('max_display_rows', 1000)
             display_data = self.data.head(max_rows)
+            # แทนค่าว่างครั้งเดียวทั้งตาราง แทนการตรวจทีละค่า
+            display_data = display_data.astype(object).where(
+                display_data.notna(), '')
 
             # เพิ่มข้อมูล
-            for index, row in display_data.iterrows():
-                values = [str(val) if pd.notna(val) else '' for val in row]
-                self.tree.insert("", "end", values=values)
+            for row in display_data.itertuples(index=False, name=None):
+                self.tree.insert("", "end", values=[str(val) for val in row])
 
             # แสดงข้อความแจ้งเตือนถ้าข้อมูลมากเกินไป
             if len(self.data) > max_rows:
@@ -1384,10 +1778,10 @@ class DataCleaningApp:
 
         # เก็บสถานะปัจจุบันลง redo stack
         if self.data is not None:
-            self.redo_stack.append(self.data.copy())
+            self._push_snapshot(self.redo_stack)
 
         # คืนสถานะก่อนหน้า
-        self.data = self.undo_stack.pop()
+        self.data = self._pop_snapshot(self.undo_stack)
         self.update_display()
         self.update_info_panel()
         self.status_var.set("↶ ยกเลิกการกระทำล่าสุด")
@@ -1400,10 +1794,10 @@ class DataCleaningApp:
 
         # เก็บสถานะปัจจุบันลง undo stack
         if self.data is not None:
-            self.undo_stack.append(self.data.copy())
+            self._push_snapshot(self.undo_stack)
 
         # คืนสถานะที่ยกเลิกไป
-        self.data = self.redo_stack.pop()
+        self.data = self._pop_snapshot(self.redo_stack)
         self.update_display()
         self.update_info_panel()
         self.status_var.set("↷ ทำซ้ำการกระทำ")
@@ -1441,7 +1835,8 @@ class DataCleaningApp:
             ttk.Spinbox(threshold_frame, from_=1.0, to=5.0, increment=0.1,
                         textvariable=threshold_var, width=10).pack(side='left', padx=5)
 
-            # การจัดการ            action_frame = ttk.LabelFrame(outlier_window, text="การจัดการ")
+            # การจัดการ
+            action_frame = ttk.LabelFrame(outlier_window, text="การจัดการ")
             action_frame.pack(fill='x', padx=10, pady=10)
 
             action_var = tk.StringVar(value='remove')
@@ -1457,72 +1852,74 @@ class DataCleaningApp:
                             "คำเตือน", "ไม่มีข้อมูลให้ประมวลผล")
                         return
 
-                    outliers_found = 0
-                    outlier_details = []
-
                     # Get numeric columns safely
                     try:
-                        numeric_columns = self.data.select_dtypes(
-                            include=[np.number]).columns
+                        numeric_columns = self._numeric_cols
                     except (AttributeError, TypeError):
                         messagebox.showerror(
                             "ข้อผิดพลาด", "ไม่สามารถเข้าถึงคอลัมน์ตัวเลขได้")
                         return
 
-                    for col in numeric_columns:
+                    # จำนวนค่าผิดปกติของแต่ละคอลัมน์
+                    counts = np.zeros(len(numeric_columns), dtype=np.int64)
+                    # แถวที่ไม่มีค่าผิดปกติในคอลัมน์ใดเลย (ใช้กรองครั้งเดียวตอนลบ)
+                    keep = np.ones(len(self.data), dtype=bool)
+                    if self.data.empty:
+                        numeric_columns = numeric_columns[:0]
+
+                    method = method_var.get()
+                    threshold = threshold_var.get()
+                    # ดึงคอลัมน์ตัวเลขเป็นอาร์เรย์ (เรียงตามคอลัมน์) ครั้งเดียว
+                    numeric = np.asfortranarray(
+                        self.data[numeric_columns].to_numpy(dtype=np.float64))
+                    if method != 'zscore':
+                        # ควอร์ไทล์ของทุกคอลัมน์ในครั้งเดียว (partition ไม่ต้องเรียงทั้งคอลัมน์)
+                        quartiles = np.nanquantile(
+                            numeric, [0.25, 0.75], axis=0)
+
+                    for i, col in enumerate(numeric_columns):
                         try:
-                            if method_var.get() == 'zscore':
-                                col_data = self.data[col]
-                                if col_data is None or col_data.empty:
-                                    continue
+                            values = numeric[:, i]
 
-                                mean_val = col_data.mean()
-                                std_val = col_data.std()
-
-                                if pd.isna(mean_val) or pd.isna(std_val) or std_val == 0:
-                                    continue
-
-                                z_scores = np.abs(
-                                    (col_data - mean_val) / std_val)
-                                outliers = z_scores > threshold_var.get()
-                            # IQR                                col_data = self.data[col]
+                            if method == 'zscore':
+                                # หาค่าเฉลี่ย/std และ z-score ในรอบเดียว
+                                outliers = _zscore(values) > threshold
+                            # IQR
                             else:
-                                if col_data is None or col_data.empty:
-                                    continue
+                                q1, q3 = quartiles[:, i]
 
-                                q1 = col_data.quantile(0.25)
-                                q3 = col_data.quantile(0.75)
-
-                                if pd.isna(q1) or pd.isna(q3):
+                                if np.isnan(q1) or np.isnan(q3):
                                     continue
 
                                 iqr = q3 - q1
                                 lower_bound = q1 - 1.5 * iqr
                                 upper_bound = q3 + 1.5 * iqr
-                                outliers = (col_data < lower_bound) | (
-                                    col_data > upper_bound)
+                                outliers = (values < lower_bound) | (
+                                    values > upper_bound)
+
+                            outliers = np.asarray(outliers, dtype=bool)
+                            counts[i] = outliers.sum()
+                            keep &= ~outliers
                         except Exception as col_error:
                             print(
                                 f"Error processing column {col}: {str(col_error)}")
                             continue
 
-                        try:
-                            outlier_count = outliers.sum()
-                            if outlier_count > 0:
-                                outliers_found += outlier_count
-                                outlier_details.append(
-                                    f"คอลัมน์ {col}: {outlier_count} ค่า")
-                        except Exception as count_error:
-                            print(
-                                f"Error counting outliers for column {col}: {str(count_error)}")
-                            continue
+                    outliers_found = int(counts.sum())
+                    outlier_details = [f"คอลัมน์ {col}: {n} ค่า"
+                                       for col, n in zip(numeric_columns, counts)
+                                       if n > 0]
 
                     if outliers_found > 0:
                         if action_var.get() == 'remove':
                             self.save_to_undo_stack()
-                            # ลบค่าผิดปกติ (ต้องปรับปรุงให้ละเอียดกว่านี้)
+                            # ลบแถวที่มีค่าผิดปกติด้วยการกรองครั้งเดียว
+                            removed = int(len(keep) - keep.sum())
+                            self.data = self.data[keep]
+                            self.update_display()
+                            self.update_info_panel()
                             result_text = f"พบค่าผิดปกติ {outliers_found} ค่า:\n" + "\n".join(
-                                outlier_details)
+                                outlier_details) + f"\n\nลบแล้ว {removed:,} แถว"
                         else:
                             result_text = f"พบค่าผิดปกติ {outliers_found} ค่า:\n" + "\n".join(
                                 outlier_details)
@@ -1560,7 +1957,7 @@ class DataCleaningApp:
             changes = []
 
             # ปรับข้อความ
-            for col in self.data.select_dtypes(include=['object']).columns:
+            for col in self._object_cols:
                 if self.settings.get('standardize_text', True):
                     # ลบช่องว่างที่ไม่จำเป็น
                     if self.settings.get('remove_whitespace', True):
@@ -1569,7 +1966,7 @@ class DataCleaningApp:
 
             # ปรับตัวเลข
             decimal_places = self.settings.get('decimal_places', 2)
-            for col in self.data.select_dtypes(include=['float64']).columns:
+            for col in self.data.select_dtypes(include=['floating']).columns:
                 self.data[col] = self.data[col].round(decimal_places)
                 changes.append(
                     f"ปรับทศนิยมคอลัมน์ {col} เป็น {decimal_places} ตำแหน่ง")
@@ -1978,38 +2375,43 @@ class DataCleaningApp:
         summary_text.insert('1.0', summary)
         summary_text.config(state='disabled')
 
+    @requires_data()
     def simulate_cleaning(self):
         """จำลองการทำความสะอาดข้อมูล"""
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "กรุณาโหลดไฟล์ข้อมูลก่อน")
+        fill_method = getattr(self, 'fill_method_var', None)
+        fill_method = fill_method.get() if fill_method else None
+        duplicate_method = getattr(self, 'duplicate_method_var', None)
+        duplicate_method = duplicate_method.get() if duplicate_method else None
+
+        # ไม่มีขั้นตอนที่เปลี่ยนข้อมูล ไม่ต้องสำเนา
+        if (fill_method not in ('mean', 'median', 'zero')
+                and duplicate_method not in ('first', 'last', 'all')):
             return self.data
 
         try:
-            # สำเนาข้อมูลสำหรับจำลอง
-            preview_data = self.data.copy()
+            # สำเนาแบบตื้น: คอลัมน์ที่เติมค่าจะถูกแทนที่ ไม่แก้ข้อมูลจริง
+            preview_data = self.data.copy(deep=False)
 
             # จำลองการเติมค่าว่าง
-            fill_method = getattr(self, 'fill_method_var', None)
-            if fill_method and fill_method.get() != 'remove':
-                for col in preview_data.select_dtypes(include=[np.number]).columns:
-                    if fill_method.get() == 'mean':
-                        preview_data[col].fillna(
-                            preview_data[col].mean(), inplace=True)
-                    elif fill_method.get() == 'median':
-                        preview_data[col].fillna(
-                            preview_data[col].median(), inplace=True)
-                    elif fill_method.get() == 'zero':
-                        preview_data[col].fillna(0, inplace=True)
+            if fill_method in ('mean', 'median', 'zero'):
+                numeric_data = preview_data.select_dtypes(include=[np.number])
+                na_cols = numeric_data.columns[numeric_data.isna().any()]
+                if len(na_cols) > 0:
+                    if fill_method == 'mean':
+                        fill_values = numeric_data[na_cols].mean()
+                    elif fill_method == 'median':
+                        fill_values = numeric_data[na_cols].median()
+                    else:
+                        fill_values = 0
+                    preview_data[na_cols] = numeric_data[na_cols].fillna(
+                        fill_values)
 
             # จำลองการลบข้อมูลซ้ำ
-            duplicate_method = getattr(self, 'duplicate_method_var', None)
-            if duplicate_method and duplicate_method.get() != 'mark_only':
-                if duplicate_method.get() == 'first':
-                    preview_data = preview_data.drop_duplicates(keep='first')
-                elif duplicate_method.get() == 'last':
-                    preview_data = preview_data.drop_duplicates(keep='last')
-                elif duplicate_method.get() == 'all':
-                    preview_data = preview_data.drop_duplicates(keep=False)
+            if duplicate_method in ('first', 'last', 'all'):
+                keep = False if duplicate_method == 'all' else duplicate_method
+                duplicates = preview_data.duplicated(keep=keep)
+                if duplicates.any():
+                    preview_data = preview_data[~duplicates]
 
             return preview_data
 
@@ -2051,31 +2453,51 @@ class DataCleaningApp:
 
     def display_data_in_tree(self, tree, data):
         """แสดงข้อมูลใน Treeview"""
-        # ลบข้อมูลเดิม
-        for item in tree.get_children():
-            tree.delete(item)
+        # ลบข้อมูลเดิม (เรียกครั้งเดียว)
+        tree.delete(*tree.get_children())
 
         # ตั้งค่าคอลัมน์
         columns = list(data.columns)
         tree["columns"] = columns
         tree["show"] = "headings"
+        # ซ่อนคอลัมน์ต้นไม้ (#0) ที่ไม่ได้ใช้
+        tree.column('#0', width=0, stretch=False)
 
         # ตั้งค่า heading
+        tree_heading = tree.heading
+        tree_column = tree.column
         for col in columns:
-            tree.heading(col, text=col)
-            tree.column(col, width=100, minwidth=50)
+            tree_heading(col, text=col)
+            tree_column(col, width=100, minwidth=50)
 
-        # เพิ่มข้อมูล
-        for index, row in data.iterrows():
-            values = [str(val) if pd.notna(val) else '' for val in row]
-            tree.insert("", "end", values=values)
+        # แปลงค่าว่างและข้อความทั้งตารางในครั้งเดียว
+        values = data.astype(object).where(data.notna(), '').astype(str).to_numpy()
 
-    def apply_advanced_cleaning(self, options_window):
-        """ดำเนินการทำความสะอาดตามตัวเลือกที่เลือก"""
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "ไม่มีข้อมูลให้ทำความสะอาด")
+        # เพิ่มข้อมูลทีละชุดผ่าน after_idle เพื่อไม่ให้หน้าจอค้าง
+        tree._insert_job = rows = [tuple(row) for row in values]
+        self._insert_tree_rows(tree, rows, 0)
+
+    def _insert_tree_rows(self, tree, rows, start, chunk_size=500):
+        """เพิ่มแถวใน Treeview ครั้งละ chunk_size แถว แล้วคืนการทำงานให้ event loop"""
+        # หยุดถ้ามีการแสดงข้อมูลชุดใหม่ในตารางนี้แล้ว
+        if getattr(tree, '_insert_job', None) is not rows:
             return
 
+        end = min(start + chunk_size, len(rows))
+        try:
+            for row in rows[start:end]:
+                tree.insert("", "end", values=row)
+        except tk.TclError:
+            # หน้าต่างถูกปิดระหว่างเพิ่มข้อมูล
+            return
+
+        if end < len(rows):
+            self.root.after_idle(self._insert_tree_rows, tree, rows, end,
+                                 chunk_size)
+
+    @requires_data("ไม่มีข้อมูลให้ทำความสะอาด")
+    def apply_advanced_cleaning(self, options_window):
+        """ดำเนินการทำความสะอาดตามตัวเลือกที่เลือก"""
         try:
             # สำรองข้อมูลเดิม
             self.save_to_undo_stack()
@@ -2083,13 +2505,17 @@ class DataCleaningApp:
             original_rows = len(self.data)
             changes = []
 
+            # หาคอลัมน์ตัวเลขครั้งเดียวแล้วส่งต่อให้ทุกขั้นตอน
+            numeric_columns = self._numeric_cols
+
             # ทำความสะอาดตามตัวเลือกที่เลือก
 
             # 1. จัดการค่าว่าง
             fill_method = getattr(self, 'fill_method_var', None)
             if fill_method:
                 missing_before = self.data.isnull().sum().sum()
-                self.apply_missing_data_cleaning(fill_method.get())
+                self.apply_missing_data_cleaning(
+                    fill_method.get(), numeric_columns)
                 missing_after = self.data.isnull().sum().sum()
                 if missing_before != missing_after:
                     changes.append(
@@ -2109,7 +2535,8 @@ class DataCleaningApp:
             outlier_method = getattr(self, 'outlier_method_var', None)
             if outlier_method and outlier_method.get() != 'none':
                 outlier_before = len(self.data)
-                self.apply_outlier_cleaning(outlier_method.get())
+                self.apply_outlier_cleaning(
+                    outlier_method.get(), numeric_columns)
                 outlier_after = len(self.data)
                 if outlier_before != outlier_after:
                     changes.append(
@@ -2135,12 +2562,8 @@ class DataCleaningApp:
             messagebox.showerror(
                 "ข้อผิดพลาด", f"เกิดข้อผิดพลาดในการทำความสะอาด:\n{str(e)}")
 
-    def apply_missing_data_cleaning(self, method):
+    def apply_missing_data_cleaning(self, method, numeric_columns=None):
         """ดำเนินการเติมค่าว่างตามวิธีที่เลือก"""
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "กรุณาโหลดไฟล์ข้อมูลก่อน")
-            return
-
         if method == 'remove':
             self.data = self.data.dropna()
         elif method == 'custom':
@@ -2149,46 +2572,111 @@ class DataCleaningApp:
                 for col, entry in self.custom_values.items():
                     custom_value = entry.get().strip()
                     if custom_value and col in self.data.columns:
+                        if self.data[col].dtype == 'object':
+                            # เติมผ่าน category เพื่อทำงานกับค่าที่ไม่ซ้ำแทนทุกแถว
+                            cat = self.data[col].astype('category')
+                            if custom_value not in cat.cat.categories:
+                                cat = cat.cat.add_categories([custom_value])
+                            self.data[col] = cat.fillna(
+                                custom_value).astype(object)
+                            continue
                         try:
                             # แปลงประเภทข้อมูลให้เหมาะสม
-                            if self.data[col].dtype in ['int64', 'float64']:
+                            if _is_number_dtype(self.data[col].dtype):
                                 custom_value = float(custom_value)
                             self.data[col].fillna(custom_value, inplace=True)
                         except ValueError:
                             self.data[col].fillna(custom_value, inplace=True)
         else:            # วิธีมาตรฐาน
-            for col in self.data.columns:
-                if self.data[col].isnull().any():
-                    if self.data[col].dtype in ['int64', 'float64']:
-                        if method == 'mean':
-                            self.data[col].fillna(
-                                self.data[col].mean(), inplace=True)
-                        elif method == 'median':
-                            self.data[col].fillna(
-                                self.data[col].median(), inplace=True)
-                        elif method == 'zero':
-                            self.data[col].fillna(0, inplace=True)
-                        elif method == 'forward':
-                            self.data[col] = self.data[col].ffill()
-                        elif method == 'backward':
-                            self.data[col] = self.data[col].bfill()
-                        elif method == 'interpolate':
-                            self.data[col].interpolate(inplace=True)
+            # ตรวจค่าว่างทั้งตารางในครั้งเดียว แล้ววนเฉพาะคอลัมน์ที่มีค่าว่าง
+            has_na = self.data.isna().any()
+            dtypes = self.data.dtypes
+            if numeric_columns is None:
+                numeric_columns = self._numeric_cols
+
+            # คอลัมน์ตัวเลขที่มีค่าว่าง เติมพร้อมกันเป็นบล็อกเดียว
+            block_cols = [col for col in numeric_columns
+                          if has_na[col] and _is_number_dtype(dtypes[col])]
+            if block_cols:
+                self._fill_numeric_block(block_cols, method)
+
+            other_cols = [col for col in self.data.columns
+                          if has_na[col] and not _is_number_dtype(dtypes[col])]
+            if other_cols and method == 'mode':
+                # หาฐานนิยมของทุกคอลัมน์ในครั้งเดียว แล้วเติมพร้อมกัน
+                modes = self.data[other_cols].mode()
+                if len(modes) > 0:
+                    fill_values = modes.iloc[0].dropna()
+                    cols = list(fill_values.index)
+                    if cols:
+                        self.data[cols] = self.data[cols].fillna(fill_values)
+            elif method in ('forward', 'backward'):
+                for col in other_cols:
+                    if dtypes[col] == 'object':
+                        self.data[col] = self._fill_object_column(
+                            self.data[col], forward=(method == 'forward'))
+                    elif method == 'forward':
+                        self.data[col] = self.data[col].ffill()
                     else:
-                        if method == 'mode':
-                            mode_val = self.data[col].mode()
-                            if len(mode_val) > 0:
-                                self.data[col].fillna(
-                                    mode_val[0], inplace=True)
-                        elif method == 'forward':
-                            self.data[col] = self.data[col].ffill()
-                        elif method == 'backward':
-                            self.data[col] = self.data[col].bfill()
+                        self.data[col] = self.data[col].bfill()
+
+        # การเติมค่าอาจเปลี่ยนประเภทข้อมูลของคอลัมน์
+        self._mark_data_changed()
+
+    def _fill_object_column(self, series, forward=True):
+        """เติมค่าว่างแบบ ffill/bfill ของคอลัมน์ข้อความผ่านรหัส category (ตัวเลข)"""
+        try:
+            cat = series.astype('category')
+        except TypeError:
+            # มีค่าที่ hash ไม่ได้ ใช้วิธีของ pandas แทน
+            return series.ffill() if forward else series.bfill()
+        if len(cat.cat.categories) == 0:
+            # ว่างทั้งคอลัมน์ ไม่มีค่าให้เติม
+            return series
+
+        codes = cat.cat.codes.to_numpy()
+        if not forward:
+            codes = codes[::-1]
+
+        # ตำแหน่งล่าสุดที่มีค่า ณ แต่ละแถว
+        idx = np.where(codes != -1, np.arange(len(codes)), 0)
+        np.maximum.accumulate(idx, out=idx)
+        codes = codes[idx]
+        if not forward:
+            codes = codes[::-1]
+
+        categories = cat.cat.categories.to_numpy(dtype=object)
+        values = np.where(codes != -1, categories[codes], series.to_numpy())
+        return pd.Series(values, index=series.index, name=series.name,
+                         dtype=object)
+
+    def _fill_numeric_block(self, columns, method):
+        """เติมค่าว่างของคอลัมน์ตัวเลขบนอาร์เรย์ float64 ก้อนเดียว แล้วเขียนกลับครั้งเดียว"""
+        if method in ('mean', 'median', 'zero'):
+            arr = np.ascontiguousarray(
+                self.data[columns].to_numpy(dtype=np.float64))
+            if method == 'mean':
+                fill_values = np.nanmean(arr, axis=0)
+            elif method == 'median':
+                fill_values = np.nanmedian(arr, axis=0)
+            else:
+                fill_values = np.zeros(arr.shape[1])
+            rows, cols = np.nonzero(np.isnan(arr))
+            arr[rows, cols] = fill_values[cols]
+            # คืนชนิดข้อมูลเดิม (เช่น float32 หลังลดขนาด)
+            dtypes = self.data[columns].dtypes
+            self.data[columns] = pd.DataFrame(
+                arr, index=self.data.index, columns=columns).astype(dtypes.to_dict())
+        elif method == 'forward':
+            self.data[columns] = self.data[columns].ffill()
+        elif method == 'backward':
+            self.data[columns] = self.data[columns].bfill()
+        elif method == 'interpolate':
+            self.data[columns] = self.data[columns].interpolate()
 
     def apply_duplicate_cleaning(self, method):
         """ดำเนินการลบข้อมูลซ้ำตามวิธีที่เลือก"""
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "กรุณาโหลดไฟล์ข้อมูลก่อน")
+        if method in ('first', 'last') and self._drop_duplicates_dask(method):
             return
 
         if method == 'first':
@@ -2198,25 +2686,44 @@ class DataCleaningApp:
         elif method == 'all':
             self.data = self.data.drop_duplicates(keep=False)
 
-    def apply_outlier_cleaning(self, method):
-        """ดำเนินการจัดการค่าผิดปกติ"""
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "กรุณาโหลดไฟล์ข้อมูลก่อน")
-            return
+    def _drop_duplicates_dask(self, keep):
+        """ลบข้อมูลซ้ำด้วย dask แบบแบ่ง partition เมื่อข้อมูลมีขนาดใหญ่
 
+        คืนค่า True เมื่อลบด้วย dask แล้ว และ False เมื่อไม่มี dask
+        หรือข้อมูลเล็กกว่าเกณฑ์ (ให้ใช้ pandas ตามปกติ)
+        """
+        try:
+            import dask.dataframe as dd
+        except ImportError:
+            return False
+
+        limit_mb = self.settings.get('dask_threshold_mb', 500)
+        if self.data.memory_usage(deep=True).sum() <= limit_mb * 1024 * 1024:
+            return False
+
+        # ใช้ตำแหน่งแถวเป็น index เพื่อคืนลำดับและ index เดิมหลังประมวลผล
+        frame = self.data.reset_index(drop=True)
+        ddf = dd.from_pandas(frame, npartitions=os.cpu_count() or 1)
+        kept = ddf.drop_duplicates(keep=keep).compute()
+        self.data = self.data.iloc[np.sort(kept.index.to_numpy())]
+        return True
+
+    def apply_outlier_cleaning(self, method, numeric_columns=None):
+        """ดำเนินการจัดการค่าผิดปกติ"""
         action = getattr(self, 'outlier_action_var', None)
         if not action:
             return
 
-        # Additional safety check to ensure data is not None
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "ข้อมูลไม่พร้อมใช้งาน")
-            return
-
         # Check if data has numeric columns
         try:
-            numeric_columns = self.data.select_dtypes(
-                include=[np.number]).columns
+            if numeric_columns is None:
+                numeric_columns = self._numeric_cols
+            else:
+                # ขั้นตอนก่อนหน้าอาจเปลี่ยนประเภทข้อมูลของบางคอลัมน์
+                dtypes = self.data.dtypes
+                numeric_columns = [
+                    col for col in numeric_columns
+                    if col in dtypes and pd.api.types.is_numeric_dtype(dtypes[col])]
             if len(numeric_columns) == 0:
                 messagebox.showinfo(
                     "ข้อมูล", "ไม่พบคอลัมน์ตัวเลขสำหรับการตรวจจับค่าผิดปกติ")
@@ -2226,74 +2733,179 @@ class DataCleaningApp:
                 "ข้อผิดพลาด", f"ไม่สามารถวิเคราะห์ประเภทข้อมูลได้: {str(e)}")
             return
 
-        for col in numeric_columns:
-            # Additional safety check within the loop
-            if self.data is None:
-                messagebox.showwarning(
-                    "คำเตือน", "ข้อมูลหายไประหว่างการประมวลผล")
+        action = action.get()
+        if method == 'zscore':
+            threshold = float(self._var_value('zscore_threshold', 3.0))
+
+        if method not in ('zscore', 'iqr') or action not in ('remove', 'cap'):
+            return
+
+        # ตรวจจับบนบล็อก float32 (เรียงตามคอลัมน์) เพื่อลดปริมาณหน่วยความจำที่ต้องอ่าน
+        arr = _detection_block(self.data[numeric_columns])
+
+        try:
+            if action == 'cap' or method == 'iqr':
+                # ขอบเขต IQR ของทุกคอลัมน์ในครั้งเดียว
+                q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
+                iqr = q3 - q1
+                lower = np.nan_to_num(q1 - 1.5 * iqr, nan=-np.inf)
+                upper = np.nan_to_num(q3 + 1.5 * iqr, nan=np.inf)
+
+            if action == 'cap':
+                # ตัดค่าทุกคอลัมน์พร้อมกันใน np.clip ครั้งเดียว
+                changed = ((arr < lower) | (arr > upper)).any(axis=0)
+                if changed.any():
+                    # ตัดค่าบนข้อมูล float64 เดิม ค่าที่ไม่เกินขอบเขตจึงไม่สูญเสียความละเอียด
+                    capped = np.flatnonzero(changed)
+                    cols = [numeric_columns[j] for j in capped]
+                    values = np.asfortranarray(
+                        self.data[cols].to_numpy(dtype=np.float64))
+                    lower = lower[capped].astype(np.float64)
+                    upper = upper[capped].astype(np.float64)
+                    if _cap_inplace is not None:
+                        _cap_inplace(values, lower, upper)
+                    else:
+                        np.clip(values, lower[None, :], upper[None, :], out=values)
+                    self.data[cols] = values
                 return
 
-            try:
+            # สร้าง mask ของค่าผิดปกติทั้งบล็อก แล้วรวมเป็น mask ของแถวที่เก็บไว้
+            if method == 'zscore' and _outlier_mask is not None:
+                keep = _outlier_mask(arr, float(threshold))
+            else:
                 if method == 'zscore':
-                    threshold = getattr(self, 'zscore_threshold',
-                                        tk.DoubleVar(value=3.0)).get()
-                    z_scores = np.abs(
-                        (self.data[col] - self.data[col].mean()) / self.data[col].std())
-                    outliers = z_scores > threshold
-
-                    if action.get() == 'remove':
-                        self.data = self.data[~outliers]
-                    elif action.get() == 'cap':
-                        q1 = self.data[col].quantile(0.25)
-                        q3 = self.data[col].quantile(0.75)
-                        iqr = q3 - q1
-                        lower_bound = q1 - 1.5 * iqr
-                        upper_bound = q3 + 1.5 * iqr
-                        self.data[col] = self.data[col].clip(
-                            lower=lower_bound, upper=upper_bound)
-
-                elif method == 'iqr':
-                    q1 = self.data[col].quantile(0.25)
-                    q3 = self.data[col].quantile(0.75)
-                    iqr = q3 - q1
-                    lower_bound = q1 - 1.5 * iqr
-                    upper_bound = q3 + 1.5 * iqr
-                    outliers = (self.data[col] < lower_bound) | (
-                        self.data[col] > upper_bound)
-
-                    if action.get() == 'remove':
-                        self.data = self.data[~outliers]
-                    elif action.get() == 'cap':
-                        self.data[col] = self.data[col].clip(
-                            lower=lower_bound, upper=upper_bound)
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        mean = np.nanmean(arr, axis=0, dtype=np.float64)
+                        std = np.nanstd(arr, axis=0, ddof=1, dtype=np.float64)
+                        outliers = np.abs((arr - mean) / std) > threshold
+                else:
+                    outliers = (arr < lower) | (arr > upper)
+                keep = ~outliers.any(axis=1)
 
-            except Exception as e:
-                messagebox.showerror(
-                    "ข้อผิดพลาด", f"เกิดข้อผิดพลาดในการจัดการค่าผิดปกติสำหรับคอลัมน์ {col}: {str(e)}")
-                continue
+        except Exception as e:
+            messagebox.showerror(
+                "ข้อผิดพลาด", f"เกิดข้อผิดพลาดในการจัดการค่าผิดปกติ: {str(e)}")
+            return
+
+        # กรองแถวออกจาก DataFrame ครั้งเดียว
+        if not keep.all():
+            self.data = self.data[keep]
+
+    def _var_value(self, name, default):
+        """อ่านค่าตัวแปร Tk ของแอป หรือคืนค่าเริ่มต้นโดยไม่สร้างตัวแปรใหม่"""
+        var = getattr(self, name, None)
+        return default if var is None else var.get()
+
+    def _option_value(self, key):
+        """อ่านค่าตัวเลือกการปรับข้อความ (False ถ้ายังไม่มีตัวเลือกนี้)"""
+        var = self.text_options.get(key)
+        return False if var is None else var.get()
 
     def apply_standardization(self):
         """ดำเนินการปรับมาตรฐานข้อมูล"""
-        if self.data is None:
-            messagebox.showwarning("คำเตือน", "กรุณาโหลดไฟล์ข้อมูลก่อน")
-            return
-
         if not hasattr(self, 'text_options'):
             return
 
-        for col in self.data.select_dtypes(include=['object']).columns:
-            # ลบช่องว่างที่ไม่จำเป็น
-            if self.text_options.get('remove_whitespace', tk.BooleanVar()).get():
-                self.data[col] = self.data[col].astype(str).str.strip()
+        remove_whitespace = self._option_value('remove_whitespace')
+        standardize_case = self._option_value('standardize_case')
+        remove_special = self._option_value('remove_special_chars')
+        if not (remove_whitespace or standardize_case or remove_special):
+            return
 
-            # ปรับตัวพิมพ์
-            if self.text_options.get('standardize_case', tk.BooleanVar()).get():
-                self.data[col] = self.data[col].astype(str).str.title()
+        # สัดส่วนค่าไม่ซ้ำต่อจำนวนแถวที่ยังคุ้มจะแปลงเฉพาะค่าไม่ซ้ำ (ปรับได้ในการตั้งค่า)
+        unique_ratio = self.settings.get('standardize_unique_ratio', 0.5)
+        options = (remove_whitespace, standardize_case, remove_special)
+
+        # ข้ามคอลัมน์ที่ปรับมาตรฐานด้วยตัวเลือกเดียวกันไปแล้วและยังไม่เปลี่ยน
+        flags = frozenset(name for name, enabled in zip(
+            ('remove_whitespace', 'standardize_case', 'remove_special_chars'),
+            options) if enabled)
+        columns = [col for col in self._object_cols
+                   if self._std_cache.get(col) !=
+                   (_fingerprint(self.data[col].to_numpy()), flags)]
+        if not columns:
+            return
 
-            # ลบอักขระพิเศษ
-            if self.text_options.get('remove_special_chars', tk.BooleanVar()).get():
-                self.data[col] = self.data[col].astype(
-                    str).str.replace(r'[^\w\s]', '', regex=True)
+        def clean(col):
+            result = self._standardize_column(self.data[col], unique_ratio,
+                                              options)
+            self._std_cache[col] = (_fingerprint(result), flags)
+            return result
+
+        # ข้อมูลใหญ่: แยกคอลัมน์ให้หลายเธรด (string kernel ของ Arrow ปล่อย GIL)
+        if (len(self.data) > self.settings.get('parallel_rows_threshold', 100_000)
+                and len(columns) > 1):
+            workers = min(len(columns), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(clean, columns))
+        else:
+            results = [clean(col) for col in columns]
+
+        # เขียนผลกลับทุกคอลัมน์ในครั้งเดียว
+        self.data[columns] = pd.DataFrame(
+            dict(zip(columns, results)), index=self.data.index, dtype=object)
+
+    def _standardize_column(self, series, unique_ratio, options):
+        """ปรับมาตรฐานข้อความหนึ่งคอลัมน์ และคืนเป็น array แบบ object"""
+        # แปลงเป็นข้อความครั้งเดียว
+        values = series.astype(str)
+
+        codes, uniques = pd.factorize(values)
+        if len(values) and len(uniques) / len(values) < unique_ratio:
+            # คอลัมน์มีค่าซ้ำมาก: แปลงเฉพาะค่าไม่ซ้ำ แล้วกระจายกลับด้วยรหัส
+            return self._standardize_text(
+                pd.Series(uniques, dtype=object), *options)[codes]
+        return self._standardize_text(values, *options)
+
+    @staticmethod
+    def _ascii_arrow(values):
+        """
+        แปลงข้อความเป็น Arrow string array เมื่อทุกค่าเป็น ASCII
+        
+        คืน None เมื่อไม่มี pyarrow หรือมีอักขระนอก ASCII ซึ่ง utf8_title ของ Arrow
+        กับ str.title ของ Python ให้ผลต่างกัน (เช่น 'ǆ' และ 'ﬁ')
+        """
+        if pa is None:
+            return None
+        try:
+            arr = pa.array(values.to_numpy(), type=pa.string())
+        except (pa.ArrowException, UnicodeEncodeError):
+            return None
+        if not pc.all(pc.string_is_ascii(arr), min_count=0).as_py():
+            return None
+        return arr
+
+    def _standardize_text(self, values, remove_whitespace, standardize_case,
+                          remove_special):
+        """ปรับมาตรฐานข้อความใน Series และคืนเป็น array แบบ object"""
+        arr = self._ascii_arrow(values)
+        if arr is not None:
+            # ใช้ string kernel ของ Arrow แทนการวนทีละค่าใน Python
+            if remove_whitespace:
+                arr = pc.utf8_trim_whitespace(arr)
+            if standardize_case:
+                arr = pc.utf8_title(arr)
+            if remove_special:
+                arr = pc.replace_substring_regex(
+                    arr, pattern=_SPECIAL_CHARS_RE2, replacement='')
+            return arr.to_numpy(zero_copy_only=False)
+
+        # ใช้ StringDtype เพื่อให้ .str ทำงานบนข้อความโดยตรง
+        values = values.astype('string')
+
+        # ลบช่องว่างที่ไม่จำเป็น
+        if remove_whitespace:
+            values = values.str.strip()
+
+        # ปรับตัวพิมพ์
+        if standardize_case:
+            values = values.str.title()
+
+        # ลบอักขระพิเศษ
+        if remove_special:
+            values = values.str.replace(_SPECIAL_CHARS_RE, '', regex=True)
+
+        return values.to_numpy(dtype=object)
 
     def save_cleaning_template(self):
         """บันทึกการตั้งค่าการทำความสะอาดเป็นเทมเพลต"""
@@ -2304,11 +2916,11 @@ class DataCleaningApp:
 
         template = {
             'name': template_name,
-            'fill_method': getattr(self, 'fill_method_var', tk.StringVar()).get(),
-            'duplicate_method': getattr(self, 'duplicate_method_var', tk.StringVar()).get(),
-            'outlier_method': getattr(self, 'outlier_method_var', tk.StringVar()).get(),
-            'outlier_threshold': getattr(self, 'zscore_threshold', tk.DoubleVar()).get(),
-            'outlier_action': getattr(self, 'outlier_action_var', tk.StringVar()).get(),
+            'fill_method': self._var_value('fill_method_var', ''),
+            'duplicate_method': self._var_value('duplicate_method_var', ''),
+            'outlier_method': self._var_value('outlier_method_var', ''),
+            'outlier_threshold': self._var_value('zscore_threshold', 0.0),
+            'outlier_action': self._var_value('outlier_action_var', ''),
             'created_date': datetime.now().isoformat()
         }
 
@@ -2316,15 +2928,24 @@ class DataCleaningApp:
         templates_file = 'cleaning_templates.json'
         try:
             if os.path.exists(templates_file):
-                with open(templates_file, 'r', encoding='utf-8') as f:
-                    templates = json.load(f)
+                with open(templates_file, 'rb') as f:
+                    raw = f.read()
+                templates = (orjson.loads(raw) if orjson is not None
+                             else json.loads(raw.decode('utf-8')))
             else:
                 templates = {}
 
             templates[template_name] = template
 
-            with open(templates_file, 'w', encoding='utf-8') as f:
-                json.dump(templates, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # orjson เขียนเป็น UTF-8 เสมอ ไม่ต้องใช้ ensure_ascii
+                with open(templates_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        templates,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(templates_file, 'w', encoding='utf-8') as f:
+                    json.dump(templates, f, ensure_ascii=False, indent=2)
 
             messagebox.showinfo(
                 "สำเร็จ", f"บันทึกเทมเพลต '{template_name}' เรียบร้อย")
@@ -2336,118 +2957,71 @@ class DataCleaningApp:
     def save_to_undo_stack(self):
         """บันทึกสถานะปัจจุบันลง undo stack"""
         if self.data is not None:
-            self.undo_stack.append(self.data.copy())
-            # จำกัดขนาด undo stack
-            if len(self.undo_stack) > 10:
-                self.undo_stack.pop(0)
+            self._mark_data_changed()
+            # deque(maxlen=10) ทิ้งสถานะเก่าสุดให้เอง
+            self._push_snapshot(self.undo_stack)
             # ล้าง redo stack
-            self.redo_stack.clear()
+            self._clear_snapshots(self.redo_stack)
+
+    def _push_snapshot(self, stack):
+        """เก็บสำเนาข้อมูลปัจจุบันลง stack
+
+        เฉพาะสถานะล่าสุดเก็บเป็น DataFrame เพื่อให้ยกเลิกครั้งเดียวได้ทันที
+        สถานะก่อนหน้านั้นถูกย้ายไปไฟล์ Parquet ชั่วคราว (หรือบีบอัดเป็น bytes)
+        """
+        if stack and isinstance(stack[-1], pd.DataFrame):
+            stack[-1] = _spill_frame(stack[-1])
+        # ทิ้งสถานะเก่าสุดเอง เพื่อให้ลบไฟล์ของมันด้วย
+        if stack.maxlen is not None and len(stack) == stack.maxlen:
+            _discard_snapshot(stack.popleft())
+        stack.append(self.data.copy())
+
+    def _pop_snapshot(self, stack):
+        """ดึงสถานะล่าสุดออกจาก stack เป็น DataFrame"""
+        return _restore_frame(stack.pop())
+
+    def _clear_snapshots(self, stack):
+        """ล้าง stack พร้อมลบไฟล์ snapshot ที่เกี่ยวข้อง"""
+        for snapshot in stack:
+            _discard_snapshot(snapshot)
+        stack.clear()
 
     def show_help(self):
         """แสดงคู่มือการใช้งาน"""
+        # ใช้หน้าต่างเดิมถ้ายังเปิดอยู่
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+
         help_window = tk.Toplevel(self.root)
+        self._help_window = help_window
         help_window.title("📖 คู่มือการใช้งาน")
         help_window.geometry("600x500")
 
+        # ใส่ข้อความและล็อกวิดเจ็ตให้เสร็จก่อน pack เพื่อให้วาดหน้าจอครั้งเดียว
         text_widget = tk.Text(help_window, wrap='word')
+        text_widget.insert('1.0', _HELP_TEXT)
+        text_widget.config(state='disabled')
+
         scrollbar = ttk.Scrollbar(
             help_window, orient="vertical", command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
 
-        help_content = """📖 คู่มือการใช้งานระบบทำความสะอาดข้อมูล
-
-🚀 การเริ่มต้น:
-1. คลิก "📂 เปิดไฟล์" เพื่อเลือกไฟล์ข้อมูล (CSV หรือ Excel)
-2. หรือใช้เมนู "ไฟล์ > นำเข้าตัวอย่าง" เพื่อทดลองกับข้อมูลตัวอย่าง
-
-🧹 การทำความสะอาดข้อมูล:
-• "🧹 ทำความสะอาดทั้งหมด" - ทำความสะอาดแบบครบวงจร
-• "🗑️ ลบข้อมูลซ้ำ" - ลบแถวที่ซ้ำกัน
-• "🔧 เติมค่าว่าง" - เติมค่าที่หายไป
-• "🧼 ลบแถวว่าง" - ลบแถวที่ว่างเปล่า
-
-⚙️ การตั้งค่า:
-• ใช้เมนู "ตั้งค่า" เพื่อปรับแต่งวิธีการทำความสะอาด
-• เลือกโหมดการทำงานที่เหมาะกับระดับของคุณ
-
-📊 การตรวจสอบ:
-• "📊 สถิติข้อมูล" - ดูข้อมูลสถิติโดยละเอียด
-• "🎯 ตรวจสอบคุณภาพ" - ประเมินคุณภาพข้อมูล
-• "📋 เปรียบเทียบ" - เปรียบเทียบก่อนและหลังการทำความสะอาด
-
-💾 การบันทึก:
-• "💾 บันทึก" - บันทึกข้อมูลที่ทำความสะอาดแล้ว
-• "📄 ส่งออกรายงาน" - สร้างรายงานผลการทำความสะอาด
-
-🎮 โหมดการทำงาน:
-• ผู้เริ่มต้น: เหมาะสำหรับผู้ใช้ใหม่
-• มาตรฐาน: โหมดปกติสำหรับผู้ใช้ทั่วไป  
-• ผู้เชี่ยวชาญ: ตัวเลือกครบถ้วนสำหรับผู้เชี่ยวชาญ
-
-❓ ต้องการความช่วยเหลือเพิ่มเติม?
-• กดปุ่ม "💡 เคล็ดลับ" เพื่อดูเคล็ดลับการใช้งาน
-• กดปุ่ม "🔍 ตัวอย่างการใช้งาน" เพื่อดูตัวอย่าง
-"""
-
         text_widget.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        text_widget.insert('1.0', help_content)
-        text_widget.config(state='disabled')
-
     def show_tips(self):
         """แสดงเคล็ดลับการใช้งาน"""
-        tips = [
-            "💡 สำรองข้อมูลต้นฉบับก่อนทำความสะอาดเสมอ",
-            "🔍 ตรวจสอบข้อมูลก่อนและหลังการทำความสะอาด",
-            "⚙️ ปรับการตั้งค่าให้เหมาะสมกับข้อมูลของคุณ",
-            "📊 ใช้ฟังก์ชันสถิติเพื่อทำความเข้าใจข้อมูล",
-            "🎯 ตรวจสอบค่าผิดปกติก่อนลบออก",
-            "📄 สร้างรายงานเพื่อเก็บบันทึกการทำงาน"
-        ]
-
-        tip_text = "💡 เคล็ดลับการใช้งาน:\n\n" + "\n\n".join(tips)
-        messagebox.showinfo("💡 เคล็ดลับ", tip_text)
+        messagebox.showinfo("💡 เคล็ดลับ", _TIPS_TEXT)
 
     def show_examples(self):
         """แสดงตัวอย่างการใช้งาน"""
-        examples = """🔍 ตัวอย่างการใช้งาน:
-
-📝 สถานการณ์ที่ 1: ข้อมูลพนักงาน
-• มีข้อมูลซ้ำ → ใช้ "ลบข้อมูลซ้ำ"
-• มีช่องเงินเดือนว่าง → ใช้ "เติมค่าว่าง" (ค่าเฉลี่ย)
-• มีอายุผิดปกติ (999) → ตรวจจับด้วย "ค่าผิดปกติ"
-
-📊 สถานการณ์ที่ 2: ข้อมูลยอดขาย
-• ตรวจสอบข้อมูลก่อน → "สถิติข้อมูล"
-• ทำความสะอาดทั้งหมด → "ทำความสะอาดทั้งหมด"
-• ตรวจสอบผลลัพธ์ → "เปรียบเทียบ"
-
-🎯 สถานการณ์ที่ 3: ข้อมูลลูกค้า
-• ลบแถวว่าง → "ลบแถวว่าง"
-• มาตรฐานรูปแบบ → "มาตรฐานข้อมูล"
-• ส่งออกรายงาน → "ส่งออกรายงาน"
-"""
-        messagebox.showinfo("🔍 ตัวอย่าง", examples)
+        messagebox.showinfo("🔍 ตัวอย่าง", _EXAMPLES_TEXT)
 
     def show_about(self):
         """แสดงข้อมูลเกี่ยวกับโปรแกรม"""
-        about_text = """🧹 ระบบทำความสะอาดข้อมูลแบบครบครัน 🇹🇭
-
-เวอร์ชัน: 2.0
-พัฒนาโดย: ไตรทศ ทองเกิด 097-191-2502
-
-คุณสมบัติ:
-✅ รองรับไฟล์ CSV และ Excel
-✅ การทำความสะอาดข้อมูลแบบอัตโนมัติ
-✅ ตรวจจับและจัดการค่าผิดปกติ
-✅ รายงานผลการทำความสะอาดแบบละเอียด
-✅ ระบบตั้งค่าที่ยืดหยุ่น
-✅ รองรับภาษาไทยเต็มรูปแบบ
-
-© 2025 All Rights Reserved
-"""
-        messagebox.showinfo("ℹ️ เกี่ยวกับ", about_text)
+        messagebox.showinfo("ℹ️ เกี่ยวกับ", _ABOUT_TEXT)
 
 
 def main():
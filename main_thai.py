@@ -11,14 +11,11 @@
 วันที่: มิถุนายน 2568
 """
 
-import argparse
-import logging
+import io
 import sys
-from pathlib import Path
-
-# เพิ่ม modules ไปยัง Python path
-sys.path.append(str(Path(__file__).parent / "modules"))
+from functools import lru_cache
 
+# modules เป็นแพ็กเกจ จึง import ผ่านชื่อแพ็กเกจได้โดยไม่ต้องแก้ sys.path
 # from modules.data_loader import DataLoader
 # from modules.data_cleaner import DataCleaner
 # from modules.data_transformer import DataTransformer
@@ -27,19 +24,224 @@ sys.path.append(str(Path(__file__).parent / "modules"))
 # from modules.utils import setup_logging, load_config
 
 
-def main():
+# ข้อความเมนูคงที่ สร้างครั้งเดียวตอนโหลดโมดูลแล้วเขียนออกหน้าจอในครั้งเดียว
+_INTRO_TEXT = "\n".join((
+    "=" * 60,
+    "  ระบบทำความสะอาดข้อมูล - โหมดโต้ตอบ",
+    "=" * 60,
+)) + "\n"
+
+_MAIN_MENU_TEXT = "\n".join((
+    "\n🔧 เมนูหลัก",
+    "=" * 40,
+    "1. 📂 นำเข้าข้อมูล (Import Data)",
+    "2. 👁️  ดูข้อมูล (Data Preview)",
+    "3. 🧹 กระบวนการทำความสะอาด (Data Cleansing Pipeline)",
+    "4. 📊 ตรวจสอบและรายงานผล (Validation & Reporting)",
+    "5. 💾 ส่งออกข้อมูล (Export Data)",
+    "6. ⚙️  ตั้งค่า (Settings)",
+    "7. 📋 เทมเพลต (Templates)",
+    "8. 📈 รายงาน (Reports)",
+    "0. 🚪 ออกจากโปรแกรม (Exit)",
+    "=" * 40,
+)) + "\n"
+
+_IMPORT_MENU_TEXT = "\n".join((
+    "\n📂 นำเข้าข้อมูล (Import Data)",
+    "=" * 40,
+    "1. CSV Files (.csv)",
+    "2. Excel Files (.xlsx, .xls)",
+    "3. JSON Files (.json)",
+    "4. เชื่อมต่อฐานข้อมูล (Database)",
+    "5. API Endpoint",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_PREVIEW_MENU_TEXT = "\n".join((
+    "\n👁️ ดูข้อมูล (Data Preview)",
+    "=" * 40,
+    "1. แสดงข้อมูลดิบ (Raw Data)",
+    "2. กรองข้อมูล (Filter)",
+    "3. เรียงลำดับข้อมูล (Sort)",
+    "4. ค้นหาข้อมูล (Search)",
+    "5. สถิติเบื้องต้น (Basic Statistics)",
+    "6. ข้อมูลคอลัมน์ (Column Info)",
+    "7. ตรวจสอบข้อมูลที่ขาด (Missing Data)",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_CLEAN_MENU_TEXT = "\n".join((
+    "\n🧹 กระบวนการทำความสะอาด (Data Cleansing Pipeline)",
+    "=" * 55,
+    "📋 ขั้นตอนการทำความสะอาดที่มีอยู่:",
+    "1. 🗑️  ลบแถวที่มี Missing/Null",
+    "2. 🔧 เติมค่าข้อมูลที่ขาด (Impute)",
+    "3. 🔄 ตรวจหาข้อมูลซ้ำ (Remove Duplicates)",
+    "4. 📝 แก้ไขรูปแบบข้อมูล (Formatting/Standardization)",
+    "5. 🎯 ตรวจสอบข้อมูลผิดปกติ (Outlier Detection)",
+    "6. ✅ ตรวจสอบความสอดคล้อง (Data Consistency)",
+    "7. ⚙️  สร้างกฎการทำความสะอาดแบบกำหนดเอง",
+    "8. 👀 ดูตัวอย่างก่อน-หลังการทำความสะอาด",
+    "9. 🚀 รันไปป์ไลน์ทั้งหมด",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_VALIDATION_MENU_TEXT = "\n".join((
+    "\n📊 ตรวจสอบและรายงานผล (Validation & Reporting)",
+    "=" * 55,
+    "1. 📋 สรุปปัญหาข้อมูลที่พบ",
+    "2. 🔍 แสดงผลเปรียบเทียบก่อน-หลัง Cleansing",
+    "3. 📄 สร้างรายงาน HTML",
+    "4. 📑 สร้างรายงาน PDF",
+    "5. 💾 ส่งออกสถิติเป็น CSV",
+    "6. 📈 กราฟและแผนภูมิ",
+    "7. ✅ ตรวจสอบคุณภาพข้อมูล",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_EXPORT_MENU_TEXT = "\n".join((
+    "\n💾 ส่งออกข้อมูล (Export Data)",
+    "=" * 40,
+    "1. 📊 CSV (.csv)",
+    "2. 📗 Excel (.xlsx)",
+    "3. 📄 JSON (.json)",
+    "4. 🗄️  ฐานข้อมูล (Database)",
+    "5. ☁️  Cloud Storage",
+    "6. 📈 Parquet (.parquet)",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_SETTINGS_MENU_TEXT = "\n".join((
+    "\n⚙️ ตั้งค่า (Settings)",
+    "=" * 40,
+    "1. 📏 กำหนดมาตรฐานข้อมูล",
+    "2. 👥 ตั้งค่าผู้ใช้/สิทธิ์",
+    "3. 🔗 การตั้งค่าการเชื่อมต่อ",
+    "4. 🌐 ภาษา (Language)",
+    "5. 📊 การตั้งค่าการแสดงผล",
+    "6. 🔧 การตั้งค่าขั้นสูง",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_TEMPLATES_MENU_TEXT = "\n".join((
+    "\n📋 เทมเพลต (Templates)",
+    "=" * 40,
+    "1. 📝 สร้างเทมเพลตใหม่",
+    "2. 📂 โหลดเทมเพลตที่มีอยู่",
+    "3. ✏️  แก้ไขเทมเพลต",
+    "4. 🗑️  ลบเทมเพลต",
+    "5. 📋 เทมเพลตสำเร็จรูป",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+_REPORTS_MENU_TEXT = "\n".join((
+    "\n📈 รายงาน (Reports)",
+    "=" * 40,
+    "1. 📊 ดูรายงานล่าสุด",
+    "2. 📜 ประวัติการทำความสะอาด",
+    "3. 📈 สถิติการใช้งาน",
+    "4. ❌ รายงานข้อผิดพลาด",
+    "5. 📋 รายงานสรุปประจำวัน/สัปดาห์/เดือน",
+    "0. กลับเมนูหลัก",
+)) + "\n"
+
+
+# ตัวเลือกเทมเพลตที่ถูกต้อง (ตรวจด้วยการค้นหาใน set/dict ครั้งเดียว)
+_TEMPLATE_CHOICES = frozenset("1234")
+
+_TEMPLATE_NAMES = {
+    "1": "Customer Data Cleansing",
+    "2": "Sales Data Processing",
+    "3": "Survey Data Cleaning",
+    "4": "Financial Data Preparation",
+}
+
+# ตารางตัวอย่างคงที่ของเมนูย่อย
+_CLEAN_PREVIEW_TEXT = "\n".join((
+    "👀 ดูตัวอย่างก่อน-หลังการทำความสะอาด",
+    "=" * 50,
+    "📊 ข้อมูลก่อนทำความสะอาด:",
+    "| ID | Name     | Age | Email           |",
+    "|----|----------|-----|-----------------|",
+    "| 1  | john doe | 25  | john@email.com  |",
+    "| 2  | JANE     | NaN | invalid-email   |",
+    "| 3  |   Bob    | 30  | bob@email.com   |",
+    "",
+    "✨ ข้อมูลหลังทำความสะอาด:",
+    "| ID | Name     | Age | Email           |",
+    "|----|----------|-----|-----------------|",
+    "| 1  | John Doe | 25  | john@email.com  |",
+    "| 2  | Jane     | 27  | jane@email.com  |",
+    "| 3  | Bob      | 30  | bob@email.com   |",
+    "",
+    "📈 สรุปการเปลี่ยนแปลง:",
+    "- แก้ไขรูปแบบชื่อ: 3 แถว",
+    "- เติมข้อมูลอายุที่ขาด: 1 แถว",
+    "- แก้ไขอีเมลที่ไม่ถูกต้อง: 1 แถว",
+)) + "\n"
+
+_LATEST_REPORT_TEXT = "\n".join((
+    "📊 รายงานล่าสุด",
+    "=" * 40,
+    "📅 วันที่: 7 มิถุนายน 2568",
+    "⏰ เวลา: 14:30:25",
+    "📁 ไฟล์: customer_data.csv",
+    "📊 ผลลัพธ์:",
+    "- แถวที่ประมวลผล: 1,000",
+    "- แถวที่ลบ: 8 (ข้อมูลซ้ำ)",
+    "- ข้อมูลที่แก้ไข: 15 จุด",
+    "- เวลาที่ใช้: 2.5 วินาที",
+    "✅ สถานะ: เสร็จสิ้น",
+)) + "\n"
+
+_HISTORY_REPORT_TEXT = "\n".join((
+    "📜 ประวัติการทำความสะอาด",
+    "=" * 50,
+    "| วันที่       | ไฟล์              | แถว   | สถานะ  |",
+    "|-------------|------------------|-------|-------|",
+    "| 07/06/2568  | customer_data.csv| 1,000 | ✅    |",
+    "| 06/06/2568  | sales_data.xlsx  | 2,500 | ✅    |",
+    "| 05/06/2568  | survey_data.json | 800   | ❌    |",
+    "| 04/06/2568  | product_data.csv | 1,200 | ✅    |",
+)) + "\n"
+
+_ERROR_REPORT_TEXT = "\n".join((
+    "❌ รายงานข้อผิดพลาด",
+    "=" * 40,
+    "🔍 ข้อผิดพลาดล่าสุด:",
+    "| เวลา    | ไฟล์         | ข้อผิดพลาด              |",
+    "|---------|-------------|------------------------|",
+    "| 14:25   | data.csv    | ไม่พบคอลัมน์ 'age'      |",
+    "| 13:10   | sales.xlsx  | รูปแบบวันที่ไม่ถูกต้อง   |",
+    "| 12:45   | survey.json | ไฟล์เสียหาย             |",
+)) + "\n"
+
+
+def _is_interactive(argv):
+    """ตรวจล่วงหน้าว่าบรรทัดคำสั่งขอโหมดโต้ตอบหรือไม่ (-i, -vi, --interactive)"""
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg.startswith("--"):
+            # argparse ยอมรับชื่อย่อของ option ที่ไม่กำกวม เช่น --inter
+            if len(arg) > 4 and "--interactive".startswith(arg):
+                return True
+        elif arg.startswith("-") and "i" in arg[1:]:
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def _build_parser(interactive=False):
     """
-    จุดเริ่มต้นหลักของระบบทำความสะอาดข้อมูล
+    สร้างตัวแยกอาร์กิวเมนต์บรรทัดคำสั่ง (สร้างครั้งเดียวแล้วใช้ซ้ำ)
     
-    ฟังก์ชันนี้ดำเนินการประสานงานกระบวนการทำความสะอาดข้อมูลทั้งหมด ประกอบด้วย:
-    - โหลดการตั้งค่า
-    - นำเข้าข้อมูล
-    - เตรียมข้อมูลเบื้องต้น
-    - ขั้นตอนการทำความสะอาด
-    - การแปลงข้อมูล
-    - การตรวจสอบและรายงาน
-    - ส่งออกผลลัพธ์
+    --input และ --output จำเป็นต้องระบุ ยกเว้นในโหมดโต้ตอบ
+    import argparse ภายในฟังก์ชัน เพื่อไม่ให้โหลดตอน import โมดูล
     """
+    import argparse
+    from pathlib import Path
+
     parser = argparse.ArgumentParser(
         description="ระบบทำความสะอาดข้อมูล - ทำความสะอาดและแปลงข้อมูลของคุณ"
     )
@@ -50,11 +252,15 @@ def main():
     )
     parser.add_argument(
         "--input", 
-        help="เส้นทางไปยังไฟล์ข้อมูลต้นฉบับ"
+        type=Path,
+        required=not interactive,
+        help="เส้นทางไปยังไฟล์ข้อมูลต้นฉบับ (จำเป็น ยกเว้นโหมด -i)"
     )
     parser.add_argument(
         "--output", 
-        help="เส้นทางไปยังไฟล์ข้อมูลที่ส่งออก"
+        type=Path,
+        required=not interactive,
+        help="เส้นทางไปยังไฟล์ข้อมูลที่ส่งออก (จำเป็น ยกเว้นโหมด -i)"
     )
     parser.add_argument(
         "--verbose", "-v", 
@@ -66,57 +272,75 @@ def main():
         action="store_true",
         help="เรียกใช้ในโหมดโต้ตอบ"
     )
+    return parser
+
+
+# ขั้นตอนของไปป์ไลน์: (ไอคอน, คำอธิบาย, ข้อความ log และชื่ออาร์กิวเมนต์ที่ใช้ หรือ None)
+# ขั้นตอนยังไม่มีการทำงานจริง จึงแสดงเฉพาะหัวข้อและ log
+_STAGES = (
+    ("📂", "นำเข้าข้อมูล", ("กำลังโหลดข้อมูลจาก: %s", "input")),
+    ("🔧", "เตรียมข้อมูลเบื้องต้น", None),
+    ("🧹", "ทำความสะอาดข้อมูล", None),
+    ("🔄", "แปลงข้อมูล", None),
+    ("📊", "ตรวจสอบและสร้างรายงาน", None),
+    ("💾", "ส่งออกผลลัพธ์", ("บันทึกข้อมูลที่สะอาดแล้วไปยัง: %s", "output")),
+)
+
+
+def main():
+    """
+    จุดเริ่มต้นหลักของระบบทำความสะอาดข้อมูล
     
-    args = parser.parse_args()
+    ฟังก์ชันนี้ดำเนินการประสานงานกระบวนการทำความสะอาดข้อมูลทั้งหมด ประกอบด้วย:
+    - โหลดการตั้งค่า
+    - นำเข้าข้อมูล
+    - เตรียมข้อมูลเบื้องต้น
+    - ขั้นตอนการทำความสะอาด
+    - การแปลงข้อมูล
+    - การตรวจสอบและรายงาน
+    - ส่งออกผลลัพธ์
+    """
+    argv = sys.argv[1:]
+    args = _build_parser(_is_interactive(argv)).parse_args(argv)
     
     # ตรวจสอบโหมดโต้ตอบ
     if args.interactive:
         interactive_mode()
         return
     
-    # ตรวจสอบการระบุไฟล์
-    if not args.input or not args.output:
-        print("❌ กรุณาระบุไฟล์ input และ output หรือใช้โหมดโต้ตอบ (-i)")
-        parser.print_help()
-        return
-    
     # ตั้งค่าการบันทึก log
+    import logging
+
     log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    # ไม่ต้องเก็บข้อมูลเธรด/โปรเซสในทุก record เพราะรูปแบบ log ไม่ได้ใช้
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            "{asctime} - {name} - {levelname} - {message}", style="{"
+        ))
+        root_logger.addHandler(handler)
+        root_logger.setLevel(log_level)
     logger = logging.getLogger(__name__)
     
     try:
         print("🚀 เริ่มต้นระบบทำความสะอาดข้อมูล")
         print("=" * 50)
         
-        # ขั้นตอนที่ 1: นำเข้าข้อมูล
-        print("📂 ขั้นตอนที่ 1: กำลังนำเข้าข้อมูล...")
-        logger.info(f"กำลังโหลดข้อมูลจาก: {args.input}")
-        
-        # ขั้นตอนที่ 2: เตรียมข้อมูลเบื้องต้น
-        print("🔧 ขั้นตอนที่ 2: กำลังเตรียมข้อมูลเบื้องต้น...")
-        
-        # ขั้นตอนที่ 3: ทำความสะอาดข้อมูล
-        print("🧹 ขั้นตอนที่ 3: กำลังทำความสะอาดข้อมูล...")
-        
-        # ขั้นตอนที่ 4: แปลงข้อมูล
-        print("🔄 ขั้นตอนที่ 4: กำลังแปลงข้อมูล...")
-        
-        # ขั้นตอนที่ 5: ตรวจสอบและรายงาน
-        print("📊 ขั้นตอนที่ 5: กำลังตรวจสอบและสร้างรายงาน...")
-        
-        # ขั้นตอนที่ 6: ส่งออกผลลัพธ์
-        print("💾 ขั้นตอนที่ 6: กำลังส่งออกผลลัพธ์...")
-        logger.info(f"บันทึกข้อมูลที่สะอาดแล้วไปยัง: {args.output}")
+        for number, (icon, description, log) in enumerate(_STAGES, 1):
+            print(f"{icon} ขั้นตอนที่ {number}: กำลัง{description}...")
+            if log is not None:
+                message, arg_name = log
+                logger.info(message, getattr(args, arg_name))
         
         print("✅ ระบบทำความสะอาดข้อมูลเสร็จสิ้นเรียบร้อยแล้ว!")
         print(f"📁 ข้อมูลที่สะอาดแล้วบันทึกไว้ที่: {args.output}")
         
     except Exception as e:
-        logger.error(f"❌ ระบบล้มเหลว: {str(e)}")
+        logger.error("❌ ระบบล้มเหลว: %s", e)
         raise
 
 
@@ -124,582 +348,612 @@ def interactive_mode():
     """
     เรียกใช้ระบบในโหมดโต้ตอบพร้อมคำสั่งสำหรับผู้ใช้
     """
-    print("=" * 60)
-    print("  ระบบทำความสะอาดข้อมูล - โหมดโต้ตอบ")
-    print("=" * 60)
-    
-    while True:
-        print("\n🔧 เมนูหลัก")
-        print("=" * 40)
-        print("1. 📂 นำเข้าข้อมูล (Import Data)")
-        print("2. 👁️  ดูข้อมูล (Data Preview)")
-        print("3. 🧹 กระบวนการทำความสะอาด (Data Cleansing Pipeline)")
-        print("4. 📊 ตรวจสอบและรายงานผล (Validation & Reporting)")
-        print("5. 💾 ส่งออกข้อมูล (Export Data)")
-        print("6. ⚙️  ตั้งค่า (Settings)")
-        print("7. 📋 เทมเพลต (Templates)")
-        print("8. 📈 รายงาน (Reports)")
-        print("0. 🚪 ออกจากโปรแกรม (Exit)")
-        print("=" * 40)
+    # บัฟเฟอร์ข้อความทั้งเมนูแล้วเขียนครั้งเดียว (input() จะ flush ให้ก่อนรอรับค่า)
+    stdout = _install_buffered_stdout()
+    try:
+        # ผูกฟังก์ชันที่เรียกทุกรอบไว้ในตัวแปรท้องถิ่น
+        write = sys.stdout.write
+        dispatch = _dispatch
+        write(_INTRO_TEXT)
         
-        choice = input("\n🔸 กรุณาเลือกเมนู (0-8): ").strip()
+        def read_choice():
+            write(_MAIN_MENU_TEXT)
+            return input("\n🔸 กรุณาเลือกเมนู (0-8): ").strip()
         
-        if choice == "1":
-            import_data_menu()
-        elif choice == "2":
-            data_preview_menu()
-        elif choice == "3":
-            cleansing_pipeline_menu()
-        elif choice == "4":
-            validation_reporting_menu()
-        elif choice == "5":
-            export_data_menu()
-        elif choice == "6":
-            settings_menu()
-        elif choice == "7":
-            templates_menu()
-        elif choice == "8":
-            reports_menu()
-        elif choice == "0":
-            print("\n👋 ขอบคุณที่ใช้ระบบทำความสะอาดข้อมูล!")
-            break
-        else:
-            print("❌ กรุณาเลือกตัวเลข 0-8 เท่านั้น")
+        # วนรับเมนูจนกว่าผู้ใช้จะเลือก "0"
+        for choice in iter(read_choice, "0"):
+            dispatch(_MAIN_MENU, choice, 8)
+        print("\n👋 ขอบคุณที่ใช้ระบบทำความสะอาดข้อมูล!")
+    finally:
+        _restore_stdout(stdout)
+
+
+def _install_buffered_stdout():
+    """
+    เปลี่ยน sys.stdout เป็นแบบบัฟเฟอร์เต็มบล็อก และคืน stdout เดิม
+    
+    ถ้า stdout ปัจจุบันไม่มี buffer ให้ห่อ (เช่น StringIO) จะใช้ตัวเดิมต่อไป
+    """
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is not None:
+        stdout.flush()
+        sys.stdout = io.TextIOWrapper(
+            buffer,
+            encoding=stdout.encoding,
+            errors=stdout.errors,
+            line_buffering=False,
+            write_through=False,
+        )
+    return stdout
+
+
+def _restore_stdout(stdout):
+    """เขียนข้อความที่ค้างในบัฟเฟอร์แล้วคืนค่า sys.stdout เดิม"""
+    if sys.stdout is not stdout:
+        sys.stdout.flush()
+        # detach เพื่อไม่ให้ wrapper ปิด buffer ของ stdout เดิม
+        sys.stdout.detach()
+        sys.stdout = stdout
+
+
+def _dispatch(menu, choice, last):
+    """
+    เรียกฟังก์ชันของตัวเลือกจากตารางเมนู
+    
+    ตัวเลือก "0" คือกลับเมนูก่อนหน้า ตัวเลือกที่ไม่มีในตารางจะแสดงข้อความเตือน
+    """
+    action = menu.get(choice)
+    if action is not None:
+        action()
+    elif choice != "0":
+        print(f"❌ กรุณาเลือกตัวเลข 0-{last} เท่านั้น")
+
+
+def _prompt(message, error=None):
+    """
+    รับข้อความจากผู้ใช้โดยตัดช่องว่างหัวท้าย
+    
+    คืน None เมื่อผู้ใช้ไม่ได้พิมพ์อะไร และแสดงข้อความ error ถ้ากำหนดไว้
+    """
+    value = input(message).strip()
+    if not value:
+        if error:
+            print(error)
+        return None
+    return value
 
 
 def import_data_menu():
     """เมนูนำเข้าข้อมูล"""
-    print("\n📂 นำเข้าข้อมูล (Import Data)")
-    print("=" * 40)
-    print("1. CSV Files (.csv)")
-    print("2. Excel Files (.xlsx, .xls)")
-    print("3. JSON Files (.json)")
-    print("4. เชื่อมต่อฐานข้อมูล (Database)")
-    print("5. API Endpoint")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_IMPORT_MENU_TEXT)
     
     choice = input("\n🔸 เลือกแหล่งข้อมูล: ").strip()
-    
-    if choice == "1":
-        file_path = input("📁 ใส่เส้นทางไฟล์ CSV: ").strip()
-        if file_path:
-            print(f"✅ กำลังโหลดไฟล์: {file_path}")
-            # TODO: Implement CSV loading
-            print("📊 แสดงตัวอย่างข้อมูล 5 แถวแรก...")
-        else:
-            print("❌ กรุณาใส่เส้นทางไฟล์")
-    elif choice == "2":
-        file_path = input("📁 ใส่เส้นทางไฟล์ Excel: ").strip()
-        if file_path:
-            print(f"✅ กำลังโหลดไฟล์: {file_path}")
-            # TODO: Implement Excel loading
-        else:
-            print("❌ กรุณาใส่เส้นทางไฟล์")
-    elif choice == "3":
-        file_path = input("📁 ใส่เส้นทางไฟล์ JSON: ").strip()
-        if file_path:
-            print(f"✅ กำลังโหลดไฟล์: {file_path}")
-            # TODO: Implement JSON loading
-        else:
-            print("❌ กรุณาใส่เส้นทางไฟล์")
-    elif choice == "4":
-        print("🔗 การเชื่อมต่อฐานข้อมูล")
-        db_type = input("เลือกประเภทฐานข้อมูล (MySQL/PostgreSQL/SQLite): ").strip()
-        if db_type:
-            print(f"✅ กำลังเชื่อมต่อ {db_type}")
-            # TODO: Implement database connection
-        else:
-            print("❌ กรุณาเลือกประเภทฐานข้อมูล")
-    elif choice == "5":
-        api_url = input("🌐 ใส่ URL ของ API: ").strip()
-        if api_url:
-            print(f"✅ กำลังเชื่อมต่อ API: {api_url}")
-            # TODO: Implement API connection
-        else:
-            print("❌ กรุณาใส่ URL ของ API")
-    elif choice == "0":
+    _dispatch(_IMPORT_MENU, choice, 5)
+
+
+def _import_csv():
+    """นำเข้าไฟล์ CSV"""
+    file_path = _prompt("📁 ใส่เส้นทางไฟล์ CSV: ", "❌ กรุณาใส่เส้นทางไฟล์")
+    if file_path is None:
         return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-5 เท่านั้น")
+    print(f"✅ กำลังโหลดไฟล์: {file_path}")
+    # TODO: Implement CSV loading
+    print("📊 แสดงตัวอย่างข้อมูล 5 แถวแรก...")
+
+
+def _import_excel():
+    """นำเข้าไฟล์ Excel"""
+    file_path = _prompt("📁 ใส่เส้นทางไฟล์ Excel: ", "❌ กรุณาใส่เส้นทางไฟล์")
+    if file_path is None:
+        return
+    print(f"✅ กำลังโหลดไฟล์: {file_path}")
+    # TODO: Implement Excel loading
+
+
+def _import_json():
+    """นำเข้าไฟล์ JSON"""
+    file_path = _prompt("📁 ใส่เส้นทางไฟล์ JSON: ", "❌ กรุณาใส่เส้นทางไฟล์")
+    if file_path is None:
+        return
+    print(f"✅ กำลังโหลดไฟล์: {file_path}")
+    # TODO: Implement JSON loading
+
+
+def _import_database():
+    """เชื่อมต่อฐานข้อมูล"""
+    print("🔗 การเชื่อมต่อฐานข้อมูล")
+    db_type = _prompt("เลือกประเภทฐานข้อมูล (MySQL/PostgreSQL/SQLite): ",
+                      "❌ กรุณาเลือกประเภทฐานข้อมูล")
+    if db_type is None:
+        return
+    print(f"✅ กำลังเชื่อมต่อ {db_type}")
+    # TODO: Implement database connection
+
+
+def _import_api():
+    """นำเข้าข้อมูลจาก API"""
+    api_url = _prompt("🌐 ใส่ URL ของ API: ", "❌ กรุณาใส่ URL ของ API")
+    if api_url is None:
+        return
+    print(f"✅ กำลังเชื่อมต่อ API: {api_url}")
+    # TODO: Implement API connection
+
+
+_IMPORT_MENU = {
+    "1": _import_csv,
+    "2": _import_excel,
+    "3": _import_json,
+    "4": _import_database,
+    "5": _import_api,
+}
 
 
 def data_preview_menu():
     """เมนูดูข้อมูล"""
-    print("\n👁️ ดูข้อมูล (Data Preview)")
-    print("=" * 40)
-    print("1. แสดงข้อมูลดิบ (Raw Data)")
-    print("2. กรองข้อมูล (Filter)")
-    print("3. เรียงลำดับข้อมูล (Sort)")
-    print("4. ค้นหาข้อมูล (Search)")
-    print("5. สถิติเบื้องต้น (Basic Statistics)")
-    print("6. ข้อมูลคอลัมน์ (Column Info)")
-    print("7. ตรวจสอบข้อมูลที่ขาด (Missing Data)")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_PREVIEW_MENU_TEXT)
     
     choice = input("\n🔸 เลือกการดูข้อมูล: ").strip()
-    
-    if choice == "1":
-        print("📊 แสดงข้อมูลดิบ...")
-        # TODO: Implement raw data display
-    elif choice == "2":
-        print("🔍 กรองข้อมูล...")
-        column = input("ใส่ชื่อคอลัมน์ที่ต้องการกรอง: ").strip()
-        if column:
-            value = input(f"ใส่ค่าที่ต้องการกรองในคอลัมน์ {column}: ").strip()
-            print(f"✅ กรองข้อมูลคอลัมน์ {column} = {value}")
-            # TODO: Implement filtering
-    elif choice == "5":
-        print("📈 สถิติเบื้องต้น...")
-        # TODO: Implement basic statistics
-        print("- จำนวนแถวทั้งหมด: N/A")
-        print("- จำนวนคอลัมน์: N/A")
-        print("- ข้อมูลที่ขาด: N/A")
-        print("- ข้อมูลซ้ำ: N/A")
-    elif choice == "0":
+    _dispatch(_PREVIEW_MENU, choice, 7)
+
+
+def _preview_raw():
+    """แสดงข้อมูลดิบ"""
+    print("📊 แสดงข้อมูลดิบ...")
+    # TODO: Implement raw data display
+
+
+def _preview_filter():
+    """กรองข้อมูล"""
+    print("🔍 กรองข้อมูล...")
+    column = _prompt("ใส่ชื่อคอลัมน์ที่ต้องการกรอง: ")
+    if column is None:
         return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-7 เท่านั้น")
+    value = input(f"ใส่ค่าที่ต้องการกรองในคอลัมน์ {column}: ").strip()
+    print(f"✅ กรองข้อมูลคอลัมน์ {column} = {value}")
+    # TODO: Implement filtering
+
+
+def _preview_statistics():
+    """สถิติเบื้องต้น"""
+    print("📈 สถิติเบื้องต้น...")
+    # TODO: Implement basic statistics
+    print("- จำนวนแถวทั้งหมด: N/A")
+    print("- จำนวนคอลัมน์: N/A")
+    print("- ข้อมูลที่ขาด: N/A")
+    print("- ข้อมูลซ้ำ: N/A")
+
+
+_PREVIEW_MENU = {
+    "1": _preview_raw,
+    "2": _preview_filter,
+    "5": _preview_statistics,
+}
 
 
 def cleansing_pipeline_menu():
     """เมนูกระบวนการทำความสะอาด"""
-    print("\n🧹 กระบวนการทำความสะอาด (Data Cleansing Pipeline)")
-    print("=" * 55)
-    print("📋 ขั้นตอนการทำความสะอาดที่มีอยู่:")
-    print("1. 🗑️  ลบแถวที่มี Missing/Null")
-    print("2. 🔧 เติมค่าข้อมูลที่ขาด (Impute)")
-    print("3. 🔄 ตรวจหาข้อมูลซ้ำ (Remove Duplicates)")
-    print("4. 📝 แก้ไขรูปแบบข้อมูล (Formatting/Standardization)")
-    print("5. 🎯 ตรวจสอบข้อมูลผิดปกติ (Outlier Detection)")
-    print("6. ✅ ตรวจสอบความสอดคล้อง (Data Consistency)")
-    print("7. ⚙️  สร้างกฎการทำความสะอาดแบบกำหนดเอง")
-    print("8. 👀 ดูตัวอย่างก่อน-หลังการทำความสะอาด")
-    print("9. 🚀 รันไปป์ไลน์ทั้งหมด")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_CLEAN_MENU_TEXT)
     
     choice = input("\n🔸 เลือกขั้นตอนการทำความสะอาด: ").strip()
-    
-    if choice == "1":
-        print("🗑️ ลบแถวที่มี Missing/Null")
-        print("1. ลบแถวที่มีค่าว่างทั้งหมด")
-        print("2. ลบแถวที่มีค่าว่างในคอลัมน์ที่กำหนด")
-        print("3. ลบแถวที่มีค่าว่างมากกว่าเปอร์เซ็นต์ที่กำหนด")
-        sub_choice = input("เลือกวิธีการลบ: ").strip()
-        if sub_choice == "1":
-            print("✅ กำลังลบแถวที่มีค่าว่างทั้งหมด...")
-        elif sub_choice == "2":
-            column = input("ใส่ชื่อคอลัมน์: ").strip()
-            print(f"✅ กำลังลบแถวที่มีค่าว่างในคอลัมน์ {column}...")
-        # TODO: Implement missing data removal
-        
-    elif choice == "2":
-        print("🔧 เติมค่าข้อมูลที่ขาด (Impute)")
-        print("1. เติมด้วยค่าเฉลี่ย (Mean)")
-        print("2. เติมด้วยค่ากลาง (Median)")
-        print("3. เติมด้วยค่าที่พบบ่อยที่สุด (Mode)")
-        print("4. เติมด้วยค่าคงที่")
-        print("5. เติมด้วยค่าก่อนหน้า (Forward Fill)")
-        sub_choice = input("เลือกวิธีการเติมค่า: ").strip()
-        if sub_choice == "4":
-            value = input("ใส่ค่าคงที่ที่ต้องการเติม: ").strip()
-            print(f"✅ กำลังเติมค่าข้อมูลที่ขาดด้วย: {value}")
-        else:
-            print(f"✅ กำลังเติมค่าข้อมูลที่ขาดด้วยวิธีที่เลือก...")
-        # TODO: Implement data imputation
-        
-    elif choice == "3":
-        print("🔄 ตรวจหาข้อมูลซ้ำ (Remove Duplicates)")
-        print("1. ลบข้อมูลซ้ำทั้งหมด")
-        print("2. ลบข้อมูลซ้ำตามคอลัมน์ที่กำหนด")
-        print("3. เก็บแถวแรก")
-        print("4. เก็บแถวสุดท้าย")
-        sub_choice = input("เลือกวิธีการจัดการข้อมูลซ้ำ: ").strip()
-        if sub_choice == "2":
-            columns = input("ใส่ชื่อคอลัมน์ (คั่นด้วยจุลภาค): ").strip()
-            print(f"✅ กำลังลบข้อมูลซ้ำในคอลัมน์: {columns}")
-        else:
-            print("✅ กำลังลบข้อมูลซ้ำ...")
-        # TODO: Implement duplicate removal
-        
-    elif choice == "4":
-        print("📝 แก้ไขรูปแบบข้อมูล (Formatting/Standardization)")
-        print("1. แปลงข้อความเป็นตัวพิมพ์เล็ก")
-        print("2. แปลงข้อความเป็นตัวพิมพ์ใหญ่")
-        print("3. ลบช่องว่างข้างหน้าและข้างหลัง")
-        print("4. แปลงรูปแบบวันที่")
-        print("5. แปลงรูปแบบตัวเลข")
-        sub_choice = input("เลือกการแปลงรูปแบบ: ").strip()
-        if sub_choice == "4":
-            date_format = input("ใส่รูปแบบวันที่ที่ต้องการ (เช่น YYYY-MM-DD): ").strip()
-            print(f"✅ กำลังแปลงรูปแบบวันที่เป็น: {date_format}")
-        else:
-            print("✅ กำลังแปลงรูปแบบข้อมูล...")
-        # TODO: Implement data formatting
-        
-    elif choice == "8":
-        print("👀 ดูตัวอย่างก่อน-หลังการทำความสะอาด")
-        print("=" * 50)
-        print("📊 ข้อมูลก่อนทำความสะอาด:")
-        print("| ID | Name     | Age | Email           |")
-        print("|----|----------|-----|-----------------|")
-        print("| 1  | john doe | 25  | john@email.com  |")
-        print("| 2  | JANE     | NaN | invalid-email   |")
-        print("| 3  |   Bob    | 30  | bob@email.com   |")
-        print()
-        print("✨ ข้อมูลหลังทำความสะอาด:")
-        print("| ID | Name     | Age | Email           |")
-        print("|----|----------|-----|-----------------|")
-        print("| 1  | John Doe | 25  | john@email.com  |")
-        print("| 2  | Jane     | 27  | jane@email.com  |")
-        print("| 3  | Bob      | 30  | bob@email.com   |")
-        print()
-        print("📈 สรุปการเปลี่ยนแปลง:")
-        print("- แก้ไขรูปแบบชื่อ: 3 แถว")
-        print("- เติมข้อมูลอายุที่ขาด: 1 แถว")
-        print("- แก้ไขอีเมลที่ไม่ถูกต้อง: 1 แถว")
-        
-    elif choice == "9":
-        print("🚀 รันไปป์ไลน์ทั้งหมด")
-        print("กำลังดำเนินการ:")
-        print("1. ✅ ลบแถวที่มี Missing/Null")
-        print("2. ✅ เติมค่าข้อมูลที่ขาด")
-        print("3. ✅ ลบข้อมูลซ้ำ")
-        print("4. ✅ แก้ไขรูปแบบข้อมูล")
-        print("5. ✅ ตรวจสอบข้อมูลผิดปกติ")
-        print("6. ✅ ตรวจสอบความสอดคล้อง")
-        print("🎉 ไปป์ไลน์เสร็จสิ้น!")
-        
-    elif choice == "0":
-        return
+    _dispatch(_CLEAN_MENU, choice, 9)
+
+
+def _clean_remove_missing():
+    """ลบแถวที่มีค่าว่าง"""
+    print("🗑️ ลบแถวที่มี Missing/Null")
+    print("1. ลบแถวที่มีค่าว่างทั้งหมด")
+    print("2. ลบแถวที่มีค่าว่างในคอลัมน์ที่กำหนด")
+    print("3. ลบแถวที่มีค่าว่างมากกว่าเปอร์เซ็นต์ที่กำหนด")
+    sub_choice = input("เลือกวิธีการลบ: ").strip()
+    if sub_choice == "1":
+        print("✅ กำลังลบแถวที่มีค่าว่างทั้งหมด...")
+    elif sub_choice == "2":
+        column = input("ใส่ชื่อคอลัมน์: ").strip()
+        print(f"✅ กำลังลบแถวที่มีค่าว่างในคอลัมน์ {column}...")
+    # TODO: Implement missing data removal
+
+
+def _clean_impute():
+    """เติมค่าข้อมูลที่ขาด"""
+    print("🔧 เติมค่าข้อมูลที่ขาด (Impute)")
+    print("1. เติมด้วยค่าเฉลี่ย (Mean)")
+    print("2. เติมด้วยค่ากลาง (Median)")
+    print("3. เติมด้วยค่าที่พบบ่อยที่สุด (Mode)")
+    print("4. เติมด้วยค่าคงที่")
+    print("5. เติมด้วยค่าก่อนหน้า (Forward Fill)")
+    sub_choice = input("เลือกวิธีการเติมค่า: ").strip()
+    if sub_choice == "4":
+        value = input("ใส่ค่าคงที่ที่ต้องการเติม: ").strip()
+        print(f"✅ กำลังเติมค่าข้อมูลที่ขาดด้วย: {value}")
+    else:
+        print(f"✅ กำลังเติมค่าข้อมูลที่ขาดด้วยวิธีที่เลือก...")
+    # TODO: Implement data imputation
+
+
+def _clean_duplicates():
+    """จัดการข้อมูลซ้ำ"""
+    print("🔄 ตรวจหาข้อมูลซ้ำ (Remove Duplicates)")
+    print("1. ลบข้อมูลซ้ำทั้งหมด")
+    print("2. ลบข้อมูลซ้ำตามคอลัมน์ที่กำหนด")
+    print("3. เก็บแถวแรก")
+    print("4. เก็บแถวสุดท้าย")
+    sub_choice = input("เลือกวิธีการจัดการข้อมูลซ้ำ: ").strip()
+    if sub_choice == "2":
+        columns = input("ใส่ชื่อคอลัมน์ (คั่นด้วยจุลภาค): ").strip()
+        print(f"✅ กำลังลบข้อมูลซ้ำในคอลัมน์: {columns}")
+    else:
+        print("✅ กำลังลบข้อมูลซ้ำ...")
+    # TODO: Implement duplicate removal
+
+
+def _clean_formatting():
+    """แก้ไขรูปแบบข้อมูล"""
+    print("📝 แก้ไขรูปแบบข้อมูล (Formatting/Standardization)")
+    print("1. แปลงข้อความเป็นตัวพิมพ์เล็ก")
+    print("2. แปลงข้อความเป็นตัวพิมพ์ใหญ่")
+    print("3. ลบช่องว่างข้างหน้าและข้างหลัง")
+    print("4. แปลงรูปแบบวันที่")
+    print("5. แปลงรูปแบบตัวเลข")
+    sub_choice = input("เลือกการแปลงรูปแบบ: ").strip()
+    if sub_choice == "4":
+        date_format = input("ใส่รูปแบบวันที่ที่ต้องการ (เช่น YYYY-MM-DD): ").strip()
+        print(f"✅ กำลังแปลงรูปแบบวันที่เป็น: {date_format}")
     else:
-        print("❌ กรุณาเลือกตัวเลข 0-9 เท่านั้น")
+        print("✅ กำลังแปลงรูปแบบข้อมูล...")
+    # TODO: Implement data formatting
+
+
+def _clean_preview():
+    """แสดงตัวอย่างก่อน-หลังการทำความสะอาด"""
+    sys.stdout.write(_CLEAN_PREVIEW_TEXT)
+
+
+def _clean_run_all():
+    """รันไปป์ไลน์ทั้งหมด"""
+    print("🚀 รันไปป์ไลน์ทั้งหมด")
+    print("กำลังดำเนินการ:")
+    print("1. ✅ ลบแถวที่มี Missing/Null")
+    print("2. ✅ เติมค่าข้อมูลที่ขาด")
+    print("3. ✅ ลบข้อมูลซ้ำ")
+    print("4. ✅ แก้ไขรูปแบบข้อมูล")
+    print("5. ✅ ตรวจสอบข้อมูลผิดปกติ")
+    print("6. ✅ ตรวจสอบความสอดคล้อง")
+    print("🎉 ไปป์ไลน์เสร็จสิ้น!")
+
+
+_CLEAN_MENU = {
+    "1": _clean_remove_missing,
+    "2": _clean_impute,
+    "3": _clean_duplicates,
+    "4": _clean_formatting,
+    "8": _clean_preview,
+    "9": _clean_run_all,
+}
 
 
 def validation_reporting_menu():
     """เมนูตรวจสอบและรายงาน"""
-    print("\n📊 ตรวจสอบและรายงานผล (Validation & Reporting)")
-    print("=" * 55)
-    print("1. 📋 สรุปปัญหาข้อมูลที่พบ")
-    print("2. 🔍 แสดงผลเปรียบเทียบก่อน-หลัง Cleansing")
-    print("3. 📄 สร้างรายงาน HTML")
-    print("4. 📑 สร้างรายงาน PDF")
-    print("5. 💾 ส่งออกสถิติเป็น CSV")
-    print("6. 📈 กราฟและแผนภูมิ")
-    print("7. ✅ ตรวจสอบคุณภาพข้อมูล")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_VALIDATION_MENU_TEXT)
     
     choice = input("\n🔸 เลือกประเภทรายงาน: ").strip()
-    
-    if choice == "1":
-        print("📋 สรุปปัญหาข้อมูลที่พบ")
-        print("=" * 40)
-        print("🔍 ผลการตรวจสอบ:")
-        print("- ข้อมูลที่ขาด (Missing): 15 จุด (3.2%)")
-        print("- ข้อมูลซ้ำ (Duplicates): 8 แถว (1.7%)")
-        print("- ข้อมูลผิดปกติ (Outliers): 5 จุด (1.1%)")
-        print("- รูปแบบไม่ถูกต้อง: 12 จุด (2.6%)")
-        print("- ค่าไม่สอดคล้อง: 3 จุด (0.6%)")
-        
-    elif choice == "2":
-        print("🔍 แสดงผลเปรียบเทียบก่อน-หลัง Cleansing")
-        print("=" * 50)
-        print("📊 ก่อนการทำความสะอาด:")
-        print("- จำนวนแถว: 1,000")
-        print("- จำนวนคอลัมน์: 15")
-        print("- ข้อมูลที่ขาด: 15 จุด")
-        print("- ข้อมูลซ้ำ: 8 แถว")
-        print()
-        print("✨ หลังการทำความสะอาด:")
-        print("- จำนวนแถว: 992")
-        print("- จำนวนคอลัมน์: 15")
-        print("- ข้อมูลที่ขาด: 0 จุด")
-        print("- ข้อมูลซ้ำ: 0 แถว")
-        print()
-        print("📈 การปรับปรุง:")
-        print("- คุณภาพข้อมูล: 92.5% → 100%")
-        print("- ความสมบูรณ์: 96.8% → 100%")
-        
-    elif choice == "3":
-        print("📄 สร้างรายงาน HTML")
-        report_name = input("ใส่ชื่อไฟล์รายงาน: ").strip()
-        if report_name:
-            print(f"✅ กำลังสร้างรายงาน HTML: {report_name}.html")
-            # TODO: Implement HTML report generation
-        else:
-            print("❌ กรุณาใส่ชื่อไฟล์รายงาน")
-            
-    elif choice == "7":
-        print("✅ ตรวจสอบคุณภาพข้อมูล")
-        print("=" * 40)
-        print("🎯 คะแนนคุณภาพข้อมูล: 87/100")
-        print()
-        print("📊 รายละเอียด:")
-        print("- ความสมบูรณ์ (Completeness): 95%")
-        print("- ความถูกต้อง (Accuracy): 92%")
-        print("- ความสอดคล้อง (Consistency): 88%")
-        print("- ความเป็นปัจจุบัน (Timeliness): 90%")
-        print("- ความไม่ซ้ำ (Uniqueness): 98%")
-        print()
-        print("💡 คำแนะนำ:")
-        print("- ปรับปรุงความสอดคล้องของข้อมูลในคอลัมน์ 'category'")
-        print("- ตรวจสอบข้อมูลที่มีรูปแบบวันที่ไม่ถูกต้อง")
-        
-    elif choice == "0":
+    _dispatch(_VALIDATION_MENU, choice, 7)
+
+
+def _validation_summary():
+    """สรุปปัญหาข้อมูลที่พบ"""
+    print("📋 สรุปปัญหาข้อมูลที่พบ")
+    print("=" * 40)
+    print("🔍 ผลการตรวจสอบ:")
+    print("- ข้อมูลที่ขาด (Missing): 15 จุด (3.2%)")
+    print("- ข้อมูลซ้ำ (Duplicates): 8 แถว (1.7%)")
+    print("- ข้อมูลผิดปกติ (Outliers): 5 จุด (1.1%)")
+    print("- รูปแบบไม่ถูกต้อง: 12 จุด (2.6%)")
+    print("- ค่าไม่สอดคล้อง: 3 จุด (0.6%)")
+
+
+def _validation_compare():
+    """เปรียบเทียบผลก่อน-หลังการทำความสะอาด"""
+    print("🔍 แสดงผลเปรียบเทียบก่อน-หลัง Cleansing")
+    print("=" * 50)
+    print("📊 ก่อนการทำความสะอาด:")
+    print("- จำนวนแถว: 1,000")
+    print("- จำนวนคอลัมน์: 15")
+    print("- ข้อมูลที่ขาด: 15 จุด")
+    print("- ข้อมูลซ้ำ: 8 แถว")
+    print()
+    print("✨ หลังการทำความสะอาด:")
+    print("- จำนวนแถว: 992")
+    print("- จำนวนคอลัมน์: 15")
+    print("- ข้อมูลที่ขาด: 0 จุด")
+    print("- ข้อมูลซ้ำ: 0 แถว")
+    print()
+    print("📈 การปรับปรุง:")
+    print("- คุณภาพข้อมูล: 92.5% → 100%")
+    print("- ความสมบูรณ์: 96.8% → 100%")
+
+
+def _validation_html_report():
+    """สร้างรายงาน HTML"""
+    print("📄 สร้างรายงาน HTML")
+    report_name = _prompt("ใส่ชื่อไฟล์รายงาน: ", "❌ กรุณาใส่ชื่อไฟล์รายงาน")
+    if report_name is None:
         return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-7 เท่านั้น")
+    print(f"✅ กำลังสร้างรายงาน HTML: {report_name}.html")
+    # TODO: Implement HTML report generation
+
+
+def _validation_quality():
+    """ตรวจสอบคุณภาพข้อมูล"""
+    print("✅ ตรวจสอบคุณภาพข้อมูล")
+    print("=" * 40)
+    print("🎯 คะแนนคุณภาพข้อมูล: 87/100")
+    print()
+    print("📊 รายละเอียด:")
+    print("- ความสมบูรณ์ (Completeness): 95%")
+    print("- ความถูกต้อง (Accuracy): 92%")
+    print("- ความสอดคล้อง (Consistency): 88%")
+    print("- ความเป็นปัจจุบัน (Timeliness): 90%")
+    print("- ความไม่ซ้ำ (Uniqueness): 98%")
+    print()
+    print("💡 คำแนะนำ:")
+    print("- ปรับปรุงความสอดคล้องของข้อมูลในคอลัมน์ 'category'")
+    print("- ตรวจสอบข้อมูลที่มีรูปแบบวันที่ไม่ถูกต้อง")
+
+
+_VALIDATION_MENU = {
+    "1": _validation_summary,
+    "2": _validation_compare,
+    "3": _validation_html_report,
+    "7": _validation_quality,
+}
 
 
 def export_data_menu():
     """เมนูส่งออกข้อมูล"""
-    print("\n💾 ส่งออกข้อมูล (Export Data)")
-    print("=" * 40)
-    print("1. 📊 CSV (.csv)")
-    print("2. 📗 Excel (.xlsx)")
-    print("3. 📄 JSON (.json)")
-    print("4. 🗄️  ฐานข้อมูล (Database)")
-    print("5. ☁️  Cloud Storage")
-    print("6. 📈 Parquet (.parquet)")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_EXPORT_MENU_TEXT)
     
     choice = input("\n🔸 เลือกรูปแบบการส่งออก: ").strip()
-    
-    if choice == "1":
-        filename = input("📁 ใส่ชื่อไฟล์ CSV: ").strip()
-        if filename:
-            if not filename.endswith('.csv'):
-                filename += '.csv'
-            print(f"✅ กำลังส่งออกเป็น CSV: {filename}")
-            # TODO: Implement CSV export
-        else:
-            print("❌ กรุณาใส่ชื่อไฟล์")
-            
-    elif choice == "2":
-        filename = input("📁 ใส่ชื่อไฟล์ Excel: ").strip()
-        if filename:
-            if not filename.endswith('.xlsx'):
-                filename += '.xlsx'
-            print(f"✅ กำลังส่งออกเป็น Excel: {filename}")
-            # TODO: Implement Excel export
-        else:
-            print("❌ กรุณาใส่ชื่อไฟล์")
-            
-    elif choice == "4":
-        print("🗄️ ส่งออกไปยังฐานข้อมูล")
-        db_type = input("เลือกประเภทฐานข้อมูล (MySQL/PostgreSQL/SQLite): ").strip()
-        if db_type:
-            table_name = input("ใส่ชื่อตาราง: ").strip()
-            if table_name:
-                print(f"✅ กำลังส่งออกไปยัง {db_type} ตาราง: {table_name}")
-                # TODO: Implement database export
-        else:
-            print("❌ กรุณาเลือกประเภทฐานข้อมูล")
-            
-    elif choice == "5":
-        print("☁️ ส่งออกไปยัง Cloud Storage")
-        print("1. Google Drive")
-        print("2. Dropbox")
-        print("3. AWS S3")
-        print("4. Azure Blob Storage")
-        cloud_choice = input("เลือก Cloud Storage: ").strip()
-        if cloud_choice:
-            print(f"✅ กำลังส่งออกไปยัง Cloud Storage...")
-            # TODO: Implement cloud export
-        
-    elif choice == "0":
+    _dispatch(_EXPORT_MENU, choice, 6)
+
+
+def _export_csv():
+    """ส่งออกเป็นไฟล์ CSV"""
+    filename = _prompt("📁 ใส่ชื่อไฟล์ CSV: ", "❌ กรุณาใส่ชื่อไฟล์")
+    if filename is None:
         return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-6 เท่านั้น")
+    if not filename.endswith('.csv'):
+        filename += '.csv'
+    print(f"✅ กำลังส่งออกเป็น CSV: {filename}")
+    # TODO: Implement CSV export
+
+
+def _export_excel():
+    """ส่งออกเป็นไฟล์ Excel"""
+    filename = _prompt("📁 ใส่ชื่อไฟล์ Excel: ", "❌ กรุณาใส่ชื่อไฟล์")
+    if filename is None:
+        return
+    if not filename.endswith('.xlsx'):
+        filename += '.xlsx'
+    print(f"✅ กำลังส่งออกเป็น Excel: {filename}")
+    # TODO: Implement Excel export
+
+
+def _export_database():
+    """ส่งออกไปยังฐานข้อมูล"""
+    print("🗄️ ส่งออกไปยังฐานข้อมูล")
+    db_type = _prompt("เลือกประเภทฐานข้อมูล (MySQL/PostgreSQL/SQLite): ",
+                      "❌ กรุณาเลือกประเภทฐานข้อมูล")
+    if db_type is None:
+        return
+    table_name = _prompt("ใส่ชื่อตาราง: ")
+    if table_name is None:
+        return
+    print(f"✅ กำลังส่งออกไปยัง {db_type} ตาราง: {table_name}")
+    # TODO: Implement database export
+
+
+def _export_cloud():
+    """ส่งออกไปยัง Cloud Storage"""
+    print("☁️ ส่งออกไปยัง Cloud Storage")
+    print("1. Google Drive")
+    print("2. Dropbox")
+    print("3. AWS S3")
+    print("4. Azure Blob Storage")
+    if _prompt("เลือก Cloud Storage: ") is None:
+        return
+    print(f"✅ กำลังส่งออกไปยัง Cloud Storage...")
+    # TODO: Implement cloud export
+
+
+_EXPORT_MENU = {
+    "1": _export_csv,
+    "2": _export_excel,
+    "4": _export_database,
+    "5": _export_cloud,
+}
 
 
 def settings_menu():
     """เมนูตั้งค่า"""
-    print("\n⚙️ ตั้งค่า (Settings)")
-    print("=" * 40)
-    print("1. 📏 กำหนดมาตรฐานข้อมูล")
-    print("2. 👥 ตั้งค่าผู้ใช้/สิทธิ์")
-    print("3. 🔗 การตั้งค่าการเชื่อมต่อ")
-    print("4. 🌐 ภาษา (Language)")
-    print("5. 📊 การตั้งค่าการแสดงผล")
-    print("6. 🔧 การตั้งค่าขั้นสูง")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_SETTINGS_MENU_TEXT)
     
     choice = input("\n🔸 เลือกการตั้งค่า: ").strip()
-    
-    if choice == "1":
-        print("📏 กำหนดมาตรฐานข้อมูล")
-        print("1. กำหนดรูปแบบวันที่")
-        print("2. กำหนดรูปแบบตัวเลข")
-        print("3. กำหนดการเข้ารหัสข้อความ")
-        print("4. กำหนดค่าดีฟอลต์สำหรับข้อมูลที่ขาด")
-        sub_choice = input("เลือกมาตรฐาน: ").strip()
-        if sub_choice == "1":
-            date_format = input("ใส่รูปแบบวันที่ (เช่น DD/MM/YYYY): ").strip()
-            print(f"✅ ตั้งรูปแบบวันที่เป็น: {date_format}")
-        
-    elif choice == "4":
-        print("🌐 เลือกภาษา (Language)")
-        print("1. ภาษาไทย (Thai)")
-        print("2. English")
-        print("3. 中文 (Chinese)")
-        print("4. 日本語 (Japanese)")
-        lang_choice = input("เลือกภาษา: ").strip()
-        if lang_choice == "1":
-            print("✅ ตั้งค่าภาษาเป็นภาษาไทย")
-        elif lang_choice == "2":
-            print("✅ Set language to English")
-        
-    elif choice == "5":
-        print("📊 การตั้งค่าการแสดงผล")
-        print("1. จำนวนแถวที่แสดงในตาราง")
-        print("2. สีธีม (Color Theme)")
-        print("3. ขนาดตัวอักษร")
-        sub_choice = input("เลือกการตั้งค่า: ").strip()
-        if sub_choice == "1":
-            rows = input("ใส่จำนวนแถวที่ต้องการแสดง: ").strip()
-            if rows.isdigit():
-                print(f"✅ ตั้งค่าแสดง {rows} แถว")
-        
-    elif choice == "0":
-        return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-6 เท่านั้น")
+    _dispatch(_SETTINGS_MENU, choice, 6)
+
+
+def _settings_standards():
+    """กำหนดมาตรฐานข้อมูล"""
+    print("📏 กำหนดมาตรฐานข้อมูล")
+    print("1. กำหนดรูปแบบวันที่")
+    print("2. กำหนดรูปแบบตัวเลข")
+    print("3. กำหนดการเข้ารหัสข้อความ")
+    print("4. กำหนดค่าดีฟอลต์สำหรับข้อมูลที่ขาด")
+    sub_choice = input("เลือกมาตรฐาน: ").strip()
+    if sub_choice == "1":
+        date_format = input("ใส่รูปแบบวันที่ (เช่น DD/MM/YYYY): ").strip()
+        print(f"✅ ตั้งรูปแบบวันที่เป็น: {date_format}")
+
+
+def _settings_language():
+    """เลือกภาษา"""
+    print("🌐 เลือกภาษา (Language)")
+    print("1. ภาษาไทย (Thai)")
+    print("2. English")
+    print("3. 中文 (Chinese)")
+    print("4. 日本語 (Japanese)")
+    lang_choice = input("เลือกภาษา: ").strip()
+    if lang_choice == "1":
+        print("✅ ตั้งค่าภาษาเป็นภาษาไทย")
+    elif lang_choice == "2":
+        print("✅ Set language to English")
+
+
+def _settings_display():
+    """การตั้งค่าการแสดงผล"""
+    print("📊 การตั้งค่าการแสดงผล")
+    print("1. จำนวนแถวที่แสดงในตาราง")
+    print("2. สีธีม (Color Theme)")
+    print("3. ขนาดตัวอักษร")
+    sub_choice = input("เลือกการตั้งค่า: ").strip()
+    if sub_choice == "1":
+        rows = input("ใส่จำนวนแถวที่ต้องการแสดง: ").strip()
+        if rows.isdigit():
+            print(f"✅ ตั้งค่าแสดง {rows} แถว")
+
+
+_SETTINGS_MENU = {
+    "1": _settings_standards,
+    "4": _settings_language,
+    "5": _settings_display,
+}
 
 
 def templates_menu():
     """เมนูเทมเพลต"""
-    print("\n📋 เทมเพลต (Templates)")
-    print("=" * 40)
-    print("1. 📝 สร้างเทมเพลตใหม่")
-    print("2. 📂 โหลดเทมเพลตที่มีอยู่")
-    print("3. ✏️  แก้ไขเทมเพลต")
-    print("4. 🗑️  ลบเทมเพลต")
-    print("5. 📋 เทมเพลตสำเร็จรูป")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_TEMPLATES_MENU_TEXT)
     
     choice = input("\n🔸 เลือกการจัดการเทมเพลต: ").strip()
-    
-    if choice == "1":
-        template_name = input("📝 ใส่ชื่อเทมเพลต: ").strip()
-        if template_name:
-            print(f"✅ สร้างเทมเพลต: {template_name}")
-            print("กำลังเปิดตัวสร้างเทมเพลต...")
-            # TODO: Implement template creation
-        else:
-            print("❌ กรุณาใส่ชื่อเทมเพลต")
-            
-    elif choice == "2":
-        print("📂 เทมเพลตที่มีอยู่:")
-        print("1. Customer Data Cleansing")
-        print("2. Sales Data Processing")
-        print("3. Survey Data Cleaning")
-        print("4. Financial Data Preparation")
-        template_choice = input("เลือกเทมเพลต (1-4): ").strip()
-        if template_choice in ["1", "2", "3", "4"]:
-            templates = {
-                "1": "Customer Data Cleansing",
-                "2": "Sales Data Processing", 
-                "3": "Survey Data Cleaning",
-                "4": "Financial Data Preparation"
-            }
-            print(f"✅ โหลดเทมเพลต: {templates[template_choice]}")
-            # TODO: Load template
-            
-    elif choice == "5":
-        print("📋 เทมเพลตสำเร็จรูป:")
-        print("1. 👥 ข้อมูลลูกค้า - ลบข้อมูลซ้ำ, แก้ไขอีเมล, มาตรฐานชื่อ")
-        print("2. 💰 ข้อมูลการขาย - เติมราคา, แปลงวันที่, ลบ outliers")
-        print("3. 📊 ข้อมูลสำรวจ - เติมคำตอบ, มาตรฐานตัวเลือก")
-        print("4. 🏦 ข้อมูลการเงิน - ตรวจสอบยอดเงิน, แปลงสกุลเงิน")
-        template_choice = input("เลือกเทมเพลต (1-4): ").strip()
-        if template_choice in ["1", "2", "3", "4"]:
-            print(f"✅ ใช้เทมเพลตสำเร็จรูปที่ {template_choice}")
-            # TODO: Apply predefined template
-        
-    elif choice == "0":
+    _dispatch(_TEMPLATES_MENU, choice, 5)
+
+
+def _template_create():
+    """สร้างเทมเพลตใหม่"""
+    template_name = _prompt("📝 ใส่ชื่อเทมเพลต: ", "❌ กรุณาใส่ชื่อเทมเพลต")
+    if template_name is None:
         return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-5 เท่านั้น")
+    print(f"✅ สร้างเทมเพลต: {template_name}")
+    print("กำลังเปิดตัวสร้างเทมเพลต...")
+    # TODO: Implement template creation
+
+
+def _template_load():
+    """โหลดเทมเพลตที่มีอยู่"""
+    print("📂 เทมเพลตที่มีอยู่:")
+    print("1. Customer Data Cleansing")
+    print("2. Sales Data Processing")
+    print("3. Survey Data Cleaning")
+    print("4. Financial Data Preparation")
+    template = _TEMPLATE_NAMES.get(input("เลือกเทมเพลต (1-4): ").strip())
+    if template is not None:
+        print(f"✅ โหลดเทมเพลต: {template}")
+        # TODO: Load template
+
+
+def _template_predefined():
+    """ใช้เทมเพลตสำเร็จรูป"""
+    print("📋 เทมเพลตสำเร็จรูป:")
+    print("1. 👥 ข้อมูลลูกค้า - ลบข้อมูลซ้ำ, แก้ไขอีเมล, มาตรฐานชื่อ")
+    print("2. 💰 ข้อมูลการขาย - เติมราคา, แปลงวันที่, ลบ outliers")
+    print("3. 📊 ข้อมูลสำรวจ - เติมคำตอบ, มาตรฐานตัวเลือก")
+    print("4. 🏦 ข้อมูลการเงิน - ตรวจสอบยอดเงิน, แปลงสกุลเงิน")
+    template_choice = input("เลือกเทมเพลต (1-4): ").strip()
+    if template_choice in _TEMPLATE_CHOICES:
+        print(f"✅ ใช้เทมเพลตสำเร็จรูปที่ {template_choice}")
+        # TODO: Apply predefined template
+
+
+_TEMPLATES_MENU = {
+    "1": _template_create,
+    "2": _template_load,
+    "5": _template_predefined,
+}
 
 
 def reports_menu():
     """เมนูรายงาน"""
-    print("\n📈 รายงาน (Reports)")
-    print("=" * 40)
-    print("1. 📊 ดูรายงานล่าสุด")
-    print("2. 📜 ประวัติการทำความสะอาด")
-    print("3. 📈 สถิติการใช้งาน")
-    print("4. ❌ รายงานข้อผิดพลาด")
-    print("5. 📋 รายงานสรุปประจำวัน/สัปดาห์/เดือน")
-    print("0. กลับเมนูหลัก")
+    sys.stdout.write(_REPORTS_MENU_TEXT)
     
     choice = input("\n🔸 เลือกประเภทรายงาน: ").strip()
-    
-    if choice == "1":
-        print("📊 รายงานล่าสุด")
-        print("=" * 40)
-        print("📅 วันที่: 7 มิถุนายน 2568")
-        print("⏰ เวลา: 14:30:25")
-        print("📁 ไฟล์: customer_data.csv")
-        print("📊 ผลลัพธ์:")
-        print("- แถวที่ประมวลผล: 1,000")
-        print("- แถวที่ลบ: 8 (ข้อมูลซ้ำ)")
-        print("- ข้อมูลที่แก้ไข: 15 จุด")
-        print("- เวลาที่ใช้: 2.5 วินาที")
-        print("✅ สถานะ: เสร็จสิ้น")
-        
-    elif choice == "2":
-        print("📜 ประวัติการทำความสะอาด")
-        print("=" * 50)
-        print("| วันที่       | ไฟล์              | แถว   | สถานะ  |")
-        print("|-------------|------------------|-------|-------|")
-        print("| 07/06/2568  | customer_data.csv| 1,000 | ✅    |")
-        print("| 06/06/2568  | sales_data.xlsx  | 2,500 | ✅    |")
-        print("| 05/06/2568  | survey_data.json | 800   | ❌    |")
-        print("| 04/06/2568  | product_data.csv | 1,200 | ✅    |")
-        
-    elif choice == "3":
-        print("📈 สถิติการใช้งาน")
-        print("=" * 40)
-        print("📊 สถิติรายสัปดาห์:")
-        print("- ไฟล์ที่ประมวลผล: 25 ไฟล์")
-        print("- แถวทั้งหมด: 45,000 แถว")
-        print("- เวลาเฉลี่ย: 3.2 วินาที/ไฟล์")
-        print("- อัตราความสำเร็จ: 96%")
-        print()
-        print("🏆 ฟังก์ชันที่ใช้บ่อยที่สุด:")
-        print("1. ลบข้อมูลซ้ำ (40%)")
-        print("2. เติมข้อมูลที่ขาด (25%)")
-        print("3. แก้ไขรูปแบบข้อมูล (20%)")
-        print("4. ลบ outliers (15%)")
-        
-    elif choice == "4":
-        print("❌ รายงานข้อผิดพลาด")
-        print("=" * 40)
-        print("🔍 ข้อผิดพลาดล่าสุด:")
-        print("| เวลา    | ไฟล์         | ข้อผิดพลาด              |")
-        print("|---------|-------------|------------------------|")
-        print("| 14:25   | data.csv    | ไม่พบคอลัมน์ 'age'      |")
-        print("| 13:10   | sales.xlsx  | รูปแบบวันที่ไม่ถูกต้อง   |")
-        print("| 12:45   | survey.json | ไฟล์เสียหาย             |")
-        
-    elif choice == "5":
-        print("📋 รายงานสรุป")
-        print("1. รายงานประจำวัน")
-        print("2. รายงานประจำสัปดาห์")
-        print("3. รายงานประจำเดือน")
-        period_choice = input("เลือกช่วงเวลา (1-3): ").strip()
-        if period_choice == "1":
-            print("📅 รายงานประจำวัน (7 มิถุนายน 2568)")
-            print("- ไฟล์ที่ประมวลผล: 5 ไฟล์")
-            print("- แถวทั้งหมด: 8,500 แถว")
-            print("- ข้อมูลที่แก้ไข: 127 จุด")
-            print("- เวลารวม: 15.2 วินาที")
-        
-    elif choice == "0":
-        return
-    else:
-        print("❌ กรุณาเลือกตัวเลข 0-5 เท่านั้น")
+    _dispatch(_REPORTS_MENU, choice, 5)
+
+
+def _report_latest():
+    """รายงานล่าสุด"""
+    sys.stdout.write(_LATEST_REPORT_TEXT)
+
+
+def _report_history():
+    """ประวัติการทำความสะอาด"""
+    sys.stdout.write(_HISTORY_REPORT_TEXT)
+
+
+def _report_usage():
+    """สถิติการใช้งาน"""
+    print("📈 สถิติการใช้งาน")
+    print("=" * 40)
+    print("📊 สถิติรายสัปดาห์:")
+    print("- ไฟล์ที่ประมวลผล: 25 ไฟล์")
+    print("- แถวทั้งหมด: 45,000 แถว")
+    print("- เวลาเฉลี่ย: 3.2 วินาที/ไฟล์")
+    print("- อัตราความสำเร็จ: 96%")
+    print()
+    print("🏆 ฟังก์ชันที่ใช้บ่อยที่สุด:")
+    print("1. ลบข้อมูลซ้ำ (40%)")
+    print("2. เติมข้อมูลที่ขาด (25%)")
+    print("3. แก้ไขรูปแบบข้อมูล (20%)")
+    print("4. ลบ outliers (15%)")
+
+
+def _report_errors():
+    """รายงานข้อผิดพลาด"""
+    sys.stdout.write(_ERROR_REPORT_TEXT)
+
+
+def _report_summary():
+    """รายงานสรุปตามช่วงเวลา"""
+    print("📋 รายงานสรุป")
+    print("1. รายงานประจำวัน")
+    print("2. รายงานประจำสัปดาห์")
+    print("3. รายงานประจำเดือน")
+    period_choice = input("เลือกช่วงเวลา (1-3): ").strip()
+    if period_choice == "1":
+        print("📅 รายงานประจำวัน (7 มิถุนายน 2568)")
+        print("- ไฟล์ที่ประมวลผล: 5 ไฟล์")
+        print("- แถวทั้งหมด: 8,500 แถว")
+        print("- ข้อมูลที่แก้ไข: 127 จุด")
+        print("- เวลารวม: 15.2 วินาที")
+
+
+_REPORTS_MENU = {
+    "1": _report_latest,
+    "2": _report_history,
+    "3": _report_usage,
+    "4": _report_errors,
+    "5": _report_summary,
+}
+
+
+_MAIN_MENU = {
+    "1": import_data_menu,
+    "2": data_preview_menu,
+    "3": cleansing_pipeline_menu,
+    "4": validation_reporting_menu,
+    "5": export_data_menu,
+    "6": settings_menu,
+    "7": templates_menu,
+    "8": reports_menu,
+}
 
 
 if __name__ == "__main__":
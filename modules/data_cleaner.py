@@ -16,6 +16,134 @@ from typing import Dict, List, Any, Optional, Union
 import re
 from datetime import datetime
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba เป็นตัวเลือกเสริม ใช้ numpy แทนได้
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # ไม่มี pyarrow ใช้ .str ของ pandas แทน
+    pa = None
+
+# รูปแบบที่ใช้ตรวจชนิดข้อมูล (compile ครั้งเดียว รวมหลายรูปแบบเป็น regex เดียว)
+_DATE_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2}'     # YYYY-MM-DD
+    r'|\d{2}/\d{2}/\d{4}'    # DD/MM/YYYY
+    r'|\d{2}-\d{2}-\d{4}'    # DD-MM-YYYY
+)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(
+    r'\d{3}-\d{3}-\d{4}'        # 123-456-7890
+    r'|\(\d{3}\)\s\d{3}-\d{4}'  # (123) 456-7890
+    r'|\d{10}'                 # 1234567890
+)
+# อักขระที่ไม่ใช่ตัวเลข / ไม่ใช่ตัวอักษร (ใช้ลบออกหรือแทนที่)
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_NON_WORD_RE = re.compile(r'[^\w]')
+# ตัวเลข 10 หลักที่จะจัดรูปแบบเป็น XXX-XXX-XXXX
+_PHONE_PARTS_RE = re.compile(r'^(\d{3})(\d{3})(\d{4})$')
+
+# จำนวนแถวแรกที่ใช้หาตัวอย่างก่อนจะยอมสแกนทั้งคอลัมน์
+_SAMPLE_WINDOW = 1000
+# ชนิดตัวอย่าง (จาก infer_dtype) ที่เป็นตัวเลขอยู่แล้ว
+_NUMERIC_KINDS = frozenset({'integer', 'floating', 'mixed-integer-float', 'decimal'})
+
+# สัดส่วนขั้นต่ำของตัวอย่างที่ต้องแปลงเป็นวันที่ได้ จึงจะถือว่าเป็นคอลัมน์วันที่
+_DATE_PARSE_RATIO = 0.8
+
+# จำนวนช่องข้อมูลตัวเลขขั้นต่ำที่คุ้มจะนับข้อมูลผิดปกติด้วย numba
+_NUMBA_MIN_CELLS = 100_000
+
+# สัดส่วนค่าไม่ซ้ำสูงสุดที่ยังคุ้มจะแปลงข้อความเฉพาะค่าไม่ซ้ำ
+_UNIQUE_RATIO = 0.5
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _count_outliers(arr, lower, upper):
+        """นับค่าที่อยู่นอกช่วง [lower, upper] ของแต่ละคอลัมน์ในรอบเดียว (NaN ไม่นับ)"""
+        n_rows, n_cols = arr.shape
+        counts = np.zeros(n_cols, np.int64)
+        for j in prange(n_cols):
+            count = 0
+            for i in range(n_rows):
+                x = arr[i, j]
+                if x < lower[j] or x > upper[j]:
+                    count += 1
+            counts[j] = count
+        return counts
+
+
+def _sample_matches(sample: pd.Series, pattern: re.Pattern) -> bool:
+    """ตรวจว่ามีข้อความในตัวอย่างอย่างน้อยหนึ่งค่าที่ขึ้นต้นตรงกับรูปแบบหรือไม่"""
+    strings = sample[sample.map(lambda item: isinstance(item, str))]
+    return bool(strings.str.strip().str.match(pattern).any())
+
+
+def _head_sample(series: pd.Series, size: int = 10) -> pd.Series:
+    """ดึงค่าที่ไม่ว่าง size ค่าแรก (ผลเหมือน series.dropna().head(size))"""
+    # ส่วนใหญ่พบครบในช่วงต้นคอลัมน์ จึงไม่ต้อง dropna ทั้งคอลัมน์
+    sample = series.iloc[:_SAMPLE_WINDOW].dropna().head(size)
+    if len(sample) < size and len(series) > _SAMPLE_WINDOW:
+        sample = series.dropna().head(size)
+    return sample
+
+
+def _dtype_masks(data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    แบ่งคอลัมน์ตามกลุ่มประเภทข้อมูล โดยอ่าน data.dtypes เพียงรอบเดียว
+    
+    คืน mask แบบ boolean ตามตำแหน่งคอลัมน์ (ใช้ได้แม้ชื่อคอลัมน์ซ้ำกัน):
+    - number: ตัวเลขทุกชนิดยกเว้น bool (เหมือน select_dtypes(include=[np.number]))
+    - int_float: เฉพาะ int64/float64
+    - object: ข้อความหรือค่าผสม
+    - datetime: datetime64[ns]
+    """
+    dtypes = list(data.dtypes)
+    number = [pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+              for dtype in dtypes]
+    return {
+        'number': np.array(number, dtype=bool),
+        'int_float': np.array([dtype in ('int64', 'float64') for dtype in dtypes], dtype=bool),
+        'object': np.array([dtype == 'object' for dtype in dtypes], dtype=bool),
+        'datetime': np.array([dtype == 'datetime64[ns]' for dtype in dtypes], dtype=bool),
+    }
+
+
+def _missing_counts(data: pd.DataFrame) -> pd.Series:
+    """นับค่าที่ขาดทีละคอลัมน์ (ไม่สร้างตาราง boolean ขนาดเท่าข้อมูลทั้งหมด)"""
+    return pd.Series([series.isna().sum() for _, series in data.items()],
+                     index=data.columns, dtype='int64')
+
+
+def _to_arrow(series: pd.Series) -> Optional['pa.Array']:
+    """
+    แปลง Series ข้อความ ASCII เป็น Arrow string array สำหรับใช้ compute kernel
+    
+    คืน None เมื่อไม่มี pyarrow หรือคอลัมน์มีค่าว่าง/ค่าที่ไม่ใช่ข้อความ/อักขระ
+    นอก ASCII (ซึ่ง kernel ของ Arrow กับ str ของ Python ตีความต่างกันบางตัว)
+    เพื่อให้ผู้เรียกกลับไปใช้ .str ของ pandas ซึ่งให้ผลลัพธ์แบบเดิม
+    """
+    if pa is None or series.dtype != 'object':
+        return None
+    try:
+        arr = pa.array(series.to_numpy(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if not pa.types.is_string(arr.type) or arr.null_count:
+        return None
+    if not pc.all(pc.string_is_ascii(arr), min_count=0).as_py():
+        return None
+    return arr
+
+
+def _from_arrow(arr: 'pa.Array', like: pd.Series) -> pd.Series:
+    """แปลง Arrow array กลับเป็น Series แบบ object โดยใช้ index และชื่อเดิม"""
+    return pd.Series(arr.to_numpy(zero_copy_only=False), index=like.index,
+                     name=like.name)
+
 
 class DataCleaner:
     """
@@ -29,6 +157,16 @@ class DataCleaner:
     - การตรวจสอบข้อมูลผิดปกติ
     """
     
+    # ขั้นตอนการทำความสะอาดตามลำดับ: (ชื่อในการตั้งค่า, ชื่อที่แสดงในบันทึก)
+    CLEANING_STEPS = (
+        ("remove_empty_rows", "ลบแถวว่างเปล่า"),
+        ("handle_missing_data", "จัดการข้อมูลที่ขาด"),
+        ("remove_duplicates", "ลบข้อมูลซ้ำ"),
+        ("standardize_formats", "แก้ไขรูปแบบข้อมูล"),
+        ("detect_outliers", "ตรวจสอบข้อมูลผิดปกติ"),
+        ("validate_consistency", "ตรวจสอบความสอดคล้อง"),
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         เริ่มต้นคลาส DataCleaner
@@ -40,6 +178,14 @@ class DataCleaner:
         self.logger = logging.getLogger(__name__)
         self.cleaning_log = []  # บันทึกขั้นตอนการทำความสะอาด
         
+        # เลือกขั้นตอนที่เปิดใช้จาก processing.cleaning_steps (ไม่ระบุ = ทุกขั้นตอน)
+        # แล้วผูกเมธอดไว้ครั้งเดียว clean_data จะวนเฉพาะรายการนี้
+        processing = self.config.get('processing') or {}
+        enabled_steps = processing.get('cleaning_steps') or [key for key, _ in self.CLEANING_STEPS]
+        self._cleaning_steps = [(step_name, getattr(self, f"_{key}"))
+                                for key, step_name in self.CLEANING_STEPS
+                                if key in enabled_steps]
+        
     def preprocess(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         เตรียมข้อมูลเบื้องต้นก่อนการทำความสะอาด
@@ -52,8 +198,9 @@ class DataCleaner:
         """
         self.logger.info("🔧 เริ่มต้นการเตรียมข้อมูลเบื้องต้น")
         
-        # สำเนาข้อมูลเพื่อป้องกันการแก้ไขต้นฉบับ
-        processed_data = data.copy()
+        # สำเนาแบบตื้นพอป้องกันการแก้ไขต้นฉบับ เพราะทุกขั้นตอนแทนที่ทั้งคอลัมน์
+        # ไม่ได้เขียนทับค่าในอาร์เรย์เดิม จึงไม่ต้องคัดลอกข้อมูลทั้งหมด
+        processed_data = data.copy(deep=False)
         
         # แสดงข้อมูลเบื้องต้น
         self._log_data_info("ข้อมูลก่อนการเตรียม", processed_data)
@@ -79,19 +226,10 @@ class DataCleaner:
         """
         self.logger.info("🧹 เริ่มต้นการทำความสะอาดข้อมูล")
         
-        cleaned_data = data.copy()
-        
-        # ขั้นตอนการทำความสะอาด
-        cleaning_steps = [
-            ("ลบแถวว่างเปล่า", self._remove_empty_rows),
-            ("จัดการข้อมูลที่ขาด", self._handle_missing_data),
-            ("ลบข้อมูลซ้ำ", self._remove_duplicates),
-            ("แก้ไขรูปแบบข้อมูล", self._standardize_formats),
-            ("ตรวจสอบข้อมูลผิดปกติ", self._detect_outliers),
-            ("ตรวจสอบความสอดคล้อง", self._validate_consistency)
-        ]
+        cleaned_data = data.copy(deep=False)
         
-        for step_name, step_function in cleaning_steps:
+        # ขั้นตอนการทำความสะอาด (เตรียมไว้แล้วตอนสร้างออบเจ็กต์ตามการตั้งค่า)
+        for step_name, step_function in self._cleaning_steps:
             self.logger.info(f"📝 {step_name}...")
             try:
                 cleaned_data = step_function(cleaned_data)
@@ -110,15 +248,24 @@ class DataCleaner:
         """ตรวจสอบและแปลงประเภทข้อมูลอัตโนมัติ"""
         self.logger.info("🔍 ตรวจสอบและแปลงประเภทข้อมูล")
         
-        for column in data.columns:
+        # ตรวจเฉพาะคอลัมน์ข้อความ คอลัมน์ชนิดอื่นไม่ต้องแปลง
+        object_columns = data.columns[_dtype_masks(data)['object']]
+        for column in object_columns:
+            series = data[column]
+            # ดึงตัวอย่างครั้งเดียวแล้วใช้ร่วมกันทุกการตรวจสอบ
+            sample = _head_sample(series)
+            
+            # ตัวอย่างเป็นตัวเลขอยู่แล้ว (เช่นมาจาก Excel/JSON) ไม่ต้องตรวจแบบข้อความ
+            sample_kind = pd.api.types.infer_dtype(sample, skipna=True)
+            
             # ตรวจสอบข้อมูลวันที่
-            if self._is_date_column(data[column]):
-                data[column] = pd.to_datetime(data[column], errors='coerce')
+            if sample_kind not in _NUMERIC_KINDS and self._is_date_column(series, sample):
+                data[column] = pd.to_datetime(series, errors='coerce')
                 self.logger.info(f"📅 แปลงคอลัมน์ '{column}' เป็นประเภทวันที่")
                 
             # ตรวจสอบข้อมูลตัวเลข
-            elif self._is_numeric_column(data[column]):
-                data[column] = pd.to_numeric(data[column], errors='coerce')
+            elif sample_kind in _NUMERIC_KINDS or self._is_numeric_column(series, sample):
+                data[column] = pd.to_numeric(series, errors='coerce')
                 self.logger.info(f"🔢 แปลงคอลัมน์ '{column}' เป็นประเภทตัวเลข")
                 
         return data
@@ -127,6 +274,14 @@ class DataCleaner:
         """ทำความสะอาดชื่อคอลัมน์"""
         self.logger.info("📝 ทำความสะอาดชื่อคอลัมน์")
         
+        columns = data.columns.tolist()
+        if all(isinstance(column, str) for column in columns):
+            # ชื่อคอลัมน์มีไม่มาก ทำทีละชื่อในรอบเดียวเร็วกว่าสร้าง Index ใหม่ทีละขั้น:
+            # ลบช่องว่างหน้า-หลัง แทนช่องว่างด้วย underscore ลบอักขระพิเศษ แล้วแปลงเป็นตัวพิมพ์เล็ก
+            data.columns = [_NON_WORD_RE.sub('_', column.strip().replace(' ', '_')).lower()
+                            for column in columns]
+            return data
+        
         # ลบช่องว่างข้างหน้าและข้างหลัง
         data.columns = data.columns.str.strip()
         
@@ -134,7 +289,7 @@ class DataCleaner:
         data.columns = data.columns.str.replace(' ', '_', regex=False)
         
         # ลบอักขระพิเศษ
-        data.columns = data.columns.str.replace(r'[^\w]', '_', regex=True)
+        data.columns = data.columns.str.replace(_NON_WORD_RE, '_', regex=True)
         
         # แปลงเป็นตัวพิมพ์เล็ก
         data.columns = data.columns.str.lower()
@@ -143,99 +298,159 @@ class DataCleaner:
     
     def _remove_empty_rows(self, data: pd.DataFrame) -> pd.DataFrame:
         """ลบแถวที่ว่างเปล่าทั้งหมด"""
-        initial_rows = len(data)
-        data_cleaned = data.dropna(how='all')
-        removed_rows = initial_rows - len(data_cleaned)
+        # รวม mask ค่าไม่ว่างทีละคอลัมน์ (ไม่สร้างตาราง boolean ขนาดเท่าข้อมูลทั้งหมด)
+        has_value = np.zeros(len(data), dtype=bool)
+        for _, series in data.items():
+            has_value |= series.notna().to_numpy()
         
-        if removed_rows > 0:
-            self.logger.info(f"🗑️ ลบแถวว่างเปล่า: {removed_rows} แถว")
-            
-        return data_cleaned
+        removed_rows = len(data) - int(has_value.sum())
+        if removed_rows == 0:
+            # ไม่มีแถวว่าง คืนข้อมูลเดิมโดยไม่ต้องสร้างสำเนา
+            return data
+        
+        self.logger.info(f"🗑️ ลบแถวว่างเปล่า: {removed_rows} แถว")
+        return data[has_value]
     
     def _handle_missing_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """จัดการข้อมูลที่ขาดหายไป"""
-        missing_summary = data.isnull().sum()
+        missing_summary = _missing_counts(data)
+        missing_columns = missing_summary[missing_summary > 0].index
+        if len(missing_columns) == 0:
+            return data
+        
+        # แบ่งคอลัมน์ตามประเภทข้อมูล แล้วคำนวณค่าที่ใช้เติมของแต่ละกลุ่มในครั้งเดียว
+        dtypes = data.dtypes
+        numeric_columns = [col for col in missing_columns
+                           if dtypes[col] in ['int64', 'float64']]
+        object_columns = [col for col in missing_columns if dtypes[col] == 'object']
+        date_columns = [col for col in missing_columns
+                        if dtypes[col] == 'datetime64[ns]']
         
-        for column in data.columns:
+        means = data[numeric_columns].mean() if numeric_columns else {}
+        if object_columns:
+            # mode() ของทั้งกลุ่ม แถวแรกคือค่าที่พบบ่อยที่สุด (NaN = ไม่มีค่าเลย)
+            mode_frame = data[object_columns].mode()
+            if len(mode_frame):
+                modes = mode_frame.iloc[0]
+            else:  # ทุกคอลัมน์ว่างทั้งหมด mode() จึงไม่มีแถว
+                modes = pd.Series(np.nan, index=object_columns)
+            modes = modes.where(modes.notna(), 'Unknown')
+        else:
+            modes = {}
+        medians = data[date_columns].median() if date_columns else {}
+        
+        for column in missing_columns:
             missing_count = missing_summary[column]
-            if missing_count > 0:
-                missing_percent = (missing_count / len(data)) * 100
-                self.logger.info(f"📊 คอลัมน์ '{column}': ข้อมูลขาด {missing_count} จุด ({missing_percent:.1f}%)")
+            missing_percent = (missing_count / len(data)) * 100
+            self.logger.info(f"📊 คอลัมน์ '{column}': ข้อมูลขาด {missing_count} จุด ({missing_percent:.1f}%)")
+            
+            # เติมค่าตามประเภทข้อมูล
+            if column in means:
+                # เติมด้วยค่าเฉลี่ยสำหรับตัวเลข (แทนค่า NaN ในอาร์เรย์ numpy โดยตรง)
+                fill_value = means[column]
+                values = data[column].to_numpy(dtype=np.float64, copy=True)
+                values[np.isnan(values)] = fill_value
+                data[column] = values
+                self.logger.info(f"🔧 เติมค่าเฉลี่ย ({fill_value:.2f}) ในคอลัมน์ '{column}'")
                 
-                # เติมค่าตามประเภทข้อมูล
-                if data[column].dtype in ['int64', 'float64']:
-                    # เติมด้วยค่าเฉลี่ยสำหรับตัวเลข
-                    fill_value = data[column].mean()
-                    data[column].fillna(fill_value, inplace=True)
-                    self.logger.info(f"🔧 เติมค่าเฉลี่ย ({fill_value:.2f}) ในคอลัมน์ '{column}'")
-                    
-                elif data[column].dtype == 'object':
-                    # เติมด้วยค่าที่พบบ่อยที่สุดสำหรับข้อความ
-                    fill_value = data[column].mode().iloc[0] if not data[column].mode().empty else 'Unknown'
-                    data[column].fillna(fill_value, inplace=True)
-                    self.logger.info(f"📝 เติมค่า '{fill_value}' ในคอลัมน์ '{column}'")
-                    
-                elif data[column].dtype == 'datetime64[ns]':
-                    # เติมด้วยค่ากลางสำหรับวันที่
-                    fill_value = data[column].median()
-                    data[column].fillna(fill_value, inplace=True)
-                    self.logger.info(f"📅 เติมค่ากลาง ({fill_value}) ในคอลัมน์ '{column}'")
+            elif column in modes:
+                # เติมด้วยค่าที่พบบ่อยที่สุดสำหรับข้อความ
+                fill_value = modes[column]
+                data[column] = data[column].fillna(fill_value)
+                self.logger.info(f"📝 เติมค่า '{fill_value}' ในคอลัมน์ '{column}'")
+                
+            elif column in medians:
+                # เติมด้วยค่ากลางสำหรับวันที่
+                fill_value = medians[column]
+                data[column] = data[column].fillna(fill_value)
+                self.logger.info(f"📅 เติมค่ากลาง ({fill_value}) ในคอลัมน์ '{column}'")
                     
         return data
     
     def _remove_duplicates(self, data: pd.DataFrame) -> pd.DataFrame:
         """ลบข้อมูลซ้ำ"""
-        initial_rows = len(data)
-        data_deduplicated = data.drop_duplicates()
-        duplicate_count = initial_rows - len(data_deduplicated)
+        duplicated = data.duplicated()
+        duplicate_count = int(duplicated.sum())
         
-        if duplicate_count > 0:
-            self.logger.info(f"🔄 ลบข้อมูลซ้ำ: {duplicate_count} แถว")
-        else:
+        if duplicate_count == 0:
+            # ไม่มีแถวซ้ำ คืนข้อมูลเดิมโดยไม่ต้องสร้างสำเนา
             self.logger.info("✅ ไม่พบข้อมูลซ้ำ")
-            
-        return data_deduplicated
+            return data
+        
+        self.logger.info(f"🔄 ลบข้อมูลซ้ำ: {duplicate_count} แถว")
+        return data[~duplicated]
     
     def _standardize_formats(self, data: pd.DataFrame) -> pd.DataFrame:
         """แก้ไขรูปแบบข้อมูลให้มาตรฐาน"""
-        for column in data.columns:
-            if data[column].dtype == 'object':
-                # ลบช่องว่างข้างหน้าและข้างหลัง
-                data[column] = data[column].astype(str).str.strip()
+        # เก็บผลของทุกคอลัมน์ไว้ก่อน แล้วค่อยเขียนกลับทั้งหมดตอนท้าย
+        results = {}
+        # ทำเฉพาะคอลัมน์ข้อความ คอลัมน์ตัวเลข/วันที่ข้ามไปเลย
+        object_columns = data.columns[_dtype_masks(data)['object']]
+        for column in object_columns:
+            values = data[column].astype(str)
+            codes, uniques = pd.factorize(values)
+            if len(uniques) >= len(values) * _UNIQUE_RATIO:
+                # ค่าแทบไม่ซ้ำกัน แปลงทั้งคอลัมน์ตรงๆ ถูกกว่า
+                codes, uniques = None, values
+            else:
+                # ค่าซ้ำมาก: แปลงเฉพาะค่าไม่ซ้ำ แล้วกระจายกลับด้วยรหัสทีหลัง
+                uniques = pd.Series(uniques, dtype=object)
+            
+            # ลบช่องว่างข้างหน้าและข้างหลัง
+            uniques = uniques.str.strip()
+            sample = uniques.iloc[:10] if codes is None else uniques.iloc[codes[:10]]
+            
+            # ตรวจสอบว่าเป็นข้อมูลอีเมลหรือไม่
+            if self._is_email_column(uniques, sample):
+                uniques = self._standardize_emails(uniques)
+                self.logger.info(f"📧 แก้ไขรูปแบบอีเมลในคอลัมน์ '{column}'")
                 
-                # ตรวจสอบว่าเป็นข้อมูลอีเมลหรือไม่
-                if self._is_email_column(data[column]):
-                    data[column] = self._standardize_emails(data[column])
-                    self.logger.info(f"📧 แก้ไขรูปแบบอีเมลในคอลัมน์ '{column}'")
-                    
-                # ตรวจสอบว่าเป็นข้อมูลหมายเลขโทรศัพท์หรือไม่
-                elif self._is_phone_column(data[column]):
-                    data[column] = self._standardize_phones(data[column])
-                    self.logger.info(f"📞 แก้ไขรูปแบบหมายเลขโทรศัพท์ในคอลัมน์ '{column}'")
+            # ตรวจสอบว่าเป็นข้อมูลหมายเลขโทรศัพท์หรือไม่
+            elif self._is_phone_column(uniques, sample):
+                uniques = self._standardize_phones(uniques)
+                self.logger.info(f"📞 แก้ไขรูปแบบหมายเลขโทรศัพท์ในคอลัมน์ '{column}'")
+            
+            results[column] = (uniques.to_numpy() if codes is None
+                               else uniques.to_numpy()[codes])
+        
+        # ใส่อาร์เรย์ผลลัพธ์เป็นคอลัมน์โดยตรง ไม่รวมเป็นตารางกลางก่อน
+        # (การรวมเป็น block เดียวต้องคัดลอกข้อมูลทุกคอลัมน์อีกรอบ)
+        for column, values in results.items():
+            data[column] = values
                     
         return data
     
     def _detect_outliers(self, data: pd.DataFrame) -> pd.DataFrame:
         """ตรวจสอบข้อมูลผิดปกติ (Outliers)"""
-        numeric_columns = data.select_dtypes(include=[np.number]).columns
+        numeric_data = data.loc[:, _dtype_masks(data)['number']]
         
-        for column in numeric_columns:
-            # ใช้วิธี IQR (Interquartile Range)
-            Q1 = data[column].quantile(0.25)
-            Q3 = data[column].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outliers = data[(data[column] < lower_bound) | (data[column] > upper_bound)]
+        # ใช้วิธี IQR (Interquartile Range) คำนวณ quantile ทุกคอลัมน์ในครั้งเดียว
+        quartiles = numeric_data.quantile([0.25, 0.75])
+        Q1 = quartiles.loc[0.25]
+        Q3 = quartiles.loc[0.75]
+        IQR = Q3 - Q1
+        
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        
+        # นับจำนวนข้อมูลผิดปกติของทุกคอลัมน์พร้อมกัน
+        if njit is not None and numeric_data.size >= _NUMBA_MIN_CELLS:
+            # ข้อมูลใหญ่: เทียบและนับในรอบเดียวต่อคอลัมน์ ไม่ต้องสร้าง mask กลาง
+            values = np.asfortranarray(
+                numeric_data.to_numpy(dtype=np.float64, na_value=np.nan))
+            outlier_counts = pd.Series(
+                _count_outliers(values, lower_bound.to_numpy(dtype=np.float64),
+                                upper_bound.to_numpy(dtype=np.float64)),
+                index=numeric_data.columns)
+        else:
+            outlier_counts = (numeric_data.lt(lower_bound, axis=1) |
+                              numeric_data.gt(upper_bound, axis=1)).sum()
+        
+        for column, outlier_count in outlier_counts[outlier_counts > 0].items():
+            self.logger.info(f"🎯 พบข้อมูลผิดปกติในคอลัมน์ '{column}': {outlier_count} จุด")
             
-            if len(outliers) > 0:
-                outlier_count = len(outliers)
-                self.logger.info(f"🎯 พบข้อมูลผิดปกติในคอลัมน์ '{column}': {outlier_count} จุด")
-                
-                # บันทึกข้อมูลผิดปกติ (ไม่ลบออก แค่แจ้งเตือน)
-                self.cleaning_log.append(f"⚠️ คอลัมน์ '{column}': {outlier_count} ข้อมูลผิดปกติ")
+            # บันทึกข้อมูลผิดปกติ (ไม่ลบออก แค่แจ้งเตือน)
+            self.cleaning_log.append(f"⚠️ คอลัมน์ '{column}': {outlier_count} ข้อมูลผิดปกติ")
                 
         return data
     
@@ -243,27 +458,29 @@ class DataCleaner:
         """ตรวจสอบความสอดคล้องของข้อมูล"""
         # ตรวจสอบความสอดคล้องของข้อมูลประเภทต่างๆ
         consistency_issues = []
+        masks = _dtype_masks(data)
         
         # ตรวจสอบรูปแบบวันที่
-        date_columns = data.select_dtypes(include=['datetime64[ns]']).columns
+        # นับจาก mask โดยตรง ไม่ต้องสร้างตารางย่อยเพียงเพื่อหาความยาว
+        date_columns = data.columns[masks['datetime']]
+        now = datetime.now()
         for column in date_columns:
-            future_dates = data[data[column] > datetime.now()]
-            if len(future_dates) > 0:
-                issue = f"คอลัมน์ '{column}': พบวันที่ในอนาคต {len(future_dates)} จุด"
+            future_count = int((data[column] > now).sum())
+            if future_count > 0:
+                issue = f"คอลัมน์ '{column}': พบวันที่ในอนาคต {future_count} จุด"
                 consistency_issues.append(issue)
                 self.logger.warning(f"⚠️ {issue}")
         
-        # ตรวจสอบค่าติดลบในคอลัมน์ที่ไม่ควรติดลบ
-        positive_columns = [col for col in data.columns if any(keyword in col.lower() 
+        # ตรวจสอบค่าติดลบในคอลัมน์ที่ไม่ควรติดลบ (เฉพาะคอลัมน์ int64/float64)
+        positive_columns = [col for col in data.columns[masks['int_float']] if any(keyword in col.lower() 
                           for keyword in ['age', 'price', 'amount', 'quantity', 'count'])]
         
         for column in positive_columns:
-            if column in data.columns and data[column].dtype in ['int64', 'float64']:
-                negative_values = data[data[column] < 0]
-                if len(negative_values) > 0:
-                    issue = f"คอลัมน์ '{column}': พบค่าติดลบ {len(negative_values)} จุด"
-                    consistency_issues.append(issue)
-                    self.logger.warning(f"⚠️ {issue}")
+            negative_count = int((data[column] < 0).sum())
+            if negative_count > 0:
+                issue = f"คอลัมน์ '{column}': พบค่าติดลบ {negative_count} จุด"
+                consistency_issues.append(issue)
+                self.logger.warning(f"⚠️ {issue}")
         
         if consistency_issues:
             self.cleaning_log.extend([f"⚠️ {issue}" for issue in consistency_issues])
@@ -272,79 +489,77 @@ class DataCleaner:
             
         return data
     
-    def _is_date_column(self, series: pd.Series) -> bool:
+    def _is_date_column(self, series: pd.Series,
+                        sample: Optional[pd.Series] = None) -> bool:
         """ตรวจสอบว่าคอลัมน์เป็นข้อมูลวันที่หรือไม่"""
         if series.dtype == 'object':
-            sample = series.dropna().head(10)
-            date_patterns = [
-                r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                r'\d{2}/\d{2}/\d{4}',  # DD/MM/YYYY
-                r'\d{2}-\d{2}-\d{4}',  # DD-MM-YYYY
-            ]
-            
-            for item in sample:
-                if isinstance(item, str):
-                    for pattern in date_patterns:
-                        if re.match(pattern, item.strip()):
-                            return True
+            if sample is None:
+                sample = _head_sample(series)
+            # คัดรูปแบบด้วย regex ก่อน (กันตัวเลขล้วนถูกตีความเป็นวันที่)
+            if not _sample_matches(sample, _DATE_RE):
+                return False
+            # ให้ตัวแปลงวันที่ของ pandas ยืนยันว่าตัวอย่างส่วนใหญ่แปลงได้จริง
+            strings = sample[sample.map(lambda item: isinstance(item, str))]
+            parsed = pd.to_datetime(strings.str.strip(), errors='coerce', format='mixed')
+            return bool(parsed.notna().sum() > len(sample) * _DATE_PARSE_RATIO)
         return False
     
-    def _is_numeric_column(self, series: pd.Series) -> bool:
+    def _is_numeric_column(self, series: pd.Series,
+                           sample: Optional[pd.Series] = None) -> bool:
         """ตรวจสอบว่าคอลัมน์เป็นข้อมูลตัวเลขหรือไม่"""
         if series.dtype == 'object':
+            if sample is None:
+                sample = _head_sample(series)
             try:
-                pd.to_numeric(series.dropna().head(10), errors='raise')
+                pd.to_numeric(sample, errors='raise')
                 return True
             except (ValueError, TypeError):
                 return False
         return False
     
-    def _is_email_column(self, series: pd.Series) -> bool:
+    def _is_email_column(self, series: pd.Series,
+                         sample: Optional[pd.Series] = None) -> bool:
         """ตรวจสอบว่าคอลัมน์เป็นข้อมูลอีเมลหรือไม่"""
-        sample = series.dropna().head(10)
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        
-        for item in sample:
-            if isinstance(item, str) and re.match(email_pattern, item.strip()):
-                return True
-        return False
+        if sample is None:
+            sample = _head_sample(series)
+        return _sample_matches(sample, _EMAIL_RE)
     
-    def _is_phone_column(self, series: pd.Series) -> bool:
+    def _is_phone_column(self, series: pd.Series,
+                         sample: Optional[pd.Series] = None) -> bool:
         """ตรวจสอบว่าคอลัมน์เป็นข้อมูลหมายเลขโทรศัพท์หรือไม่"""
-        sample = series.dropna().head(10)
-        phone_patterns = [
-            r'\d{3}-\d{3}-\d{4}',      # 123-456-7890
-            r'\(\d{3}\)\s\d{3}-\d{4}', # (123) 456-7890
-            r'\d{10}',                 # 1234567890
-        ]
-        
-        for item in sample:
-            if isinstance(item, str):
-                for pattern in phone_patterns:
-                    if re.match(pattern, item.strip()):
-                        return True
-        return False
+        if sample is None:
+            sample = _head_sample(series)
+        return _sample_matches(sample, _PHONE_RE)
     
     def _standardize_emails(self, series: pd.Series) -> pd.Series:
         """แก้ไขรูปแบบอีเมลให้มาตรฐาน"""
+        arr = _to_arrow(series)
+        if arr is not None:
+            return _from_arrow(pc.utf8_trim_whitespace(pc.ascii_lower(arr)), series)
         return series.str.lower().str.strip()
     
     def _standardize_phones(self, series: pd.Series) -> pd.Series:
         """แก้ไขรูปแบบหมายเลขโทรศัพท์ให้มาตรฐาน"""
-        # ลบอักขระที่ไม่ใช่ตัวเลข
-        cleaned = series.str.replace(r'[^\d]', '', regex=True)
+        arr = _to_arrow(series)
+        if arr is not None:
+            # ข้อความเป็น ASCII ล้วน ตัวเลขจึงมีแค่ 0-9 ทำทั้งสองขั้นด้วย kernel ของ Arrow
+            arr = pc.replace_substring_regex(arr, pattern=r'[^0-9]', replacement='')
+            arr = pc.replace_substring_regex(
+                arr, pattern=r'^([0-9]{3})([0-9]{3})([0-9]{4})$', replacement=r'\1-\2-\3')
+            return _from_arrow(arr, series)
         
-        # จัดรูปแบบเป็น XXX-XXX-XXXX
-        formatted = cleaned.apply(lambda x: f"{x[:3]}-{x[3:6]}-{x[6:]}" if len(x) == 10 else x)
+        # ลบอักขระที่ไม่ใช่ตัวเลข
+        cleaned = series.str.replace(_NON_DIGIT_RE, '', regex=True)
         
-        return formatted
+        # จัดรูปแบบเป็น XXX-XXX-XXXX (ค่าที่ไม่ครบ 10 หลักคงไว้ตามเดิม)
+        return cleaned.str.replace(_PHONE_PARTS_RE, r'\1-\2-\3', regex=True)
     
     def _log_data_info(self, stage: str, data: pd.DataFrame):
         """บันทึกข้อมูลสถิติของข้อมูล"""
         self.logger.info(f"📊 {stage}:")
         self.logger.info(f"   - จำนวนแถว: {len(data):,}")
         self.logger.info(f"   - จำนวนคอลัมน์: {len(data.columns)}")
-        self.logger.info(f"   - ข้อมูลที่ขาด: {data.isnull().sum().sum():,} จุด")
+        self.logger.info(f"   - ข้อมูลที่ขาด: {_missing_counts(data).sum():,} จุด")
         self.logger.info(f"   - ขนาดข้อมูล: {data.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
     
     def get_cleaning_summary(self) -> List[str]:
@@ -13,13 +13,92 @@ Handles loading and saving data from various sources including:
 import pandas as pd
 import numpy as np
 import logging
+import codecs
+import functools
+import glob
+import hashlib
+import os
+import stat as stat_module
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Iterator
 import json
+import csv
+import re
 import sqlite3
+import zipfile
+import xml.etree.ElementTree as ET
 from sqlalchemy import create_engine
 import requests
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional here; fall back to pandas' C parser
+    pa = None
+
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite  # Arrow-native SQLite driver
+except ImportError:
+    adbc_sqlite = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import python_calamine  # noqa: F401  (Rust Excel reader, pandas >= 2.2)
+    _EXCEL_ENGINE = ('calamine'
+                     if tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+                     else None)
+except ImportError:  # pandas' default openpyxl reader (already read-only)
+    _EXCEL_ENGINE = None
+
+try:
+    import cchardet as _chardet  # C bindings, much faster than chardet
+except ImportError:
+    try:
+        import charset_normalizer as _chardet  # chardet-compatible detect()
+    except ImportError:
+        try:
+            import chardet as _chardet
+        except ImportError:
+            _chardet = None
+
+# pandas' default NA strings (keep_default_na=True), mirrored for the Arrow reader
+_PANDAS_NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+])
+
+# read_csv options the Arrow CSV reader can reproduce exactly
+_ARROW_CSV_OPTIONS = frozenset([
+    'encoding', 'delimiter', 'quotechar', 'na_values', 'keep_default_na',
+    'low_memory', 'dtype_backend', 'usecols'
+])
+
+# Numeric text that Arrow converts but pd.read_csv does not (hex, a leading
+# '+', integers too long for int64), checked on numeric columns read as text
+_ARROW_NUMBER_MISMATCH = r'^[+-]?0[xX]|^\+|\d{19}'
+
+# A record ending at a line break with the next record starting the next line
+_JSONL_BOUNDARY_RE = re.compile(rb'\}[ \t]*\r?\n[ \t\r\n]*\{')
+
+# Rows sampled for the deep (per-string) memory estimate
+_MEMORY_SAMPLE_ROWS = 10_000
+
+# Columns listed individually in the missing-values log
+_MISSING_LOG_LIMIT = 20
+
+# Formats whose parsed result is worth caching as Parquet
+_CACHED_FORMATS = frozenset(['csv', 'excel', 'xlsx', 'xls', 'json', 'jsonl', 'ndjson'])
+
 
 class DataLoader:
     """
@@ -43,11 +122,28 @@ class DataLoader:
             'xlsx': self._load_excel,
             'xls': self._load_excel,
             'json': self._load_json,
+            'jsonl': self._load_json,
+            'ndjson': self._load_json,
             'parquet': self._load_parquet,
             'sql': self._load_from_database,
             'sqlite': self._load_from_sqlite
         }
         
+        # Opened Parquet datasets, keyed by path -> ((mtime_ns, size), dataset)
+        self._parquet_datasets = {}
+        
+        # On-disk cache of parsed files (Parquet, keyed by path/mtime/size/options);
+        # off unless the config enables it, and bounded to cache_max_size_mb
+        processing = (config or {}).get('processing') or {}
+        self.cache_enabled = bool(processing.get('cache_enabled', False)) and pa is not None
+        self.cache_dir = Path(
+            processing.get('cache_dir', '~/.dataloader_cache')
+        ).expanduser()
+        self.cache_max_bytes = int(processing.get('cache_max_size_mb', 1024)) << 20
+        
+        # pandas dtype_backend for loaded frames (None keeps NumPy dtypes)
+        self.dtype_backend = processing.get('dtype_backend')
+        
         # Default settings
         self.default_csv_settings = {
             'encoding': 'utf-8',
@@ -58,7 +154,8 @@ class DataLoader:
             'low_memory': False
         }
     
-    def load_data(self, file_path: str, **kwargs) -> pd.DataFrame:
+    def load_data(self, file_path: str,
+                  **kwargs) -> Union[pd.DataFrame, Dict[Any, pd.DataFrame]]:
         """
         Load data from file with automatic format detection.
         
@@ -67,7 +164,9 @@ class DataLoader:
             **kwargs: Additional parameters for specific loaders
             
         Returns:
-            Loaded DataFrame
+            Loaded DataFrame (a dict of sheet -> DataFrame for Excel files
+            loaded with sheet_name=None or a list of sheets); directories
+            are loaded with load_dataset
             
         Raises:
             ValueError: If file format is not supported
@@ -75,9 +174,15 @@ class DataLoader:
         """
         path = Path(file_path)
         
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        if stat_module.S_ISDIR(stat.st_mode):
+            # A directory of shards (Parquet by default)
+            return self.load_dataset(file_path, **kwargs)
+        
         # Detect file format
         file_extension = path.suffix.lower().lstrip('.')
         
@@ -86,9 +191,28 @@ class DataLoader:
         
         self.logger.info(f"Loading data from {file_path} (format: {file_extension})")
         
-        # Load data using appropriate method
-        loader_func = self.supported_formats[file_extension]
-        data = loader_func(file_path, **kwargs)
+        cache_path = None
+        if self.cache_enabled and file_extension in _CACHED_FORMATS:
+            cache_path = self._cache_path(path, stat, kwargs)
+            data = self._read_cache(cache_path)
+        else:
+            data = None
+        
+        if data is None:
+            # Load data using appropriate method
+            loader_func = self.supported_formats[file_extension]
+            data = loader_func(file_path, **kwargs)
+            
+            if cache_path is not None:
+                self._write_cache(cache_path, data)
+        
+        if isinstance(data, dict):
+            # Several Excel sheets (sheet_name=None or a list)
+            for sheet, frame in data.items():
+                self.logger.info(
+                    f"Loaded sheet {sheet!r}: {len(frame)} rows and {len(frame.columns)} columns"
+                )
+            return data
         
         self.logger.info(f"Loaded {len(data)} rows and {len(data.columns)} columns")
         
@@ -97,6 +221,136 @@ class DataLoader:
         
         return data
     
+    def load_dataset(self, source: Union[str, List[str]], columns: Optional[List[str]] = None,
+                     filters: Optional[Union[List, Any]] = None,
+                     format: str = 'parquet') -> pd.DataFrame:
+        """
+        Load many files of one format as a single DataFrame.
+        
+        With pyarrow the files are scanned as one dataset: files and row
+        groups are read in parallel threads, only ``columns`` are decoded
+        and ``filters`` skip row groups by their statistics. Directories may
+        use hive-style partitions (``year=2024/``), which become columns.
+        
+        Args:
+            source: Directory, glob pattern (``data/*.parquet``) or list of files
+            columns: Columns to read (None reads all columns)
+            filters: Row filter, either DNF tuples such as
+                ``[('age', '>', 30)]`` or a ``pyarrow.compute.Expression``
+            format: File format of the shards ('parquet', 'csv', ...)
+            
+        Returns:
+            DataFrame with the rows of all files, in file order
+            
+        Raises:
+            FileNotFoundError: If no files match the source
+        """
+        if isinstance(source, (list, tuple)):
+            paths = [str(p) for p in source]
+        elif Path(source).is_dir():
+            paths = None
+        else:
+            paths = sorted(glob.glob(str(source)))
+        
+        if paths is not None and not paths:
+            raise FileNotFoundError(f"No files found: {source}")
+        
+        self.logger.info(f"Loading dataset from {source} (format: {format})")
+        
+        if pa is not None:
+            if paths is None:
+                dataset = pa_ds.dataset(str(source), format=format, partitioning='hive')
+            else:
+                dataset = pa_ds.dataset(paths, format=format)
+            if isinstance(filters, list):
+                filters = pq.filters_to_expression(filters)
+            
+            table = dataset.to_table(columns=columns, filter=filters, use_threads=True)
+            types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+            data = table.to_pandas(types_mapper=types_mapper, self_destruct=True)
+        else:
+            if paths is None:
+                paths = sorted(str(p) for p in Path(source).glob(f'**/*.{format}'))
+            reader_params = {} if filters is None else {'filters': filters}
+            if columns is not None:
+                reader_params['columns' if format == 'parquet' else 'usecols'] = columns
+            data = pd.concat([self.load_data(p, **reader_params) for p in paths],
+                             ignore_index=True)
+        
+        self.logger.info(f"Loaded {len(data)} rows and {len(data.columns)} columns")
+        self._log_data_info(data)
+        
+        return data
+    
+    def iter_load_data(self, file_path: str, chunksize: Optional[int] = None,
+                       **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Load data from file in chunks, for files too large to hold in memory.
+        
+        CSV files are read with pandas' chunked reader, Parquet files in
+        record batches and JSON Lines files (.jsonl/.ndjson, or ``lines=True``)
+        in chunks.
+        Other formats cannot be streamed and are yielded as one DataFrame.
+        Unlike load_data, column types are inferred per chunk.
+        
+        Args:
+            file_path: Path to data file
+            chunksize: Rows per chunk (defaults to processing.chunk_size
+                from the config, or 100,000)
+            **kwargs: Additional parameters for the underlying reader
+            
+        Yields:
+            DataFrame chunks in file order
+            
+        Raises:
+            ValueError: If file format is not supported
+            FileNotFoundError: If file doesn't exist
+        """
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        file_extension = path.suffix.lower().lstrip('.')
+        
+        if file_extension not in self.supported_formats:
+            raise ValueError(f"Unsupported file format: {file_extension}")
+        
+        if chunksize is None:
+            processing = (self.config or {}).get('processing') or {}
+            chunksize = processing.get('chunk_size') or 100_000
+        
+        self.logger.info(
+            f"Streaming data from {file_path} (format: {file_extension}, "
+            f"chunksize: {chunksize})"
+        )
+        
+        if file_extension == 'csv':
+            csv_params = {**self.default_csv_settings, **kwargs}
+            if 'encoding' not in kwargs:
+                csv_params['encoding'] = self._detect_encoding(file_path)
+            if self.dtype_backend:
+                csv_params.setdefault('dtype_backend', self.dtype_backend)
+            with pd.read_csv(file_path, chunksize=chunksize, **csv_params) as reader:
+                yield from reader
+        
+        elif file_extension == 'parquet' and pa is not None and not kwargs:
+            parquet_file = pq.ParquetFile(file_path)
+            types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+            for batch in parquet_file.iter_batches(batch_size=chunksize):
+                yield batch.to_pandas(types_mapper=types_mapper)
+        
+        elif file_extension in ['jsonl', 'ndjson'] or (
+                file_extension == 'json' and kwargs.get('lines')):
+            kwargs['lines'] = True
+            if self.dtype_backend:
+                kwargs.setdefault('dtype_backend', self.dtype_backend)
+            with pd.read_json(file_path, chunksize=chunksize, **kwargs) as reader:
+                yield from reader
+        
+        else:
+            yield self.load_data(file_path, **kwargs)
+    
     def _load_csv(self, file_path: str, **kwargs) -> pd.DataFrame:
         """
         Load data from CSV file.
@@ -110,13 +364,17 @@ class DataLoader:
         """
         # Merge default settings with user provided kwargs
         csv_params = {**self.default_csv_settings, **kwargs}
+        if self.dtype_backend:
+            csv_params.setdefault('dtype_backend', self.dtype_backend)
         
         try:
             # Try to detect encoding if not specified
             if 'encoding' not in kwargs:
                 csv_params['encoding'] = self._detect_encoding(file_path)
             
-            data = pd.read_csv(file_path, **csv_params)
+            data = self._read_csv_arrow(file_path, csv_params)
+            if data is None:
+                data = pd.read_csv(file_path, **csv_params)
             
             # Handle empty DataFrame
             if data.empty:
@@ -130,24 +388,230 @@ class DataLoader:
             csv_params['encoding'] = 'latin-1'
             return pd.read_csv(file_path, **csv_params)
     
-    def _load_excel(self, file_path: str, **kwargs) -> pd.DataFrame:
+    def _read_csv_arrow(self, file_path: str,
+                        csv_params: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """
+        Read a CSV file with pyarrow's multithreaded CSV reader.
+        
+        The result matches pd.read_csv with the same parameters: date/time
+        looking columns stay strings, missing strings are NaN and all-empty
+        columns are float64. With ``dtype_backend='pyarrow'`` the Arrow
+        columns are wrapped in ArrowDtype without conversion. Columns left
+        out of ``usecols`` (names or positions) are never converted.
+        
+        Numeric columns are read as text first: if any value is hex, has a
+        leading '+' or more than 18 digits (which Arrow would turn into a
+        number or a lossy float64), the file is left to pandas. Set
+        ``processing.csv_engine: c`` in the config to always use pandas'
+        parser instead.
+        
+        Args:
+            file_path: Path to CSV file
+            csv_params: Merged read_csv parameters
+            
+        Returns:
+            DataFrame, or None when pandas should parse the file instead
+            (pyarrow missing or disabled, unsupported options, ragged rows,
+            duplicate or blank header names, undecodable bytes, no data rows,
+            whitespace-only lines in a single-column file)
+        """
+        processing = (self.config or {}).get('processing') or {}
+        if processing.get('csv_engine', 'pyarrow') != 'pyarrow':
+            return None
+        if pa is None or not set(csv_params) <= _ARROW_CSV_OPTIONS:
+            return None
+        arrow_dtypes = csv_params.get('dtype_backend') == 'pyarrow'
+        if csv_params.get('dtype_backend') and not arrow_dtypes:
+            return None
+        
+        usecols = csv_params.get('usecols')
+        if usecols is not None:
+            if callable(usecols) or isinstance(usecols, str):
+                return None
+            usecols = list(usecols)
+            by_position = all(isinstance(c, int) and not isinstance(c, bool) for c in usecols)
+            if not by_position and not all(isinstance(c, str) for c in usecols):
+                return None
+        
+        na_values = csv_params.get('na_values') or []
+        if isinstance(na_values, str):
+            na_values = [na_values]
+        if isinstance(na_values, dict) or not all(isinstance(v, str) for v in na_values):
+            return None
+        null_values = set(na_values)
+        if csv_params.get('keep_default_na', True):
+            null_values |= _PANDAS_NA_VALUES
+        
+        parse_options = pa_csv.ParseOptions(
+            delimiter=csv_params.get('delimiter', ','),
+            quote_char=csv_params.get('quotechar', '"'),
+            newlines_in_values=True
+        )
+        convert_options = pa_csv.ConvertOptions(
+            null_values=sorted(null_values),
+            true_values=['True', 'TRUE', 'true'],
+            false_values=['False', 'FALSE', 'false'],
+            strings_can_be_null=True
+        )
+        encoding = csv_params.get('encoding') or 'utf-8'
+        
+        try:
+            # Read through a memory map: the tokenizer works on the mapped
+            # pages instead of copies made by read() calls
+            with pa.memory_map(file_path, 'r') as source:
+                # Probe the first block for columns Arrow would parse as dates or
+                # times; pandas leaves those as text, so read them as strings
+                probe = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(encoding=encoding),
+                    parse_options=parse_options,
+                    convert_options=convert_options
+                )
+                schema = probe.schema
+                probe.close()
+                
+                # pandas mangles duplicate/blank header names and raises on
+                # bytes that are invalid in the encoding (Arrow reads them as binary)
+                names = schema.names
+                if len(set(names)) != len(names) or '' in names:
+                    return None
+                if any(pa.types.is_binary(field.type) for field in schema):
+                    return None
+                if usecols is not None:
+                    # pandas keeps file order whatever the order of usecols
+                    if by_position:
+                        if not all(0 <= c < len(names) for c in usecols):
+                            return None
+                        selected = set(names[c] for c in usecols)
+                    else:
+                        selected = set(usecols)
+                        if not selected <= set(names):
+                            return None
+                    convert_options.include_columns = [n for n in names if n in selected]
+                # With a '+' or '0x' anywhere in the file, numeric columns are
+                # read as text, checked and converted afterwards
+                check_text = self._may_have_prefixed_numbers(file_path, encoding)
+                numeric = {field.name: field.type for field in schema
+                           if check_text and (pa.types.is_integer(field.type)
+                                              or pa.types.is_floating(field.type))}
+                convert_options.column_types = {
+                    field.name: pa.string() for field in schema
+                    if pa.types.is_temporal(field.type) or field.name in numeric
+                }
+                
+                source.seek(0)
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(encoding=encoding,
+                                                    block_size=64 << 20),
+                    parse_options=parse_options,
+                    convert_options=convert_options
+                )
+            
+            # pandas skips lines of only spaces/tabs (skip_blank_lines); with a
+            # single column Arrow reads them as values instead
+            if len(names) == 1 and table.num_columns == 1:
+                column = table.column(0)
+                if (pa.types.is_string(column.type)
+                        and pc.any(pc.match_substring_regex(column, r'^[ \t]+$')).as_py()):
+                    return None
+            
+            for name, numeric_type in numeric.items():
+                if name not in table.column_names:
+                    continue
+                i = table.schema.get_field_index(name)
+                column = pc.utf8_trim(table.column(i), ' \t')
+                if pc.any(pc.match_substring_regex(column, _ARROW_NUMBER_MISMATCH)).as_py():
+                    return None
+                table = table.set_column(i, name, pc.cast(column, numeric_type))
+            
+            # Integers beyond int64 become float64 in Arrow; pandas keeps
+            # them exact (uint64 or text)
+            for field, column in zip(table.schema, table.columns):
+                if pa.types.is_floating(field.type) and field.name not in numeric:
+                    largest = pc.max(pc.abs(column)).as_py()
+                    if largest is not None and largest >= 2 ** 63:
+                        return None
+        except (pa.ArrowInvalid, OSError, UnicodeDecodeError, LookupError):
+            return None
+        
+        if table.num_rows == 0 or any(pa.types.is_binary(t) for t in table.schema.types):
+            return None
+        
+        if arrow_dtypes:
+            return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+        
+        # Columns with no values at all become float64 NaN, as in pandas
+        for i, field in enumerate(table.schema):
+            if pa.types.is_null(field.type):
+                table = table.set_column(i, field.name,
+                                         pa.nulls(table.num_rows, pa.float64()))
+        
+        null_columns = [field.name for field, column in zip(table.schema, table.columns)
+                        if column.null_count and not pa.types.is_floating(field.type)]
+        data = table.to_pandas(split_blocks=True, self_destruct=True)
+        
+        # Arrow yields None for missing strings/bools; pandas uses NaN
+        for column in null_columns:
+            if data[column].dtype == object:
+                values = data[column].to_numpy()
+                values[pd.isna(values)] = np.nan
+                data[column] = values
+        
+        return data
+    
+    @staticmethod
+    def _may_have_prefixed_numbers(file_path: str, encoding: str) -> bool:
+        """Whether the file may hold '+'-prefixed or hex numbers (a byte scan)."""
+        if codecs.lookup(encoding).name.startswith(('utf-16', 'utf-32')):
+            return True  # Not ASCII-compatible; always check the text
+        previous = b''
+        with open(file_path, 'rb') as f:
+            while True:
+                block = f.read(16 << 20)
+                if not block:
+                    return False
+                if b'+' in block:
+                    return True
+                # '0x'/'0X': an x (either case) right after a '0'
+                codes = np.frombuffer(previous + block, dtype=np.uint8)
+                after_x = np.flatnonzero((codes[1:] | 0x20) == ord('x'))
+                if (codes[after_x] == ord('0')).any():
+                    return True
+                previous = block[-1:]
+    
+    def _load_excel(self, file_path: str,
+                    **kwargs) -> Union[pd.DataFrame, Dict[Any, pd.DataFrame]]:
         """
         Load data from Excel file.
         
+        Uses the calamine engine when python-calamine is installed; pass
+        ``sheet_name``/``usecols`` to limit what the parser reads. With
+        ``sheet_name=None`` (all sheets) or a list of sheets, the sheets are
+        parsed in parallel threads and returned as a dict, as read_excel does.
+        
         Args:
             file_path: Path to Excel file
             **kwargs: Additional pandas.read_excel parameters
             
         Returns:
-            DataFrame with loaded data
+            DataFrame with loaded data, or a dict of sheet -> DataFrame
         """
         # Default Excel parameters
         excel_params = {
             'na_values': self.default_csv_settings['na_values'],
             **kwargs
         }
+        if _EXCEL_ENGINE:
+            excel_params.setdefault('engine', _EXCEL_ENGINE)
+        if self.dtype_backend:
+            excel_params.setdefault('dtype_backend', self.dtype_backend)
         
         try:
+            sheet_name = excel_params.get('sheet_name', 0)
+            if sheet_name is None or isinstance(sheet_name, list):
+                return self._load_excel_sheets(file_path, excel_params)
+            
             data = pd.read_excel(file_path, **excel_params)
             
             if data.empty:
@@ -159,10 +623,54 @@ class DataLoader:
             self.logger.error(f"Error loading Excel file: {e}")
             raise
     
+    def _load_excel_sheets(self, file_path: str,
+                           excel_params: Dict[str, Any]) -> Dict[Any, pd.DataFrame]:
+        """
+        Parse several sheets of one workbook concurrently.
+        
+        The workbook is opened once and each sheet is parsed in its own
+        thread (up to one per CPU).
+        
+        Args:
+            file_path: Path to Excel file
+            excel_params: Merged read_excel parameters including sheet_name
+            
+        Returns:
+            Dict of sheet -> DataFrame, keyed as read_excel would key it
+        """
+        parse_params = dict(excel_params)
+        sheet_name = parse_params.pop('sheet_name', None)
+        file_params = {key: parse_params.pop(key)
+                       for key in ('engine', 'engine_kwargs', 'storage_options')
+                       if key in parse_params}
+        
+        with pd.ExcelFile(file_path, **file_params) as excel_file:
+            sheets = excel_file.sheet_names if sheet_name is None else list(dict.fromkeys(sheet_name))
+            workers = min(len(sheets), os.cpu_count() or 1)
+            
+            def parse(sheet):
+                return excel_file.parse(sheet, **parse_params)
+            
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    frames = list(executor.map(parse, sheets))
+            else:
+                frames = [parse(sheet) for sheet in sheets]
+        
+        for sheet, frame in zip(sheets, frames):
+            if frame.empty:
+                self.logger.warning(f"Loaded Excel sheet {sheet!r} is empty")
+        
+        return dict(zip(sheets, frames))
+    
     def _load_json(self, file_path: str, **kwargs) -> pd.DataFrame:
         """
         Load data from JSON file.
         
+        JSON Lines files (.jsonl/.ndjson, or .json with one object per line)
+        are read with ``lines=True``, the same rules preview_data and
+        iter_load_data use.
+        
         Args:
             file_path: Path to JSON file
             **kwargs: Additional pandas.read_json parameters
@@ -170,6 +678,14 @@ class DataLoader:
         Returns:
             DataFrame with loaded data
         """
+        if self.dtype_backend:
+            kwargs.setdefault('dtype_backend', self.dtype_backend)
+        
+        if 'lines' not in kwargs and (
+                Path(file_path).suffix.lower() in ['.jsonl', '.ndjson']
+                or self._is_jsonl(file_path)):
+            kwargs['lines'] = True
+        
         try:
             data = pd.read_json(file_path, **kwargs)
             
@@ -181,8 +697,17 @@ class DataLoader:
         except Exception as e:
             self.logger.error(f"Error loading JSON file: {e}")
             # Try loading as regular JSON and converting to DataFrame
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw_data = f.read()
+            
+            if kwargs.get('lines'):
+                json_data = [_json_loads(line) for line in raw_data.splitlines() if line.strip()]
+            else:
+                try:
+                    json_data = _json_loads(raw_data)
+                except ValueError:
+                    # orjson rejects NaN/Infinity and integers beyond 64 bits
+                    json_data = json.loads(raw_data)
             
             if isinstance(json_data, list):
                 return pd.DataFrame(json_data)
@@ -191,24 +716,78 @@ class DataLoader:
             else:
                 raise ValueError("JSON data cannot be converted to DataFrame")
     
-    def _load_parquet(self, file_path: str, **kwargs) -> pd.DataFrame:
+    def _load_parquet(self, file_path: str, columns: Optional[List[str]] = None,
+                      filters: Optional[Union[List, Any]] = None,
+                      **kwargs) -> pd.DataFrame:
         """
         Load data from Parquet file.
         
+        Column chunks outside ``columns`` are never read, and row groups whose
+        footer min/max statistics cannot satisfy ``filters`` are skipped.
+        
         Args:
             file_path: Path to Parquet file
+            columns: Columns to read (None reads all columns)
+            filters: Row filter, either DNF tuples such as
+                ``[('age', '>', 30)]`` or a ``pyarrow.compute.Expression``
             **kwargs: Additional pandas.read_parquet parameters
             
         Returns:
             DataFrame with loaded data
         """
+        dtype_backend = kwargs.pop('dtype_backend', self.dtype_backend)
+        
         try:
-            data = pd.read_parquet(file_path, **kwargs)
-            return data
+            if pa is not None and not kwargs and dtype_backend in (None, 'pyarrow'):
+                return self._scan_parquet(file_path, columns=columns, filters=filters,
+                                          arrow_dtypes=dtype_backend == 'pyarrow')
+            if dtype_backend:
+                kwargs['dtype_backend'] = dtype_backend
+            return pd.read_parquet(file_path, columns=columns, filters=filters, **kwargs)
         except Exception as e:
             self.logger.error(f"Error loading Parquet file: {e}")
             raise
     
+    def _scan_parquet(self, file_path: str, columns: Optional[List[str]] = None,
+                      filters: Optional[Union[List, Any]] = None,
+                      arrow_dtypes: bool = False) -> pd.DataFrame:
+        """
+        Scan a Parquet file through a cached pyarrow dataset.
+        
+        The dataset (and its parsed footer metadata) is reused across calls
+        until the file's modification time or size changes.
+        
+        Args:
+            file_path: Path to Parquet file
+            columns: Columns to read (None reads all columns)
+            filters: DNF filter tuples or a ``pyarrow.compute.Expression``
+            arrow_dtypes: Return ArrowDtype columns instead of NumPy dtypes
+            
+        Returns:
+            DataFrame with the selected columns and rows
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._parquet_datasets.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, pa_ds.dataset(str(path), format='parquet'))
+            self._parquet_datasets[path] = cached
+        dataset = cached[1]
+        
+        if columns is not None:
+            # Keep stored index columns, as pd.read_parquet does
+            pandas_metadata = dataset.schema.pandas_metadata or {}
+            index_columns = [c for c in pandas_metadata.get('index_columns', [])
+                             if isinstance(c, str) and c not in columns]
+            columns = list(columns) + index_columns
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters)
+        
+        table = dataset.to_table(columns=columns, filter=filters)
+        return table.to_pandas(types_mapper=pd.ArrowDtype if arrow_dtypes else None)
+    
     def _load_from_database(self, connection_string: str, query: str = None, 
                            table_name: str = None, **kwargs) -> pd.DataFrame:
         """
@@ -244,6 +823,9 @@ class DataLoader:
         """
         Load data from SQLite database.
         
+        Uses the ADBC SQLite driver (adbc-driver-sqlite) when it is installed,
+        which returns columnar Arrow data instead of Python row tuples.
+        
         Args:
             file_path: Path to SQLite file
             query: SQL query to execute
@@ -253,29 +835,67 @@ class DataLoader:
         Returns:
             DataFrame with loaded data
         """
+        if table_name and not query:
+            # Quote the identifier so the name is never parsed as SQL
+            query = 'SELECT * FROM "{}"'.format(table_name.replace('"', '""'))
+        if self.dtype_backend:
+            kwargs.setdefault('dtype_backend', self.dtype_backend)
+        
+        if query and adbc_sqlite is not None and set(kwargs) <= {'dtype_backend'}:
+            data = self._read_sqlite_adbc(file_path, query, kwargs.get('dtype_backend'))
+            if data is not None:
+                return data
+        
         try:
             conn = sqlite3.connect(file_path)
+            try:
+                if query:
+                    data = pd.read_sql_query(query, conn, **kwargs)
+                else:
+                    # List all tables
+                    tables = pd.read_sql_query(
+                        "SELECT name FROM sqlite_master WHERE type='table'", 
+                        conn
+                    )
+                    self.logger.info(f"Available tables: {tables['name'].tolist()}")
+                    raise ValueError("Either query or table_name must be provided")
+            finally:
+                conn.close()
             
-            if query:
-                data = pd.read_sql_query(query, conn, **kwargs)
-            elif table_name:
-                data = pd.read_sql_query(f"SELECT * FROM {table_name}", conn, **kwargs)
-            else:
-                # List all tables
-                tables = pd.read_sql_query(
-                    "SELECT name FROM sqlite_master WHERE type='table'", 
-                    conn
-                )
-                self.logger.info(f"Available tables: {tables['name'].tolist()}")
-                raise ValueError("Either query or table_name must be provided")
-            
-            conn.close()
             return data
             
         except Exception as e:
             self.logger.error(f"Error loading from SQLite: {e}")
             raise
     
+    def _read_sqlite_adbc(self, file_path: str, query: str,
+                          dtype_backend: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Run a query through the ADBC SQLite driver.
+        
+        Args:
+            file_path: Path to SQLite file
+            query: SQL query to execute
+            dtype_backend: None for NumPy dtypes, 'pyarrow' for ArrowDtype
+            
+        Returns:
+            DataFrame, or None when pandas should run the query instead
+            (other dtype backends, or a column the driver cannot type,
+            such as one mixing integers and text)
+        """
+        if dtype_backend not in (None, 'pyarrow'):
+            return None
+        
+        try:
+            with adbc_sqlite.connect(file_path) as conn, conn.cursor() as cursor:
+                cursor.execute(query)
+                table = cursor.fetch_arrow_table()
+        except adbc_sqlite.Error as e:
+            self.logger.debug(f"ADBC SQLite read failed, using sqlite3: {e}")
+            return None
+        
+        return table.to_pandas(types_mapper=pd.ArrowDtype if dtype_backend == 'pyarrow' else None)
+    
     def save_data(self, data: pd.DataFrame, file_path: str, **kwargs) -> None:
         """
         Save DataFrame to file with automatic format detection.
@@ -338,41 +958,261 @@ class DataLoader:
         data.to_json(file_path, **json_params)
     
     def _save_parquet(self, data: pd.DataFrame, file_path: str, **kwargs) -> None:
-        """Save DataFrame to Parquet file."""
-        data.to_parquet(file_path, **kwargs)
+        """
+        Save DataFrame to Parquet file.
+        
+        With pyarrow, defaults to ZSTD compression, dictionary encoding and
+        min/max statistics per row group, and records the first column the
+        data is sorted on so readers can skip row groups by range.
+        """
+        if pa is None or kwargs.get('engine', 'pyarrow') != 'pyarrow':
+            data.to_parquet(file_path, **kwargs)
+            return
+        
+        parquet_params = {
+            'engine': 'pyarrow',
+            'compression': 'zstd',
+            'compression_level': 3,
+            'use_dictionary': True,
+            'row_group_size': 256_000,
+            'write_statistics': True,
+            'data_page_size': 1 << 20,
+            **kwargs
+        }
+        if 'compression' in kwargs and 'compression_level' not in kwargs:
+            # The ZSTD level doesn't apply to a codec chosen by the caller
+            del parquet_params['compression_level']
+        
+        if 'sorting_columns' not in parquet_params and hasattr(pq, 'SortingColumn'):
+            for position, column in enumerate(data.columns):
+                values = data.iloc[:, position]
+                if (pd.api.types.is_numeric_dtype(values) or
+                        pd.api.types.is_datetime64_any_dtype(values)) and \
+                        not pd.api.types.is_bool_dtype(values) and \
+                        len(values) > 1 and values.is_monotonic_increasing:
+                    parquet_params['sorting_columns'] = [pq.SortingColumn(position)]
+                    break
+        
+        data.to_parquet(file_path, **parquet_params)
     
     def _detect_encoding(self, file_path: str) -> str:
         """
         Detect file encoding.
         
+        Results are shared by all loaders and remembered per file until it
+        is modified, so preview, file info and load only sample it once.
+        
         Args:
             file_path: Path to file
             
         Returns:
             Detected encoding
         """
-        try:
-            import chardet
-            
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # Read first 10KB
-                result = chardet.detect(raw_data)
-                encoding = result['encoding']
-                confidence = result['confidence']
-                
-                self.logger.debug(
-                    f"Detected encoding: {encoding} (confidence: {confidence:.2f})"
-                )
-                
-                return encoding if confidence > 0.7 else 'utf-8'
-        
-        except ImportError:
+        if _chardet is None:
             self.logger.warning("chardet not available, using utf-8 encoding")
             return 'utf-8'
+        
+        try:
+            path = Path(file_path).resolve()
+            stat = path.stat()
+            return self._detect_encoding_cached(str(path), stat.st_mtime_ns, stat.st_size)
+        
         except Exception as e:
             self.logger.warning(f"Encoding detection failed: {e}, using utf-8")
             return 'utf-8'
     
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _detect_encoding_cached(file_path: str, mtime_ns: int, size: int) -> str:
+        """
+        Detect the encoding of one version of a file.
+        
+        Args:
+            file_path: Resolved path to file
+            mtime_ns: Modification time, part of the cache key
+            size: File size, part of the cache key
+            
+        Returns:
+            Detected encoding
+        """
+        with open(file_path, 'rb') as f:
+            raw_data = f.read(10000)  # Read first 10KB
+        
+        # Cut the sample at a line break so a multi-byte character split
+        # at the 10KB boundary doesn't rule out the real encoding
+        if len(raw_data) == 10000 and not raw_data.startswith((b'\xff\xfe', b'\xfe\xff')):
+            last_newline = raw_data.rfind(b'\n')
+            if last_newline > 0:
+                raw_data = raw_data[:last_newline + 1]
+        
+        try:
+            # Valid UTF-8 (including plain ASCII) needs no statistical guess
+            raw_data.decode('utf-8')
+            return 'utf-8-sig' if raw_data.startswith(b'\xef\xbb\xbf') else 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        result = _chardet.detect(raw_data)
+        encoding = result['encoding']
+        confidence = result['confidence'] or 0.0
+        
+        logging.getLogger(__name__).debug(
+            f"Detected encoding: {encoding} (confidence: {confidence:.2f})"
+        )
+        
+        return encoding if encoding and confidence > 0.7 else 'utf-8'
+    
+    def _cache_path(self, path: Path, stat: os.stat_result,
+                    kwargs: Dict[str, Any]) -> Path:
+        """
+        Get the cache file for a source file and its loader options.
+        
+        The key covers the resolved path, modification time, size and
+        every option that changes the parsed result, so edited files and
+        different reader settings never share an entry. The file name
+        starts with a hash of the path alone, so older entries for the
+        same source file can be found and removed.
+        """
+        processing = (self.config or {}).get('processing') or {}
+        options = json.dumps(
+            [kwargs, self.default_csv_settings, processing.get('csv_engine'),
+             self.dtype_backend, _EXCEL_ENGINE],
+            sort_keys=True, default=str
+        )
+        source = str(path.resolve())
+        source_key = hashlib.blake2b(source.encode(), digest_size=10).hexdigest()
+        key = hashlib.blake2b(
+            f"{source}|{stat.st_mtime_ns}|{stat.st_size}|{options}".encode(),
+            digest_size=10
+        ).hexdigest()
+        return self.cache_dir / f"{source_key}-{key}.parquet"
+    
+    def _read_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """Read a cached DataFrame, or None on a miss or unreadable entry."""
+        try:
+            table = pq.read_table(cache_path, memory_map=True)
+            data = table.to_pandas(
+                types_mapper=pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+            )
+        except FileNotFoundError:
+            return None
+        except (pa.ArrowException, OSError) as e:
+            self.logger.debug(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+        
+        # Parquet returns string nulls as None; cached frames only ever held NaN.
+        # Assign the values back so all-null columns keep the object dtype
+        for col in data.columns[data.dtypes == object]:
+            values = data[col].to_numpy()
+            nulls = pd.isna(values)
+            if nulls.any():
+                values[nulls] = np.nan
+                data[col] = values
+        
+        try:
+            os.utime(cache_path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        
+        self.logger.debug(f"Loaded parsed data from cache {cache_path}")
+        return data
+    
+    def _write_cache(self, cache_path: Path, data: pd.DataFrame) -> None:
+        """
+        Write a parsed DataFrame to the cache if it round-trips exactly.
+        
+        Frames with non-string or duplicate column names, or object columns
+        holding anything other than strings and NaN, are not cached; with a
+        dtype_backend set, neither are frames with object columns or a
+        non-default index.
+        """
+        if not isinstance(data, pd.DataFrame) or not data.columns.is_unique:
+            return
+        if not all(isinstance(col, str) for col in data.columns):
+            return
+        if self.dtype_backend and (not isinstance(data.index, pd.RangeIndex)
+                                   or (data.dtypes == object).any()):
+            return
+        
+        for col in data.columns[data.dtypes == object]:
+            values = data[col]
+            nulls = values.isna()
+            if pd.api.types.infer_dtype(values[~nulls], skipna=False) not in ('string', 'empty'):
+                return
+            if nulls.any() and not all(isinstance(v, float) for v in values[nulls]):
+                return
+        
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.Table.from_pandas(data), tmp_path)
+            os.replace(tmp_path, cache_path)
+        except (pa.ArrowException, OSError, ValueError, TypeError) as e:
+            self.logger.debug(f"Could not cache parsed data: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        
+        self._evict_cache(cache_path)
+    
+    def _evict_cache(self, keep: Path) -> None:
+        """
+        Remove stale cache entries after writing ``keep``.
+        
+        Earlier entries for the same source file are removed, then the
+        least recently used entries until the cache fits in
+        ``processing.cache_max_size_mb``.
+        """
+        source_prefix = keep.name.split('-')[0] + '-'
+        entries = []
+        for entry in self.cache_dir.glob('*.parquet'):
+            if entry == keep:
+                continue
+            try:
+                if entry.name.startswith(source_prefix):
+                    entry.unlink()
+                else:
+                    entry_stat = entry.stat()
+                    entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry))
+            except OSError:
+                continue  # Removed concurrently
+        
+        try:
+            total = keep.stat().st_size + sum(size for _, size, _ in entries)
+        except OSError:
+            return
+        for _, size, entry in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                entry.unlink()
+                total -= size
+            except OSError:
+                pass
+    
+    def clear_cache(self) -> int:
+        """
+        Remove all cached parsed files.
+        
+        Returns:
+            Number of cache files removed
+        """
+        removed = 0
+        if not self.cache_dir.is_dir():
+            return removed
+        
+        for cache_file in self.cache_dir.glob('*.parquet'):
+            try:
+                cache_file.unlink()
+                removed += 1
+            except OSError as e:
+                self.logger.warning(f"Could not remove cache file {cache_file}: {e}")
+        
+        self.logger.info(f"Removed {removed} cached files from {self.cache_dir}")
+        return removed
+    
     def _log_data_info(self, data: pd.DataFrame) -> None:
         """
         Log basic information about loaded data.
@@ -383,22 +1223,42 @@ class DataLoader:
         self.logger.info(f"Data shape: {data.shape}")
         self.logger.info(f"Columns: {list(data.columns)}")
         
-        # Memory usage
-        memory_mb = data.memory_usage(deep=True).sum() / 1024 / 1024
-        self.logger.info(f"Memory usage: {memory_mb:.2f} MB")
+        # Memory usage; a deep scan walks every Python object, so it is only
+        # estimated from a sample when processing.deep_memory_report is set
+        processing = (self.config or {}).get('processing') or {}
+        if not (data.dtypes == object).any():
+            memory_mb = data.memory_usage(deep=False).sum() / 1024 / 1024
+            self.logger.info(f"Memory usage: {memory_mb:.2f} MB")
+        elif processing.get('deep_memory_report'):
+            sample = data.head(_MEMORY_SAMPLE_ROWS)
+            scale = len(data) / max(len(sample), 1)
+            memory_mb = sample.memory_usage(deep=True).sum() * scale / 1024 / 1024
+            self.logger.info(f"Memory usage: {memory_mb:.2f} MB (estimated)")
+        else:
+            memory_mb = data.memory_usage(deep=False).sum() / 1024 / 1024
+            self.logger.info(f"Memory usage: {memory_mb:.2f} MB (shallow, excluding string contents)")
+        
+        arrow_columns = sum(isinstance(dtype, pd.ArrowDtype) for dtype in data.dtypes)
+        if arrow_columns:
+            self.logger.info(f"Arrow-backed columns: {arrow_columns}/{len(data.columns)}")
         
         # Missing values summary
-        missing_counts = data.isnull().sum()
+        missing_counts = data.isna().sum()
         total_missing = missing_counts.sum()
         
         if total_missing > 0:
             self.logger.info(f"Total missing values: {total_missing}")
             
-            # Log columns with missing values
+            # Log the columns with the most missing values
             missing_cols = missing_counts[missing_counts > 0]
-            for col, count in missing_cols.items():
-                percentage = (count / len(data)) * 100
+            top_missing = missing_cols.nlargest(_MISSING_LOG_LIMIT)
+            percentages = top_missing.to_numpy() * (100.0 / len(data))
+            for col, count, percentage in zip(top_missing.index, top_missing.to_numpy(), percentages):
                 self.logger.info(f"  {col}: {count} ({percentage:.1f}%)")
+            if len(missing_cols) > len(top_missing):
+                self.logger.info(
+                    f"  ... and {len(missing_cols) - len(top_missing)} more columns with missing values"
+                )
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
@@ -412,28 +1272,38 @@ class DataLoader:
         """
         path = Path(file_path)
         
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         info = {
             'file_path': str(path.absolute()),
             'file_name': path.name,
-            'file_size': path.stat().st_size,
+            'file_size': stat.st_size,
             'file_extension': path.suffix.lower().lstrip('.'),
-            'modified_time': path.stat().st_mtime
+            'modified_time': stat.st_mtime
         }
         
         # Add format-specific information
         if info['file_extension'] == 'csv':
             # For CSV, try to detect delimiter and encoding
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    first_line = f.readline()
-                    
-                # Simple delimiter detection
+                with open(file_path, 'rb') as f:
+                    sample = f.read(65536)
+                if len(sample) == 65536 and b'\n' in sample:
+                    sample = sample[:sample.rfind(b'\n') + 1]
+                
                 delimiters = [',', ';', '\t', '|']
-                delimiter_counts = {d: first_line.count(d) for d in delimiters}
-                likely_delimiter = max(delimiter_counts, key=delimiter_counts.get)
+                try:
+                    likely_delimiter = csv.Sniffer().sniff(
+                        sample.decode('latin-1'), delimiters=''.join(delimiters)
+                    ).delimiter
+                except csv.Error:
+                    # Fall back to the most frequent candidate byte
+                    counts = np.bincount(np.frombuffer(sample, dtype=np.uint8), minlength=256)
+                    delimiter_counts = {d: int(counts[ord(d)]) for d in delimiters}
+                    likely_delimiter = max(delimiter_counts, key=delimiter_counts.get)
                 
                 info['likely_delimiter'] = likely_delimiter
                 info['encoding'] = self._detect_encoding(file_path)
@@ -444,14 +1314,67 @@ class DataLoader:
         elif info['file_extension'] in ['xlsx', 'xls']:
             # For Excel files, list sheet names
             try:
-                excel_file = pd.ExcelFile(file_path)
-                info['sheet_names'] = excel_file.sheet_names
-                excel_file.close()
-            except Exception:
-                pass
+                info['sheet_names'] = self._xlsx_sheet_names(file_path)
+            except (zipfile.BadZipFile, KeyError, ET.ParseError):
+                # Legacy .xls (or a damaged workbook): let pandas open it
+                try:
+                    excel_file = pd.ExcelFile(file_path, engine=_EXCEL_ENGINE)
+                    info['sheet_names'] = excel_file.sheet_names
+                    excel_file.close()
+                except Exception:
+                    pass
         
         return info
     
+    def _is_jsonl(self, file_path: str) -> bool:
+        """
+        Check whether a JSON file is line-delimited (one object per line).
+        
+        Args:
+            file_path: Path to JSON file
+            
+        Returns:
+            True if the first 4KB hold an object followed by another on the next line
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(4096)
+        
+        return head.lstrip().startswith(b'{') and _JSONL_BOUNDARY_RE.search(head) is not None
+    
+    def _xlsx_sheet_names(self, file_path: str) -> List[str]:
+        """
+        List the worksheet names of an .xlsx workbook from its zip directory.
+        
+        Only xl/workbook.xml and its relationships are read; chart sheets
+        are skipped, as in pd.ExcelFile.sheet_names.
+        
+        Args:
+            file_path: Path to .xlsx file
+            
+        Returns:
+            Worksheet names in workbook order
+            
+        Raises:
+            zipfile.BadZipFile: If the file is not a zip archive (e.g. .xls)
+        """
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open('xl/workbook.xml') as f:
+                sheets = [(element.get('name'),
+                           next((v for k, v in element.attrib.items() if k.endswith('}id')), None))
+                          for _, element in ET.iterparse(f)
+                          if element.tag.endswith('}sheet')]
+            
+            chart_ids = set()
+            try:
+                with archive.open('xl/_rels/workbook.xml.rels') as f:
+                    chart_ids = {element.get('Id') for _, element in ET.iterparse(f)
+                                 if element.tag.endswith('}Relationship')
+                                 and element.get('Type', '').endswith('/chartsheet')}
+            except KeyError:
+                pass
+        
+        return [name for name, rel_id in sheets if rel_id not in chart_ids]
+    
     def preview_data(self, file_path: str, n_rows: int = 5) -> pd.DataFrame:
         """
         Preview first few rows of data without loading entire file.
@@ -467,9 +1390,22 @@ class DataLoader:
         file_extension = path.suffix.lower().lstrip('.')
         
         if file_extension == 'csv':
-            return pd.read_csv(file_path, nrows=n_rows, **self.default_csv_settings)
+            csv_params = {**self.default_csv_settings,
+                          'encoding': self._detect_encoding(file_path)}
+            return pd.read_csv(file_path, nrows=n_rows, **csv_params)
         elif file_extension in ['xlsx', 'xls']:
-            return pd.read_excel(file_path, nrows=n_rows)
+            return pd.read_excel(file_path, nrows=n_rows, engine=_EXCEL_ENGINE)
+        elif file_extension in ['jsonl', 'ndjson'] or (
+                file_extension == 'json' and self._is_jsonl(file_path)):
+            # JSON Lines: parse only the first n_rows lines
+            return pd.read_json(file_path, lines=True, nrows=n_rows)
+        elif file_extension == 'parquet' and pa is not None:
+            # Decode only the first n_rows of the first row group(s)
+            parquet_file = pq.ParquetFile(file_path)
+            types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+            batch = next(parquet_file.iter_batches(batch_size=n_rows),
+                         parquet_file.schema_arrow.empty_table())
+            return batch.to_pandas(types_mapper=types_mapper)
         elif file_extension == 'json':
             # For JSON, load and take first n_rows
             data = self._load_json(file_path)
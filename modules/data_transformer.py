@@ -12,10 +12,127 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 from datetime import datetime, timedelta
 import re
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba เป็นตัวเลือกเสริม ใช้ pandas แทนได้
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # ไม่มี pyarrow ใช้ .str ของ pandas แทน
+    pa = None
+
+# ช่องว่างทุกตัวที่ str.split() และ \s ของ Python รู้จัก เขียนเป็นคลาสสำหรับ RE2
+# (regex ของ Arrow) ซึ่ง \s รู้จักเฉพาะช่องว่าง ASCII
+_SPACE_CLASS = ''.join(f'\\x{{{i:x}}}' for i in range(0x3001) if chr(i).isspace())
+_WORD_PATTERN = f'[^{_SPACE_CLASS}]+'
+_SPECIAL_PATTERN = f'[^a-zA-Z0-9{_SPACE_CLASS}]'
+_DIGIT_PATTERN = r'\p{Nd}'
+
+# จำนวนช่องข้อมูลตัวเลขขั้นต่ำที่คุ้มจะปรับมาตรฐานด้วย numba
+_NUMBA_MIN_CELLS = 100_000
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _zscore(arr, out):
+        """
+        ปรับมาตรฐาน Z-score ทีละคอลัมน์ลงใน out และคืนค่าเบี่ยงเบนมาตรฐานของแต่ละคอลัมน์
+        
+        คำนวณแบบเดียวกับ Series.std() (ddof=1, ข้าม NaN) คือหาค่าเฉลี่ยก่อน
+        แล้วจึงรวมกำลังสองของผลต่าง คอลัมน์ที่มีค่าน้อยกว่า 2 ค่าได้ NaN
+        """
+        n_rows, n_cols = arr.shape
+        stds = np.empty(n_cols, np.float64)
+        for j in prange(n_cols):
+            count = 0
+            total = 0.0
+            for i in range(n_rows):
+                x = arr[i, j]
+                if not np.isnan(x):
+                    count += 1
+                    total += x
+            mean = total / count if count > 0 else np.nan
+            squares = 0.0
+            for i in range(n_rows):
+                x = arr[i, j]
+                if not np.isnan(x):
+                    squares += (x - mean) * (x - mean)
+            std = np.sqrt(squares / (count - 1)) if count > 1 else np.nan
+            stds[j] = std
+            for i in range(n_rows):
+                out[i, j] = (arr[i, j] - mean) / std
+        return stds
+
+
+def _text_arrow(strings: pd.Series) -> Optional[Tuple['pa.Array', bool]]:
+    """
+    แปลง Series ข้อความ (ผลจาก astype(str)) เป็น Arrow string array
+    
+    คืน (array, เป็น ASCII ทั้งหมดหรือไม่) หรือ None เมื่อไม่มี pyarrow หรือมี
+    อักขระนอก BMP (U+10000 ขึ้นไป) ซึ่งตาราง Unicode ของ RE2 กับ Python
+    ต่างกันบางตัว
+    """
+    if pa is None:
+        return None
+    try:
+        arr = pa.array(strings.to_numpy(), type=pa.string())
+    except (pa.ArrowException, UnicodeEncodeError):
+        return None
+    
+    offsets, values = arr.buffers()[1:]
+    if values is None:  # ข้อความว่างทั้งหมด
+        return arr, True
+    size = int(np.frombuffer(offsets, dtype=np.int32)[len(arr)])
+    utf8 = np.frombuffer(values, dtype=np.uint8, count=size)
+    if (utf8 >= 0xF0).any():  # ไบต์นำของลำดับ UTF-8 ยาว 4 ไบต์
+        return None
+    return arr, not (utf8 >= 0x80).any()
+
+
+def _join_non_null(frame: pd.DataFrame, sep: str) -> pd.Series:
+    """
+    ต่อข้อความของทุกคอลัมน์ในแต่ละแถวด้วย sep โดยข้ามค่าว่าง
+    
+    ให้ผลเท่ากับ apply(lambda row: sep.join(row.dropna().astype(str)), axis=1)
+    แต่ทำทีละคอลัมน์แทนทีละแถว
+    """
+    # ใช้ค่าแบบเดียวกับที่ apply ส่งให้แต่ละแถว (dtype ร่วมของทุกคอลัมน์)
+    values = frame.to_numpy()
+    parts = []
+    for j in range(values.shape[1]):
+        column = pd.Series(values[:, j], index=frame.index, dtype=values.dtype)
+        parts.append(column.astype(str).where(column.notna()))
+    
+    # เติม sep หน้าทุกค่าที่ไม่ว่าง ต่อกันด้วย str.cat แล้วตัด sep ตัวแรกออก
+    prefixed = [(sep + part).fillna('') for part in parts]
+    return prefixed[0].str.cat(prefixed[1:]).str[len(sep):]
+
+
+def _add_columns(data: pd.DataFrame,
+                 new_columns: Union[Dict[str, Any], pd.DataFrame]) -> pd.DataFrame:
+    """
+    เพิ่มคอลัมน์ใหม่หลายคอลัมน์ในครั้งเดียวแทนการกำหนดทีละคอลัมน์
+    
+    คอลัมน์ที่มีชื่อซ้ำกับคอลัมน์เดิมจะเขียนทับในตำแหน่งเดิมเหมือน data[name] = ...
+    """
+    if isinstance(new_columns, pd.DataFrame):
+        new_frame = new_columns
+    else:
+        new_frame = pd.DataFrame(new_columns, index=data.index)
+    existing = [name for name in new_frame.columns if name in data.columns]
+    for name in existing:
+        data[name] = new_frame[name]
+    added = new_frame.drop(columns=existing)
+    if not len(added.columns):
+        return data
+    return pd.concat([data, added], axis=1)
+
 
 class DataTransformer:
     """
@@ -83,77 +200,148 @@ class DataTransformer:
         """สร้างฟีเจอร์ใหม่จากข้อมูลที่มีอยู่"""
         self.logger.info("🏗️ สร้างฟีเจอร์ใหม่")
         
+        # แต่ละกลุ่มเก็บคอลัมน์ใหม่ไว้ใน dict แล้วเพิ่มเข้า DataFrame ครั้งเดียว
+        # (ถ้าคอลัมน์ต้นทางถัดไปถูกฟีเจอร์ก่อนหน้าเขียนทับ ให้เพิ่มก่อนเพื่อใช้ค่าใหม่)
         # สร้างฟีเจอร์วันที่
         date_columns = data.select_dtypes(include=['datetime64[ns]']).columns
+        new_columns = {}
         for column in date_columns:
-            self._create_date_features(data, column)
+            if column in new_columns:
+                data, new_columns = _add_columns(data, new_columns), {}
+            new_columns.update(self._create_date_features(data, column))
+        data = _add_columns(data, new_columns)
             
         # สร้างฟีเจอร์ข้อความ
         text_columns = data.select_dtypes(include=['object']).columns
+        new_columns = {}
         for column in text_columns:
-            self._create_text_features(data, column)
+            if column in new_columns:
+                data, new_columns = _add_columns(data, new_columns), {}
+            new_columns.update(self._create_text_features(data, column))
+        data = _add_columns(data, new_columns)
             
         # สร้างฟีเจอร์ตัวเลข
         numeric_columns = data.select_dtypes(include=[np.number]).columns
         if len(numeric_columns) >= 2:
-            self._create_numeric_features(data, numeric_columns)
+            data = _add_columns(data, self._create_numeric_features(data, numeric_columns))
             
         return data
     
-    def _create_date_features(self, data: pd.DataFrame, column: str):
-        """สร้างฟีเจอร์จากคอลัมน์วันที่"""
+    def _create_date_features(self, data: pd.DataFrame, column: str) -> Dict[str, pd.Series]:
+        """สร้างฟีเจอร์จากคอลัมน์วันที่ (คืน dict ของคอลัมน์ใหม่)"""
         base_name = column.replace('_date', '').replace('_time', '')
+        features = {}
+        
+        # แยกวัน/เดือน/ปีจากค่า datetime64 ของ numpy ครั้งเดียว แทนการเรียก .dt ทีละฟีเจอร์
+        values = data[column].to_numpy()
+        missing = np.isnat(values)
+        days = values.astype('datetime64[D]')
+        months = values.astype('datetime64[M]')
+        month = months.astype(np.int64) % 12 + 1
+        weekday = (days.astype(np.int64) + 3) % 7  # 1970-01-01 เป็นวันพฤหัสบดี (3)
+        parts = {
+            'year': values.astype('datetime64[Y]').astype(np.int64) + 1970,
+            'month': month,
+            'day': (days - months.astype('datetime64[D]')).astype(np.int64) + 1,
+            'weekday': weekday,
+            'quarter': (month - 1) // 3 + 1,
+        }
         
-        # แยกส่วนประกอบของวันที่
-        data[f'{base_name}_year'] = data[column].dt.year
-        data[f'{base_name}_month'] = data[column].dt.month
-        data[f'{base_name}_day'] = data[column].dt.day
-        data[f'{base_name}_weekday'] = data[column].dt.weekday
-        data[f'{base_name}_quarter'] = data[column].dt.quarter
+        # แยกส่วนประกอบของวันที่ (int32 เหมือน .dt หรือ float ที่มี NaN เมื่อมีค่าว่าง)
+        for part, result in parts.items():
+            if missing.any():
+                result = np.where(missing, np.nan, result)
+            else:
+                result = result.astype(np.int32)
+            features[f'{base_name}_{part}'] = pd.Series(result, index=data.index)
         
         # สร้างฟีเจอร์เพิ่มเติม
-        data[f'{base_name}_is_weekend'] = data[column].dt.weekday >= 5
-        data[f'{base_name}_days_from_today'] = (datetime.now() - data[column]).dt.days
+        features[f'{base_name}_is_weekend'] = pd.Series((weekday >= 5) & ~missing, index=data.index)
+        
+        # จำนวนวันเต็ม (ปัดลง) จากวันที่ถึงเวลาปัจจุบัน เหมือน Timedelta.days
+        elapsed = np.datetime64(datetime.now(), 'ns') - values
+        days_from_today = elapsed.view(np.int64) // 86_400_000_000_000
+        if missing.any():
+            days_from_today = np.where(missing, np.nan, days_from_today)
+        features[f'{base_name}_days_from_today'] = pd.Series(days_from_today, index=data.index)
         
         self.logger.info(f"📅 สร้างฟีเจอร์วันที่สำหรับคอลัมน์ '{column}'")
+        return features
     
-    def _create_text_features(self, data: pd.DataFrame, column: str):
-        """สร้างฟีเจอร์จากคอลัมน์ข้อความ"""
-        # ความยาวข้อความ
-        data[f'{column}_length'] = data[column].astype(str).str.len()
-        
-        # จำนวนคำ
-        data[f'{column}_word_count'] = data[column].astype(str).str.split().str.len()
-        
-        # มีตัวเลขหรือไม่
-        data[f'{column}_has_numbers'] = data[column].astype(str).str.contains(r'\d', regex=True)
-        
-        # มีอักขระพิเศษหรือไม่
-        data[f'{column}_has_special'] = data[column].astype(str).str.contains(r'[^a-zA-Z0-9\s]', regex=True)
-        
-        # เป็นตัวพิมพ์ใหญ่ทั้งหมดหรือไม่
-        data[f'{column}_is_upper'] = data[column].astype(str).str.isupper()
+    def _create_text_features(self, data: pd.DataFrame, column: str) -> Dict[str, pd.Series]:
+        """สร้างฟีเจอร์จากคอลัมน์ข้อความ (คืน dict ของคอลัมน์ใหม่)"""
+        # แปลงเป็นข้อความครั้งเดียวแล้วใช้ร่วมกันทุกฟีเจอร์
+        strings = data[column].astype(str)
+        text = _text_arrow(strings)
+        features = {}
+        
+        if text is not None:
+            # ใช้ compute kernel ของ Arrow (regex แบบ RE2 สแกนรอบเดียวต่อรูปแบบ)
+            # ซึ่งให้ผลเท่ากับ .str ของ pandas สำหรับอักขระใน BMP
+            arr, ascii_only = text
+            index = data.index
+            features[f'{column}_length'] = pd.Series(
+                pc.utf8_length(arr).to_numpy().astype(np.int64), index=index)
+            features[f'{column}_word_count'] = pd.Series(
+                pc.count_substring_regex(arr, _WORD_PATTERN).to_numpy().astype(np.int64),
+                index=index)
+            features[f'{column}_has_numbers'] = pd.Series(
+                pc.match_substring_regex(arr, _DIGIT_PATTERN).to_numpy(zero_copy_only=False),
+                index=index)
+            features[f'{column}_has_special'] = pd.Series(
+                pc.match_substring_regex(arr, _SPECIAL_PATTERN).to_numpy(zero_copy_only=False),
+                index=index)
+            
+            # ตัวพิมพ์ใหญ่นอก ASCII ใช้กฎของ Python เพราะตารางตัวพิมพ์ของ Arrow ต่างกัน
+            if ascii_only:
+                features[f'{column}_is_upper'] = pd.Series(
+                    pc.ascii_is_upper(arr).to_numpy(zero_copy_only=False), index=index)
+            else:
+                features[f'{column}_is_upper'] = strings.str.isupper()
+        else:
+            # ความยาวข้อความ
+            features[f'{column}_length'] = strings.str.len()
+            
+            # จำนวนคำ
+            features[f'{column}_word_count'] = strings.str.split().str.len()
+            
+            # มีตัวเลขหรือไม่
+            features[f'{column}_has_numbers'] = strings.str.contains(r'\d', regex=True)
+            
+            # มีอักขระพิเศษหรือไม่
+            features[f'{column}_has_special'] = strings.str.contains(r'[^a-zA-Z0-9\s]', regex=True)
+            
+            # เป็นตัวพิมพ์ใหญ่ทั้งหมดหรือไม่
+            features[f'{column}_is_upper'] = strings.str.isupper()
         
         self.logger.info(f"📝 สร้างฟีเจอร์ข้อความสำหรับคอลัมน์ '{column}'")
+        return features
     
-    def _create_numeric_features(self, data: pd.DataFrame, numeric_columns: pd.Index):
-        """สร้างฟีเจอร์จากคอลัมน์ตัวเลข"""
+    def _create_numeric_features(self, data: pd.DataFrame,
+                                 numeric_columns: pd.Index) -> Dict[str, pd.Series]:
+        """สร้างฟีเจอร์จากคอลัมน์ตัวเลข (คืน dict ของคอลัมน์ใหม่)"""
+        features = {}
+        
         # สร้างฟีเจอร์การรวม (Aggregation Features)
         if len(numeric_columns) >= 2:
+            # เลือกคอลัมน์ครั้งเดียวแล้วใช้ร่วมกันทุกฟีเจอร์
+            numeric_data = data[numeric_columns]
+            
             # ผลรวม
-            data['total_sum'] = data[numeric_columns].sum(axis=1)
+            features['total_sum'] = numeric_data.sum(axis=1)
             
             # ค่าเฉลี่ย
-            data['average'] = data[numeric_columns].mean(axis=1)
+            features['average'] = numeric_data.mean(axis=1)
             
             # ค่าสูงสุดและต่ำสุด
-            data['max_value'] = data[numeric_columns].max(axis=1)
-            data['min_value'] = data[numeric_columns].min(axis=1)
+            features['max_value'] = numeric_data.max(axis=1)
+            features['min_value'] = numeric_data.min(axis=1)
             
             # ช่วงค่า (Range)
-            data['value_range'] = data['max_value'] - data['min_value']
+            features['value_range'] = features['max_value'] - features['min_value']
             
             self.logger.info("🔢 สร้างฟีเจอร์การรวมจากคอลัมน์ตัวเลข")
+        return features
     
     def _map_values(self, data: pd.DataFrame) -> pd.DataFrame:
         """แปลงรหัสและค่าต่างๆ"""
@@ -220,9 +408,7 @@ class DataTransformer:
                        for keyword in ['first_name', 'last_name', 'ชื่อ', 'นามสกุล'])]
         
         if len(name_columns) >= 2:
-            data['full_name'] = data[name_columns].apply(
-                lambda row: ' '.join(row.dropna().astype(str)), axis=1
-            )
+            data['full_name'] = _join_non_null(data[name_columns], ' ')
             self.logger.info(f"👤 รวมคอลัมน์ชื่อ: {name_columns}")
         
         # รวมคอลัมน์ที่อยู่ (ถ้ามี)
@@ -230,9 +416,7 @@ class DataTransformer:
                           for keyword in ['address', 'street', 'city', 'province', 'ที่อยู่', 'จังหวัด'])]
         
         if len(address_columns) >= 2:
-            data['full_address'] = data[address_columns].apply(
-                lambda row: ', '.join(row.dropna().astype(str)), axis=1
-            )
+            data['full_address'] = _join_non_null(data[address_columns], ', ')
             self.logger.info(f"🏠 รวมคอลัมน์ที่อยู่: {address_columns}")
         
         # แยกคอลัมน์อีเมล (ถ้ามี domain)
@@ -277,16 +461,32 @@ class DataTransformer:
         numeric_columns = data.select_dtypes(include=[np.number]).columns
         
         # Standardization (Z-score normalization) สำหรับคอลัมน์ตัวเลขที่มีการกระจายปกติ
-        for column in numeric_columns:
-            if column.endswith(('_id', '_code', '_count', '_length')):
-                continue  # ข้ามคอลัมน์ที่ไม่ควร normalize
-                
-            # ตรวจสอบการกระจายของข้อมูล
-            if data[column].std() > 0:  # มีการกระจาย
-                data[f'{column}_normalized'] = (data[column] - data[column].mean()) / data[column].std()
-                self.logger.info(f"📊 ปรับมาตรฐาน Z-score สำหรับคอลัมน์ '{column}'")
-        
-        return data
+        columns = [column for column in numeric_columns
+                   if not column.endswith(('_id', '_code', '_count', '_length'))]  # ข้ามคอลัมน์ที่ไม่ควร normalize
+        
+        # ข้อมูลใหญ่ที่เป็น int/float ของ numpy: คำนวณทุกคอลัมน์พร้อมกันด้วย numba
+        if (njit is not None and len(columns) * len(data) >= _NUMBA_MIN_CELLS
+                and all(data[column].dtype.kind in 'iuf' for column in columns)):
+            values = np.asfortranarray(data[columns].to_numpy(dtype=np.float64))
+            normalized = np.empty_like(values, order='F')
+            keep = _zscore(values, normalized) > 0  # มีการกระจาย
+            standardized = [column for column, kept in zip(columns, keep) if kept]
+            new_columns = pd.DataFrame(normalized[:, keep], index=data.index,
+                                       columns=[f'{column}_normalized' for column in standardized])
+        else:
+            standardized = []
+            new_columns = {}
+            for column in columns:
+                # ตรวจสอบการกระจายของข้อมูล
+                std = data[column].std()
+                if std > 0:  # มีการกระจาย
+                    standardized.append(column)
+                    new_columns[f'{column}_normalized'] = (data[column] - data[column].mean()) / std
+        
+        for column in standardized:
+            self.logger.info(f"📊 ปรับมาตรฐาน Z-score สำหรับคอลัมน์ '{column}'")
+        
+        return _add_columns(data, new_columns)
     
     def create_custom_feature(self, data: pd.DataFrame, feature_name: str, 
                             feature_function: Callable, *args, **kwargs) -> pd.DataFrame:
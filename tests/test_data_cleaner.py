@@ -218,5 +218,25 @@ class TestDataCleaner(unittest.TestCase):
         self.assertIn('actions_performed', summary)
 
 
+class TestHandleMissingData(unittest.TestCase):
+    """ทดสอบการเติมค่าที่ขาดหายไปของ _handle_missing_data"""
+    
+    def setUp(self):
+        """ตั้งค่าเริ่มต้นสำหรับการทดสอบ"""
+        self.cleaner = DataCleaner()
+    
+    def test_all_null_text_column_with_numeric_gaps(self):
+        """คอลัมน์ข้อความที่ว่างทั้งหมดต้องเติม 'Unknown' และยังเติมค่าเฉลี่ยให้คอลัมน์ตัวเลข"""
+        data = pd.DataFrame({
+            'a': pd.Series([None] * 3, dtype=object),
+            'b': [1.0, np.nan, 2.0]
+        })
+        
+        result = self.cleaner._handle_missing_data(data)
+        
+        self.assertEqual(result['a'].tolist(), ['Unknown'] * 3)
+        self.assertEqual(result['b'].tolist(), [1.0, 1.5, 2.0])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -172,5 +172,318 @@ class TestDataLoader(unittest.TestCase):
         self.assertEqual(len(preview), 5)  # Should return all available rows
 
 
+
+class TestIterLoadData(unittest.TestCase):
+    """ทดสอบการโหลดข้อมูลทีละส่วน (iter_load_data)"""
+    
+    def setUp(self):
+        """ตั้งค่าเริ่มต้นสำหรับการทดสอบ"""
+        self.loader = DataLoader({})
+        self.temp_dir = tempfile.mkdtemp()
+        self.sample_data = pd.DataFrame({
+            'id': range(10),
+            'name': [f'name_{i}' for i in range(10)],
+            'score': [i * 1.5 for i in range(10)]
+        })
+    
+    def tearDown(self):
+        """ทำความสะอาดหลังการทดสอบ"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def assert_chunks(self, chunks, sizes):
+        """ตรวจขนาดของแต่ละส่วนและข้อมูลเมื่อรวมกลับ"""
+        self.assertEqual([len(chunk) for chunk in chunks], sizes)
+        combined = pd.concat(chunks, ignore_index=True)
+        pd.testing.assert_frame_equal(combined, self.sample_data, check_dtype=False)
+    
+    def test_iter_csv_chunks(self):
+        """ทดสอบการอ่าน CSV ทีละส่วน"""
+        csv_path = os.path.join(self.temp_dir, 'chunks.csv')
+        self.sample_data.to_csv(csv_path, index=False)
+        
+        chunks = list(self.loader.iter_load_data(csv_path, chunksize=4))
+        
+        self.assert_chunks(chunks, [4, 4, 2])
+    
+    def test_iter_parquet_batches(self):
+        """ทดสอบการอ่าน Parquet ทีละ batch"""
+        parquet_path = os.path.join(self.temp_dir, 'chunks.parquet')
+        self.sample_data.to_parquet(parquet_path, index=False)
+        
+        chunks = list(self.loader.iter_load_data(parquet_path, chunksize=4))
+        
+        self.assert_chunks(chunks, [4, 4, 2])
+    
+    def test_iter_jsonl_chunks(self):
+        """ทดสอบการอ่าน JSON Lines ทีละส่วน"""
+        jsonl_path = os.path.join(self.temp_dir, 'chunks.jsonl')
+        self.sample_data.to_json(jsonl_path, orient='records', lines=True)
+        
+        chunks = list(self.loader.iter_load_data(jsonl_path, chunksize=4))
+        
+        self.assert_chunks(chunks, [4, 4, 2])
+    
+    def test_iter_default_chunksize_from_config(self):
+        """ทดสอบขนาดส่วนเริ่มต้นจาก processing.chunk_size"""
+        csv_path = os.path.join(self.temp_dir, 'config.csv')
+        self.sample_data.to_csv(csv_path, index=False)
+        loader = DataLoader({'processing': {'chunk_size': 3}})
+        
+        chunks = list(loader.iter_load_data(csv_path))
+        
+        self.assert_chunks(chunks, [3, 3, 3, 1])
+    
+    def test_iter_unstreamable_format_yields_one_frame(self):
+        """ทดสอบรูปแบบที่อ่านทีละส่วนไม่ได้ (JSON ปกติ) ได้ DataFrame เดียว"""
+        json_path = os.path.join(self.temp_dir, 'whole.json')
+        self.sample_data.to_json(json_path, orient='records')
+        
+        chunks = list(self.loader.iter_load_data(json_path, chunksize=4))
+        
+        self.assert_chunks(chunks, [10])
+    
+    def test_iter_missing_file(self):
+        """ทดสอบไฟล์ที่ไม่มีอยู่"""
+        with self.assertRaises(FileNotFoundError):
+            next(self.loader.iter_load_data(os.path.join(self.temp_dir, 'missing.csv')))
+
+
+
+class TestLoadDataset(unittest.TestCase):
+    """ทดสอบการโหลดหลายไฟล์เป็นชุดข้อมูลเดียว (load_dataset)"""
+    
+    def setUp(self):
+        """สร้างไฟล์ Parquet แยกเป็นหลายส่วน"""
+        self.loader = DataLoader({})
+        self.temp_dir = tempfile.mkdtemp()
+        self.parts = [
+            pd.DataFrame({'id': [1, 2], 'age': [25, 35], 'city': ['BKK', 'CNX']}),
+            pd.DataFrame({'id': [3, 4], 'age': [45, 28], 'city': ['HKT', 'BKK']}),
+        ]
+        self.paths = []
+        for i, part in enumerate(self.parts):
+            path = os.path.join(self.temp_dir, f'part_{i}.parquet')
+            part.to_parquet(path, index=False)
+            self.paths.append(path)
+    
+    def tearDown(self):
+        """ทำความสะอาดหลังการทดสอบ"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_load_directory(self):
+        """ทดสอบการโหลดทั้งโฟลเดอร์ (ผ่าน load_data ได้ด้วย)"""
+        expected = pd.concat(self.parts, ignore_index=True)
+        
+        result = self.loader.load_dataset(self.temp_dir)
+        
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(self.loader.load_data(self.temp_dir), expected)
+    
+    def test_load_glob_and_list(self):
+        """ทดสอบการโหลดจากรูปแบบ glob และรายการไฟล์"""
+        pattern = os.path.join(self.temp_dir, 'part_*.parquet')
+        
+        from_glob = self.loader.load_dataset(pattern)
+        from_list = self.loader.load_dataset(self.paths[::-1])
+        
+        self.assertEqual(from_glob['id'].tolist(), [1, 2, 3, 4])
+        self.assertEqual(from_list['id'].tolist(), [3, 4, 1, 2])
+    
+    def test_column_pruning(self):
+        """ทดสอบการอ่านเฉพาะคอลัมน์ที่ต้องการ"""
+        result = self.loader.load_dataset(self.temp_dir, columns=['id', 'city'])
+        
+        self.assertEqual(list(result.columns), ['id', 'city'])
+        self.assertEqual(len(result), 4)
+    
+    def test_dnf_filters(self):
+        """ทดสอบการกรองแถวด้วยรูปแบบ DNF"""
+        result = self.loader.load_dataset(
+            self.temp_dir, filters=[('age', '>', 30), ('city', '!=', 'HKT')]
+        )
+        
+        self.assertEqual(result['id'].tolist(), [2])
+    
+    def test_hive_partitions(self):
+        """ทดสอบโฟลเดอร์แบบ hive (year=2024/) ที่กลายเป็นคอลัมน์"""
+        root = os.path.join(self.temp_dir, 'hive')
+        for year, part in zip([2023, 2024], self.parts):
+            os.makedirs(os.path.join(root, f'year={year}'))
+            part.to_parquet(os.path.join(root, f'year={year}', 'data.parquet'), index=False)
+        
+        result = self.loader.load_dataset(root, filters=[('year', '=', 2024)])
+        
+        self.assertEqual(result['id'].tolist(), [3, 4])
+        self.assertEqual(result['year'].tolist(), [2024, 2024])
+    
+    def test_no_files(self):
+        """ทดสอบกรณีไม่พบไฟล์"""
+        with self.assertRaises(FileNotFoundError):
+            self.loader.load_dataset(os.path.join(self.temp_dir, 'missing_*.parquet'))
+
+
+
+class TestArrowCsvReader(unittest.TestCase):
+    """ทดสอบเงื่อนไขที่ตัวอ่าน CSV ของ Arrow ส่งต่อให้ pandas"""
+    
+    def setUp(self):
+        """ตั้งค่าเริ่มต้นสำหรับการทดสอบ"""
+        self.loader = DataLoader({})
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """ทำความสะอาดหลังการทดสอบ"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def write_csv(self, name, content):
+        """เขียนไฟล์ CSV ทดสอบ"""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+    
+    def read_arrow(self, path, **kwargs):
+        """อ่านด้วย Arrow โดยใช้ค่าเริ่มต้นเดียวกับ _load_csv"""
+        return self.loader._read_csv_arrow(
+            path, {**self.loader.default_csv_settings, **kwargs})
+    
+    def assert_same_as_pandas(self, path):
+        """ผลของ load_data ต้องเท่ากับ pd.read_csv"""
+        expected = pd.read_csv(path, **self.loader.default_csv_settings)
+        pd.testing.assert_frame_equal(self.loader.load_data(path), expected)
+    
+    def test_plain_file_uses_arrow(self):
+        """ทดสอบไฟล์ทั่วไปอ่านด้วย Arrow ได้ผลเท่ากับ pandas"""
+        path = self.write_csv('plain.csv', 'id,name,score,day\n1,a,1.5,2024-01-01\n2,,NA,2024-01-02\n')
+        
+        self.assertIsNotNone(self.read_arrow(path))
+        self.assert_same_as_pandas(path)
+    
+    def test_prefixed_and_long_numbers_fall_back(self):
+        """ทดสอบเลขฐานสิบหก เครื่องหมาย + และจำนวนเต็มเกิน 64 บิต ใช้ pandas"""
+        contents = {
+            'hex.csv': 'code\n0x1F\n2\n',
+            'plus.csv': 'n\n5\n+5\n',
+            'uint64.csv': 'id\n18446744073709551615\n1\n',
+        }
+        for name, content in contents.items():
+            with self.subTest(name=name):
+                path = self.write_csv(name, content)
+                self.assertIsNone(self.read_arrow(path))
+                self.assert_same_as_pandas(path)
+    
+    def test_single_column_whitespace_lines_fall_back(self):
+        """ทดสอบไฟล์คอลัมน์เดียวที่มีบรรทัดช่องว่างล้วน (pandas ข้ามบรรทัดเหล่านี้)"""
+        contents = {
+            'spaces.csv': 'name\nAnn\n  \nBob\n',
+            'tab.csv': 'name\nAnn\n\t\nBob\n',
+            'numbers.csv': 'n\n1\n \n2\n',
+        }
+        for name, content in contents.items():
+            with self.subTest(name=name):
+                path = self.write_csv(name, content)
+                self.assertIsNone(self.read_arrow(path))
+                self.assert_same_as_pandas(path)
+    
+    def test_unsupported_input_falls_back(self):
+        """ทดสอบตัวเลือกหรือรูปแบบไฟล์ที่ Arrow จำลองไม่ได้"""
+        plain = self.write_csv('opts.csv', 'a,b\n1,2\n')
+        ragged = self.write_csv('ragged.csv', 'a,b\n1,2,3\n')
+        duplicate = self.write_csv('dup.csv', 'a,a\n1,2\n')
+        
+        self.assertIsNone(self.read_arrow(plain, parse_dates=['a']))
+        self.assertIsNone(self.read_arrow(ragged))
+        self.assertIsNone(self.read_arrow(duplicate))
+    
+    def test_c_engine_config(self):
+        """ทดสอบ processing.csv_engine: c ปิดการใช้ Arrow"""
+        path = self.write_csv('engine.csv', 'a,b\n1,2\n')
+        loader = DataLoader({'processing': {'csv_engine': 'c'}})
+        
+        self.assertIsNone(loader._read_csv_arrow(path, dict(loader.default_csv_settings)))
+    
+    def test_usecols_matches_pandas(self):
+        """ทดสอบ usecols (ชื่อหรือตำแหน่ง) ได้คอลัมน์ตามลำดับในไฟล์เหมือน pandas"""
+        path = self.write_csv('usecols.csv', 'a,b,c\n1,x,2.5\n2,y,3.5\n')
+        
+        for usecols in (['c', 'a'], [2, 0]):
+            with self.subTest(usecols=usecols):
+                expected = pd.read_csv(path, usecols=usecols)
+                result = self.read_arrow(path, usecols=usecols)
+                self.assertIsNotNone(result)
+                pd.testing.assert_frame_equal(result, expected)
+        self.assertIsNone(self.read_arrow(path, usecols=['missing']))
+
+
+
+class TestParsedFileCache(unittest.TestCase):
+    """ทดสอบแคชไฟล์ที่แปลงแล้ว (Parquet)"""
+    
+    def setUp(self):
+        """ตั้งค่าเริ่มต้นสำหรับการทดสอบ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.loader = DataLoader({'processing': {'cache_enabled': True,
+                                                 'cache_dir': self.cache_dir}})
+        self.csv_path = os.path.join(self.temp_dir, 'data.csv')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write('id,name,empty\n1,a,\n2,,\n')
+    
+    def tearDown(self):
+        """ทำความสะอาดหลังการทดสอบ"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def cache_files(self):
+        """รายชื่อไฟล์ในแคช"""
+        return sorted(Path(self.cache_dir).glob('*.parquet'))
+    
+    def test_cache_is_opt_in(self):
+        """ทดสอบแคชปิดอยู่เมื่อไม่ได้ตั้งค่า"""
+        self.assertFalse(DataLoader({}).cache_enabled)
+    
+    def test_cached_load_round_trips(self):
+        """ทดสอบการโหลดซ้ำจากแคชได้ข้อมูลเท่าเดิม"""
+        first = self.loader.load_data(self.csv_path)
+        self.assertEqual(len(self.cache_files()), 1)
+        
+        second = self.loader.load_data(self.csv_path)
+        
+        pd.testing.assert_frame_equal(second, first)
+    
+    def test_all_null_object_column_round_trips(self):
+        """ทดสอบคอลัมน์ object ที่ว่างทั้งหมดยังเป็น object หลังอ่านจากแคช"""
+        data = pd.DataFrame({'a': [np.nan, np.nan], 'b': ['x', np.nan]}, dtype=object)
+        cache_path = Path(self.cache_dir) / 'frame.parquet'
+        
+        self.loader._write_cache(cache_path, data)
+        
+        pd.testing.assert_frame_equal(self.loader._read_cache(cache_path), data)
+    
+    def test_edited_file_replaces_entry(self):
+        """ทดสอบแก้ไขไฟล์แล้วแคชเก่าของไฟล์เดียวกันถูกลบ"""
+        self.loader.load_data(self.csv_path)
+        old_entries = self.cache_files()
+        with open(self.csv_path, 'a', encoding='utf-8') as f:
+            f.write('3,c,\n')
+        
+        result = self.loader.load_data(self.csv_path)
+        
+        self.assertEqual(len(result), 3)
+        self.assertEqual(len(self.cache_files()), 1)
+        self.assertNotEqual(self.cache_files(), old_entries)
+    
+    def test_clear_cache(self):
+        """ทดสอบการล้างแคช"""
+        self.loader.load_data(self.csv_path)
+        
+        self.assertEqual(self.loader.clear_cache(), 1)
+        self.assertEqual(self.cache_files(), [])
+        self.assertEqual(self.loader.clear_cache(), 0)
+
+
 if __name__ == '__main__':
     unittest.main()